@@ -0,0 +1,492 @@
+# AIRISS OpenAI 클라이언트 공용 모듈
+# API 키별 장수명 클라이언트 재사용 (keep-alive HTTP 연결 풀), 디스크 응답 캐시, 재시도/서킷 브레이커
+# 대시보드 분석 작업과 main.py 피드백 재생성이 함께 사용
+# AIRISS_AI_BASE_URL로 OpenAI 호환 서버(ai_stub_server.py 등)에 연결 가능
+# 파일명: ai_client.py
+
+import os
+import time
+import json
+import random
+import sqlite3
+import hashlib
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+OPENAI_DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
+
+def client_endpoint(client):
+    """클라이언트가 실제로 호출하는 base URL (AIRISS_AI_BASE_URL, OPENAI_BASE_URL 반영), 기본 OpenAI면 None"""
+    base_url = getattr(client, "base_url", None)
+    if base_url is None:
+        return None
+    base_url = str(base_url).rstrip("/")
+    return None if base_url == OPENAI_DEFAULT_BASE_URL else base_url
+
+
+class OpenAIClientRegistry:
+    """API 키별 OpenAI 클라이언트 레지스트리 - 연결 풀 한도, keep-alive, 유휴 클라이언트 정리"""
+
+    def __init__(self, max_connections: int = 20, max_keepalive_connections: int = 10,
+                 keepalive_expiry: float = 60.0, idle_timeout: float = 600.0, timeout: float = 60.0,
+                 base_url: str = None):
+        self.base_url = base_url or None  # None이면 SDK 기본값 (OPENAI_BASE_URL 또는 api.openai.com)
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+        self._clients = {}  # key -> [client, last_used]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "OpenAIClientRegistry":
+        """AIRISS_AI_MAX_CONNECTIONS / AIRISS_AI_KEEPALIVE / AIRISS_AI_KEEPALIVE_EXPIRY / AIRISS_AI_CLIENT_IDLE / AIRISS_AI_TIMEOUT / AIRISS_AI_BASE_URL"""
+        return cls(
+            max_connections=int(os.environ.get("AIRISS_AI_MAX_CONNECTIONS", 20)),
+            max_keepalive_connections=int(os.environ.get("AIRISS_AI_KEEPALIVE", 10)),
+            keepalive_expiry=float(os.environ.get("AIRISS_AI_KEEPALIVE_EXPIRY", 60)),
+            idle_timeout=float(os.environ.get("AIRISS_AI_CLIENT_IDLE", 600)),
+            timeout=float(os.environ.get("AIRISS_AI_TIMEOUT", 60)),
+            base_url=os.environ.get("AIRISS_AI_BASE_URL"),
+        )
+
+    def _limits(self):
+        import httpx
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @staticmethod
+    def _key_id(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+    def _lookup(self, key: tuple, factory):
+        """등록된 클라이언트 반환 (없으면 생성), 유휴 시간이 지난 클라이언트는 꺼내 반환"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, (_, last_used) in self._clients.items()
+                       if k != key and now - last_used > self.idle_timeout]
+            expired_clients = [self._clients.pop(k)[0] for k in expired]
+            self.evicted += len(expired_clients)
+
+            entry = self._clients.get(key)
+            if entry is None:
+                entry = self._clients[key] = [factory(), now]
+                self.created += 1
+            else:
+                entry[1] = now
+                self.reused += 1
+            return entry[0], expired_clients
+
+    def get_async(self, api_key: str):
+        """이벤트 루프에서 사용할 AsyncOpenAI (루프별로 연결 풀이 묶이므로 루프마다 1개, 재시도는 ResilientCaller가 담당)"""
+        import openai
+        loop = asyncio.get_running_loop()
+
+        def factory():
+            http_client = openai.DefaultAsyncHttpxClient(limits=self._limits(), timeout=self.timeout)
+            return openai.AsyncOpenAI(api_key=api_key, base_url=self.base_url, http_client=http_client, max_retries=0)
+
+        client, expired = self._lookup(("async", self._key_id(api_key), id(loop)), factory)
+        for stale in expired:
+            self._close(stale, loop)
+        return client
+
+    def get_sync(self, api_key: str):
+        """동기 스크립트(main.py 등)에서 사용할 OpenAI"""
+        import openai
+
+        def factory():
+            http_client = openai.DefaultHttpxClient(limits=self._limits(), timeout=self.timeout)
+            return openai.OpenAI(api_key=api_key, base_url=self.base_url, http_client=http_client, max_retries=0)
+
+        client, expired = self._lookup(("sync", self._key_id(api_key), None), factory)
+        for stale in expired:
+            self._close(stale)
+        return client
+
+    @staticmethod
+    def _close(client, loop=None):
+        try:
+            result = client.close()
+            if asyncio.iscoroutine(result):
+                if loop is not None and loop.is_running():
+                    loop.create_task(result)
+                else:
+                    result.close()
+        except Exception as e:
+            logger.warning(f"OpenAI 클라이언트 정리 오류: {e}")
+
+    async def aclose(self):
+        """등록된 모든 클라이언트 연결 풀 정리 (앱 종료 시)"""
+        with self._lock:
+            clients = [client for client, _ in self._clients.values()]
+            self._clients.clear()
+        for client in clients:
+            try:
+                result = client.close()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"OpenAI 클라이언트 정리 오류: {e}")
+
+    def close(self):
+        """동기 클라이언트 연결 풀 정리 (스크립트 종료 시)"""
+        with self._lock:
+            keys = [k for k in self._clients if k[0] == "sync"]
+            clients = [self._clients.pop(k)[0] for k in keys]
+        for client in clients:
+            self._close(client)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"clients": len(self._clients), "created": self.created, "reused": self.reused, "evicted": self.evicted,
+                    "base_url": self.base_url}
+
+
+openai_clients = OpenAIClientRegistry.from_env()
+
+
+class LLMResponseCache:
+    """SQLite 기반 LLM 응답 캐시 - (엔드포인트 +) 모델 + 메시지 해시 + max_tokens + temperature 키, 항목 수/용량 한도 초과 시 LRU 삭제"""
+    
+    def __init__(self, path: str, max_entries: int = 20000, max_bytes: int = 200 * 1024 * 1024):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._count = 0  # 항목 수 / 총 크기는 연결 시 1회 집계 후 메모리에서 추적
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._conn = None
+    
+    @classmethod
+    def from_env(cls) -> "LLMResponseCache":
+        """AIRISS_AI_CACHE_PATH (빈 값이면 캐시 비활성) / AIRISS_AI_CACHE_MAX_ENTRIES / AIRISS_AI_CACHE_MAX_MB"""
+        return cls(
+            os.environ.get("AIRISS_AI_CACHE_PATH", "airiss_ai_cache.sqlite3"),
+            max_entries=int(os.environ.get("AIRISS_AI_CACHE_MAX_ENTRIES", 20000)),
+            max_bytes=int(float(os.environ.get("AIRISS_AI_CACHE_MAX_MB", 200)) * 1024 * 1024),
+        )
+    
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path) and self.max_entries > 0
+    
+    @staticmethod
+    def make_key(model: str, messages: list, max_tokens: int, temperature: float, endpoint: str = None) -> str:
+        """endpoint(기본 OpenAI가 아닌 base URL)를 넣어 스텁/프록시 응답이 실제 응답 캐시와 섞이지 않게 함"""
+        messages_hash = hashlib.sha256(
+            json.dumps(messages, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        key = f"{model}|{max_tokens}|{temperature}|{messages_hash}"
+        return f"{endpoint}|{key}" if endpoint else key
+    
+    def _connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, model TEXT, content TEXT, tokens INTEGER,"
+                " size INTEGER, created REAL, last_used REAL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses(last_used)")
+            self._refresh_totals(self._conn)
+        return self._conn
+    
+    def _refresh_totals(self, conn):
+        self._count, self._bytes = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+    
+    def get(self, key: str):
+        """캐시된 (응답 텍스트, 토큰 수) 또는 None"""
+        if not self.enabled:
+            return None
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute("SELECT content, tokens FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+                self.hits += 1
+                return row[0], row[1]
+        except sqlite3.Error as e:
+            logger.warning(f"AI 응답 캐시 조회 오류: {e}")
+            return None
+    
+    def put(self, key: str, model: str, content: str, tokens: int):
+        """응답 저장 후 한도를 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        if not self.enabled:
+            return
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        try:
+            with self._lock:
+                conn = self._connection()
+                previous = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, content, tokens, size, created, last_used) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, model, content, tokens, size, now, now),
+                )
+                if previous is None:
+                    self._count += 1
+                else:
+                    self._bytes -= previous[0]
+                self._bytes += size
+                self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"AI 응답 캐시 저장 오류: {e}")
+    
+    def _evict(self, conn):
+        if self._count <= self.max_entries and self._bytes <= self.max_bytes:
+            return
+        # 한도를 넘었을 때만 실제 값으로 다시 집계 (main.py 등 다른 프로세스가 같은 파일에 쓴 몫 반영)
+        self._refresh_totals(conn)
+        count, total = self._count, self._bytes
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        # 오래 사용하지 않은 순으로 한도의 90%까지 삭제 (매 저장마다 정리하지 않도록 여유를 둠)
+        target_entries = int(self.max_entries * 0.9)
+        target_bytes = int(self.max_bytes * 0.9)
+        stale = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+            if count - len(stale) <= target_entries and total <= target_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+        self._count, self._bytes = count - len(stale), total
+    
+    def stats(self) -> dict:
+        stats = {"hits": self.hits, "misses": self.misses, "path": self.path}
+        if self.enabled:
+            try:
+                with self._lock:
+                    self._connection()
+                    stats["entries"], stats["bytes"] = self._count, self._bytes
+            except sqlite3.Error:
+                pass
+        return stats
+    
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+llm_response_cache = LLMResponseCache.from_env()
+
+
+# 🆕 재시도 / 서킷 브레이커 공용 호출 계층
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+FATAL_STATUS = {401, 403}
+FATAL_ERROR_CODES = {"insufficient_quota", "invalid_api_key", "billing_hard_limit_reached", "account_deactivated"}
+
+
+class CircuitOpenError(RuntimeError):
+    """서킷이 열려 있어 호출하지 않음 (같은 API 키의 키/한도 오류 직후)"""
+
+
+def error_code(exc) -> str:
+    code = getattr(exc, "code", None)
+    if not code:
+        body = getattr(exc, "body", None)
+        if isinstance(body, dict):
+            code = body.get("code") or (body.get("error") or {}).get("code")
+    return str(code) if code else ""
+
+
+def classify_ai_error(exc) -> str:
+    """'retryable'(429, 5xx, 타임아웃/연결 오류), 'fatal'(잘못된 키/권한, 사용량 한도 - 키 전체 중단)
+    또는 'failed'(400/404/422 등 그 요청만의 실패 - 재시도하지 않고 서킷에도 반영하지 않음)"""
+    if isinstance(exc, CircuitOpenError):
+        return "fatal"
+    if error_code(exc) in FATAL_ERROR_CODES:
+        return "fatal"
+    status = getattr(exc, "status_code", None)
+    if status is not None:
+        if status in RETRYABLE_STATUS or status >= 500:
+            return "retryable"
+        return "fatal" if status in FATAL_STATUS else "failed"
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return "retryable"
+    # 상태 코드가 없는 SDK 오류는 연결/타임아웃 계열 (APIConnectionError, APITimeoutError)
+    name = type(exc).__name__
+    if "Timeout" in name or "Connection" in name:
+        return "retryable"
+    return "failed"
+
+
+def retry_after_seconds(exc):
+    """응답의 Retry-After(초 또는 retry-after-ms) 헤더 값, 없으면 None"""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+class CircuitBreaker:
+    """키/한도 오류(401/403, FATAL_ERROR_CODES)가 나면 열리고, 일정 시간 뒤 시험 호출 1건으로 복구 여부 확인
+    
+    429/5xx/타임아웃은 호출별 백오프 재시도로 처리하며 서킷을 열지 않는다 (동시 호출들이 실패 수를 공유해
+    일시적인 한도 초과만으로 대기 중인 모든 직원이 즉시 실패하지 않도록).
+    """
+    
+    def __init__(self, reset_timeout: float = 30.0):
+        self.reset_timeout = reset_timeout
+        self.opened_at = None
+        self.reason = ""
+        self.trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if time.monotonic() - self.opened_at >= self.reset_timeout else "open"
+    
+    def before_call(self):
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return
+            if state == "half_open" and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return
+            raise CircuitOpenError(f"AI 호출 일시 중단 (서킷 열림): {self.reason}")
+    
+    def record_success(self):
+        with self._lock:
+            self.opened_at = None
+            self.trial_in_flight = False
+    
+    def release_trial(self):
+        """서킷 상태에 영향 없는 결과(재시도 대상 오류, 요청 자체의 실패, 취소)로 끝난 시험 호출 자리 반환"""
+        with self._lock:
+            self.trial_in_flight = False
+    
+    def record_fatal(self, exc):
+        """키/한도 오류 - 서킷을 열고 reset_timeout 동안 같은 키의 호출을 보내지 않음"""
+        with self._lock:
+            self.trial_in_flight = False
+            self.opened_at = time.monotonic()
+            self.reason = f"{type(exc).__name__}: {exc}"[:200]
+
+
+class ResilientCaller:
+    """지수 백오프 + 지터 재시도(Retry-After 우선), API 키별 서킷 브레이커 (키/한도 오류 전용)"""
+    
+    def __init__(self, max_attempts: int = 4, base_delay: float = 1.0, max_delay: float = 30.0,
+                 reset_timeout: float = 30.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.reset_timeout = reset_timeout
+        self.retries = 0
+        self._breakers = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_env(cls) -> "ResilientCaller":
+        """AIRISS_AI_MAX_ATTEMPTS / AIRISS_AI_BACKOFF_BASE / AIRISS_AI_BACKOFF_MAX / AIRISS_AI_BREAKER_RESET"""
+        return cls(
+            max_attempts=int(os.environ.get("AIRISS_AI_MAX_ATTEMPTS", 4)),
+            base_delay=float(os.environ.get("AIRISS_AI_BACKOFF_BASE", 1.0)),
+            max_delay=float(os.environ.get("AIRISS_AI_BACKOFF_MAX", 30.0)),
+            reset_timeout=float(os.environ.get("AIRISS_AI_BREAKER_RESET", 30.0)),
+        )
+    
+    def breaker(self, api_key: str) -> CircuitBreaker:
+        key = hashlib.sha256(api_key.encode()).hexdigest()
+        with self._lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(self.reset_timeout)
+            return self._breakers[key]
+    
+    def backoff(self, attempt: int, exc) -> float:
+        """attempt번째 실패 후 대기 시간 - Retry-After가 있으면 그 값, 없으면 full jitter 지수 백오프"""
+        retry_after = retry_after_seconds(exc)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+    
+    def _next_delay(self, breaker: CircuitBreaker, attempt: int, exc):
+        """실패 기록 후 재시도 대기 시간 반환, 재시도하지 않을 오류면 None"""
+        kind = classify_ai_error(exc)
+        if isinstance(exc, CircuitOpenError):
+            return None
+        if kind == "fatal":
+            breaker.record_fatal(exc)
+            return None
+        # 잘못된 요청(이 호출만의 실패)과 429/5xx/타임아웃은 서킷에 반영하지 않음 - 다른 직원의 호출은 계속
+        breaker.release_trial()
+        if kind == "failed" or attempt + 1 >= self.max_attempts:
+            return None
+        self.retries += 1
+        delay = self.backoff(attempt, exc)
+        logger.warning(f"AI 호출 재시도 {attempt + 1}/{self.max_attempts - 1}: {delay:.1f}초 후 ({type(exc).__name__})")
+        return delay
+    
+    async def call_async(self, api_key: str, func):
+        """func()이 반환하는 코루틴을 재시도 정책에 따라 실행"""
+        breaker = self.breaker(api_key)
+        for attempt in range(self.max_attempts):
+            breaker.before_call()
+            try:
+                result = await func()
+            except Exception as exc:
+                delay = self._next_delay(breaker, attempt, exc)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            except BaseException:
+                # 취소된 시험 호출이 half-open 자리를 영구히 잡고 있지 않도록 반환
+                breaker.release_trial()
+                raise
+            else:
+                breaker.record_success()
+                return result
+    
+    def call_sync(self, api_key: str, func):
+        """동기 스크립트용 - func()을 재시도 정책에 따라 실행"""
+        breaker = self.breaker(api_key)
+        for attempt in range(self.max_attempts):
+            breaker.before_call()
+            try:
+                result = func()
+            except Exception as exc:
+                delay = self._next_delay(breaker, attempt, exc)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            except BaseException:
+                breaker.release_trial()
+                raise
+            else:
+                breaker.record_success()
+                return result
+
+
+ai_resilience = ResilientCaller.from_env()
@@ -0,0 +1,398 @@
+# AIRISS 로컬 OpenAI 호환 스텁 서버 (오프라인 AI 경로 부하 테스트용)
+# /v1/chat/completions 대역 - 지연 분포, 429 주입 비율, 토큰 사용량, [장점]/[개선점]/[종합 피드백] 고정 응답, 스트리밍
+# 대시보드(AIRISSAnalyzer)와 main.py는 AIRISS_AI_BASE_URL=http://127.0.0.1:8001/v1 로 연결
+# 실행 예: python ai_stub_server.py --port 8001 --latency-ms 800 --latency-dist lognormal --error-rate 0.05 --seed 42
+# 반복 측정 시 AIRISS_AI_CACHE_PATH= (빈 값)로 응답 캐시를 끄면 매번 스텁까지 호출됨
+# 파일명: ai_stub_server.py
+
+import os
+import re
+import json
+import time
+import uuid
+import random
+import asyncio
+import argparse
+import threading
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+import uvicorn
+
+CANNED_FEEDBACK = [
+    """[장점]
+1. 맡은 업무를 기한 내에 꼼꼼하게 마무리하며 산출물의 완성도가 높습니다 (업무성과)
+2. 목표 대비 실적을 꾸준히 관리하여 핵심 지표를 안정적으로 달성합니다 (KPI달성)
+3. 동료의 요청에 적극적으로 응하며 팀 분위기를 긍정적으로 이끕니다 (리더십협업)
+
+[개선점]
+1. 의견을 전달할 때 근거와 결론을 먼저 제시하는 연습이 필요합니다 (커뮤니케이션)
+2. 새로운 업무 방식이나 도구를 먼저 제안하는 시도가 더 필요합니다 (창의혁신)
+3. 직무 관련 자격과 교육을 계획적으로 이수할 필요가 있습니다 (전문성학습)
+
+[종합 피드백]
+직원 {uid}은 성실함과 높은 업무 완성도를 바탕으로 팀의 목표 달성에 꾸준히 기여하고 있습니다. 이 강점을 살려 향후 6개월 동안 주간 업무 공유에서 결론 중심 보고를 실천하고, 분기마다 개선 아이디어 1건 이상을 제안해 보시기 바랍니다. 직무 교육 계획을 세워 전문성을 넓히면 OK금융그룹의 핵심 인재로 성장할 수 있을 것입니다.""",
+    """[장점]
+1. 고객과 동료의 입장을 먼저 듣고 명확하게 정리하는 소통 능력이 뛰어납니다 (커뮤니케이션)
+2. 어려운 과제에도 책임감 있게 끝까지 몰입하는 태도를 보입니다 (태도마인드)
+3. 변화하는 조직 방침을 빠르게 이해하고 업무에 반영합니다 (조직적응)
+
+[개선점]
+1. 일정이 겹칠 때 우선순위를 정하는 기준을 명확히 할 필요가 있습니다 (업무성과)
+2. 성과 지표를 수치로 점검하는 습관을 강화해야 합니다 (KPI달성)
+3. 후배 육성과 업무 위임 경험을 늘릴 필요가 있습니다 (리더십협업)
+
+[종합 피드백]
+직원 {uid}은 뛰어난 소통 능력과 책임감으로 주변의 신뢰를 얻고 있습니다. 앞으로는 월간 목표를 수치로 정리해 점검하고, 업무 우선순위 기준을 팀과 공유하여 일정 관리의 예측 가능성을 높이시기 바랍니다. 후배와 함께하는 과제를 맡아 위임과 코칭을 경험하면 협업 리더로 한 단계 성장할 수 있습니다.""",
+    """[장점]
+1. 업무 지식이 깊고 새로운 내용을 빠르게 학습하여 적용합니다 (전문성학습)
+2. 기존 프로세스의 비효율을 찾아 개선안을 제시합니다 (창의혁신)
+3. 맡은 지표를 스스로 관리하며 목표를 초과 달성한 경험이 있습니다 (KPI달성)
+
+[개선점]
+1. 개선안을 실행할 때 관련 부서와 사전 조율을 강화해야 합니다 (리더십협업)
+2. 전문 용어를 줄이고 상대 눈높이에 맞춘 설명이 필요합니다 (커뮤니케이션)
+3. 반복 업무에서도 점검 절차를 지켜 실수를 줄일 필요가 있습니다 (업무성과)
+
+[종합 피드백]
+직원 {uid}은 높은 전문성과 개선 지향적인 태도로 조직의 효율을 높이는 데 기여하고 있습니다. 향후 6개월 동안은 개선 과제를 추진할 때 이해관계자 회의를 먼저 열어 합의를 만들고, 보고 자료에는 핵심 요약을 쉬운 말로 덧붙여 보시기 바랍니다. 점검 목록을 활용해 반복 업무의 정확도를 높이면 신뢰받는 전문가로 자리 잡을 것입니다.""",
+]
+
+UID_PATTERNS = [
+    re.compile(r"직원 (\S+?)의 평가 의견"),  # 대시보드 단일 직원 프롬프트
+    re.compile(r"【직원 ID】: (\S+)"),  # main.py 재생성 프롬프트
+]
+BATCH_UID_PATTERN = re.compile(r"^\[직원 (.+?)\]$", re.M)  # 대시보드 다중 직원 프롬프트
+
+
+def count_tokens(text: str) -> int:
+    """대시보드 estimate_tokens와 같은 근사 - 한글 음절 약 1토큰, 그 외 약 4자당 1토큰"""
+    hangul = sum(1 for ch in text if '가' <= ch <= '힣')
+    return hangul + (len(text) - hangul) // 4 + 1
+
+
+class StubConfig:
+    """스텁 동작 설정 - 지연 분포, 429 주입, 동시 처리 한도, 스트리밍 조각 크기"""
+
+    LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+    def __init__(self, latency_ms: float = 800.0, latency_dist: str = "lognormal", latency_spread: float = 0.5,
+                 error_rate: float = 0.0, retry_after: float = 1.0, max_inflight: int = 0,
+                 stream_chunk_chars: int = 16, max_output_tokens: int = 4096, seed: int = None):
+        if latency_dist not in self.LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"지원하지 않는 지연 분포: {latency_dist} (가능: {', '.join(self.LATENCY_DISTRIBUTIONS)})")
+        self.latency_ms = latency_ms
+        self.latency_dist = latency_dist
+        self.latency_spread = latency_spread
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.max_inflight = max_inflight
+        self.stream_chunk_chars = max(1, stream_chunk_chars)
+        self.max_output_tokens = max_output_tokens
+        self.seed = seed
+
+    @classmethod
+    def from_env(cls) -> "StubConfig":
+        """AIRISS_STUB_LATENCY_MS / _LATENCY_DIST / _LATENCY_SPREAD / _ERROR_RATE / _RETRY_AFTER / _MAX_INFLIGHT / _CHUNK_CHARS / _MAX_OUTPUT_TOKENS / _SEED"""
+        seed = os.environ.get("AIRISS_STUB_SEED")
+        return cls(
+            latency_ms=float(os.environ.get("AIRISS_STUB_LATENCY_MS", 800)),
+            latency_dist=os.environ.get("AIRISS_STUB_LATENCY_DIST", "lognormal"),
+            latency_spread=float(os.environ.get("AIRISS_STUB_LATENCY_SPREAD", 0.5)),
+            error_rate=float(os.environ.get("AIRISS_STUB_ERROR_RATE", 0)),
+            retry_after=float(os.environ.get("AIRISS_STUB_RETRY_AFTER", 1)),
+            max_inflight=int(os.environ.get("AIRISS_STUB_MAX_INFLIGHT", 0)),
+            stream_chunk_chars=int(os.environ.get("AIRISS_STUB_CHUNK_CHARS", 16)),
+            max_output_tokens=int(os.environ.get("AIRISS_STUB_MAX_OUTPUT_TOKENS", 4096)),
+            seed=int(seed) if seed else None,
+        )
+
+    def as_dict(self) -> dict:
+        return dict(vars(self))
+
+
+class StubServer:
+    """OpenAI 호환 채팅 완성 스텁 - 시드 고정 난수로 지연/429를 재현 가능하게 생성하고 호출 통계 집계"""
+
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """통계와 난수 시드 초기화 (같은 시드면 같은 순서의 지연/429 재현)"""
+        with self._lock:
+            self._random = random.Random(self.config.seed)
+            self.requests = 0
+            self.completed = 0
+            self.rate_limited = 0
+            self.rejected = 0
+            self.streamed = 0
+            self.inflight = 0
+            self.max_inflight_seen = 0
+            self.prompt_tokens = 0
+            self.completion_tokens = 0
+            self.latencies = []
+            self.started = time.time()
+
+    def sample_latency(self) -> float:
+        """설정된 분포에서 응답 지연(초) 추출 - spread는 uniform/normal은 평균 대비 비율, lognormal은 sigma"""
+        mean = self.config.latency_ms
+        spread = self.config.latency_spread
+        with self._lock:
+            if self.config.latency_dist == "fixed":
+                value = mean
+            elif self.config.latency_dist == "uniform":
+                value = self._random.uniform(mean * (1 - spread), mean * (1 + spread))
+            elif self.config.latency_dist == "normal":
+                value = self._random.gauss(mean, mean * spread)
+            else:
+                # 중앙값이 latency_ms인 로그정규 - 실제 API처럼 긴 꼬리
+                value = mean * self._random.lognormvariate(0.0, spread)
+        return max(0.0, value) / 1000.0
+
+    def reject(self):
+        with self._lock:
+            self.requests += 1
+            self.rejected += 1
+
+    def admit(self) -> str:
+        """요청 접수 - 429로 거절할 이유(주입/동시 처리 한도 초과)가 있으면 사유, 아니면 None"""
+        with self._lock:
+            self.requests += 1
+            if self.config.max_inflight and self.inflight >= self.config.max_inflight:
+                self.rate_limited += 1
+                return "동시 처리 한도 초과"
+            if self._random.random() < self.config.error_rate:
+                self.rate_limited += 1
+                return "429 주입"
+            self.inflight += 1
+            self.max_inflight_seen = max(self.max_inflight_seen, self.inflight)
+            return None
+
+    def finish(self, latency: float, prompt_tokens: int, completion_tokens: int, streamed: bool):
+        with self._lock:
+            self.inflight -= 1
+            self.completed += 1
+            self.streamed += int(streamed)
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+            self.latencies.append(latency)
+
+    def release(self):
+        """응답 도중 연결이 끊긴 요청 정리"""
+        with self._lock:
+            self.inflight -= 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            latencies = sorted(self.latencies)
+            elapsed = time.time() - self.started
+
+        def percentile(p):
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000, 1)
+
+        return {
+            "config": self.config.as_dict(),
+            "requests": self.requests,
+            "completed": self.completed,
+            "rate_limited": self.rate_limited,
+            "rejected": self.rejected,
+            "streamed": self.streamed,
+            "inflight": self.inflight,
+            "max_inflight_seen": self.max_inflight_seen,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "latency_ms": {"p50": percentile(50), "p90": percentile(90), "p99": percentile(99),
+                           "max": round(latencies[-1] * 1000, 1) if latencies else 0.0},
+            "elapsed_sec": round(elapsed, 2),
+            "completed_per_sec": round(self.completed / elapsed, 2) if elapsed > 0 else 0.0,
+        }
+
+
+def canned_response(prompt: str) -> str:
+    """프롬프트에 맞는 고정 응답 - 다중 직원 프롬프트는 UID별 JSON 배열, 그 외는 [장점]/[개선점]/[종합 피드백] 형식"""
+    batch_uids = BATCH_UID_PATTERN.findall(prompt) if "JSON 배열" in prompt else []
+    if batch_uids:
+        items = []
+        for uid in batch_uids:
+            strengths, weaknesses, feedback = split_canned(pick_canned(uid).format(uid=uid))
+            items.append({"uid": uid, "strengths": strengths, "weaknesses": weaknesses, "feedback": feedback})
+        return json.dumps(items, ensure_ascii=False, indent=2)
+
+    uid = "미상"
+    for pattern in UID_PATTERNS:
+        match = pattern.search(prompt)
+        if match:
+            uid = match.group(1)
+            break
+    return pick_canned(uid).format(uid=uid)
+
+
+def pick_canned(uid: str) -> str:
+    """UID마다 항상 같은 템플릿 (실행마다 응답이 바뀌지 않도록 해시 대신 문자 합 사용)"""
+    return CANNED_FEEDBACK[sum(map(ord, uid)) % len(CANNED_FEEDBACK)]
+
+
+def split_canned(text: str) -> tuple:
+    _, rest = text.split("[장점]", 1)
+    strengths, rest = rest.split("[개선점]", 1)
+    weaknesses, feedback = rest.split("[종합 피드백]", 1)
+    return strengths.strip(), weaknesses.strip(), feedback.strip()
+
+
+def rate_limit_response(reason: str, retry_after: float) -> JSONResponse:
+    """OpenAI와 같은 형식의 429 오류 (Retry-After 헤더 포함)"""
+    return JSONResponse(
+        status_code=429,
+        headers={"retry-after": f"{retry_after:g}"},
+        content={"error": {"message": f"Rate limit reached (stub: {reason})", "type": "requests",
+                           "param": None, "code": "rate_limit_exceeded"}},
+    )
+
+
+def bad_request_response(message: str, param: str) -> JSONResponse:
+    """OpenAI와 같은 형식의 400 오류 (잘못된 요청 - 재시도 대상 아님)"""
+    return JSONResponse(
+        status_code=400,
+        content={"error": {"message": message, "type": "invalid_request_error", "param": param, "code": None}},
+    )
+
+
+def create_app(config: StubConfig = None) -> FastAPI:
+    """스텁 FastAPI 앱 생성"""
+    stub = StubServer(config or StubConfig.from_env())
+    stub_app = FastAPI(title="AIRISS OpenAI Stub")
+    stub_app.state.stub = stub
+
+    @stub_app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        max_tokens = body.get("max_tokens")
+        if max_tokens and max_tokens > stub.config.max_output_tokens:
+            # 실제 API처럼 모델 응답 상한을 넘는 max_tokens는 400
+            stub.reject()
+            return bad_request_response(
+                f"max_tokens is too large: {max_tokens}. This model supports at most "
+                f"{stub.config.max_output_tokens} completion tokens, whereas you provided {max_tokens}.",
+                "max_tokens",
+            )
+        reason = stub.admit()
+        if reason:
+            return rate_limit_response(reason, stub.config.retry_after)
+
+        messages = body.get("messages", [])
+        model = body.get("model", "gpt-3.5-turbo")
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        content = canned_response(messages[-1].get("content", "") if messages else "")
+        prompt_tokens = count_tokens(prompt)
+        completion_tokens = count_tokens(content)
+        finish_reason = "stop"
+        if max_tokens and completion_tokens > max_tokens:
+            # 실제 API처럼 max_tokens에서 잘라 finish_reason=length
+            content = content[:max(1, len(content) * max_tokens // completion_tokens)]
+            completion_tokens = count_tokens(content)
+            finish_reason = "length"
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                 "total_tokens": prompt_tokens + completion_tokens}
+        completion_id = f"chatcmpl-stub-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        latency = stub.sample_latency()
+
+        if not body.get("stream"):
+            try:
+                await asyncio.sleep(latency)
+            except asyncio.CancelledError:
+                stub.release()
+                raise
+            stub.finish(latency, prompt_tokens, completion_tokens, streamed=False)
+            return {
+                "id": completion_id, "object": "chat.completion", "created": created, "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                             "finish_reason": finish_reason}],
+                "usage": usage,
+            }
+
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+        size = stub.config.stream_chunk_chars
+        pieces = [content[i:i + size] for i in range(0, len(content), size)]
+
+        def chunk(delta: dict, reason=None, chunk_usage=None, choices=True) -> str:
+            payload = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                       "choices": [{"index": 0, "delta": delta, "finish_reason": reason}] if choices else []}
+            if include_usage:
+                payload["usage"] = chunk_usage
+            return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+        async def events():
+            # 첫 조각까지 지연의 20%, 나머지는 조각마다 균등 분배
+            finished = False
+            try:
+                await asyncio.sleep(latency * 0.2)
+                yield chunk({"role": "assistant", "content": ""})
+                for piece in pieces:
+                    await asyncio.sleep(latency * 0.8 / len(pieces))
+                    yield chunk({"content": piece})
+                yield chunk({}, reason=finish_reason)
+                if include_usage:
+                    yield chunk(None, chunk_usage=usage, choices=False)
+                yield "data: [DONE]\n\n"
+                finished = True
+            finally:
+                if finished:
+                    stub.finish(latency, prompt_tokens, completion_tokens, streamed=True)
+                else:
+                    stub.release()
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @stub_app.get("/v1/models")
+    async def list_models():
+        return {"object": "list", "data": [{"id": name, "object": "model", "owned_by": "airiss-stub"}
+                                           for name in ("gpt-3.5-turbo", "gpt-4", "gpt-4-turbo")]}
+
+    @stub_app.get("/stats")
+    async def get_stats():
+        """호출 수, 429 수, 토큰 합계, 지연 백분위"""
+        return stub.stats()
+
+    @stub_app.post("/stats/reset")
+    async def reset_stats():
+        """측정 구간 시작 - 통계와 난수 시드 초기화"""
+        stub.reset()
+        return stub.stats()
+
+    return stub_app
+
+
+if __name__ == "__main__":
+    defaults = StubConfig.from_env()
+    parser = argparse.ArgumentParser(description="AIRISS 로컬 OpenAI 호환 스텁 서버")
+    parser.add_argument("--host", default=os.environ.get("AIRISS_STUB_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("AIRISS_STUB_PORT", 8001)))
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="평균(lognormal은 중앙값) 응답 지연")
+    parser.add_argument("--latency-dist", choices=StubConfig.LATENCY_DISTRIBUTIONS, default=defaults.latency_dist)
+    parser.add_argument("--latency-spread", type=float, default=defaults.latency_spread,
+                        help="uniform/normal: 평균 대비 비율, lognormal: sigma")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="429를 돌려줄 요청 비율 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=defaults.retry_after, help="429 응답의 Retry-After 초")
+    parser.add_argument("--max-inflight", type=int, default=defaults.max_inflight, help="동시 처리 한도 (초과 시 429, 0=무제한)")
+    parser.add_argument("--chunk-chars", type=int, default=defaults.stream_chunk_chars, help="스트리밍 조각당 글자 수")
+    parser.add_argument("--max-output-tokens", type=int, default=defaults.max_output_tokens,
+                        help="허용하는 max_tokens 상한 (초과 시 400)")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="지연/429 난수 시드 (재현용)")
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency_ms=args.latency_ms, latency_dist=args.latency_dist, latency_spread=args.latency_spread,
+        error_rate=args.error_rate, retry_after=args.retry_after, max_inflight=args.max_inflight,
+        stream_chunk_chars=args.chunk_chars, max_output_tokens=args.max_output_tokens, seed=args.seed,
+    )
+    print(f"🧪 AIRISS OpenAI 스텁 서버: http://{args.host}:{args.port}/v1")
+    print(f"   지연 {config.latency_ms:g}ms ({config.latency_dist}, spread {config.latency_spread:g}), "
+          f"429 비율 {config.error_rate:g}, 동시 한도 {config.max_inflight or '무제한'}, 시드 {config.seed}")
+    print(f"   연결: AIRISS_AI_BASE_URL=http://{args.host}:{args.port}/v1 (API 키는 아무 'sk-' 값)")
+    print(f"   통계: http://{args.host}:{args.port}/stats")
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
@@ -11,7 +11,14 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Union
 import json
 import logging
+import time
 import re
+import hashlib
+import threading
+import bisect
+import weakref
+from collections import OrderedDict
+from types import MappingProxyType
 
 # 필수 라이브러리 체크 및 자동 설치 (기존 코드 그대로 + numpy 추가)
 def check_and_install_requirements():
@@ -57,6 +64,11 @@ import io
 import uuid
 import asyncio
 import uvicorn
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from ai_client import openai_clients, llm_response_cache, ai_resilience, CircuitOpenError, client_endpoint
 
 # 로깅 설정 (그대로 유지)
 logging.basicConfig(level=logging.INFO)
@@ -234,13 +246,72 @@ AIRISS_FRAMEWORK = {
     }
 }
 
+# 🆕 NEW: 조직 내 횟수/건수 분포 (작업 단위로 한 번 정렬)
+class CountDistribution:
+    """횟수/건수를 조직 내 상대 위치(중간 순위 백분위)로 점수화 - 구간은 절대 기준과 같은 30~95점"""
+    
+    MIN_SAMPLES = 5
+    
+    def __init__(self, counts: np.ndarray, low: float = 30.0, high: float = 95.0):
+        counts = np.asarray(counts, dtype=float)
+        self.sorted_counts = np.sort(counts[np.isfinite(counts)])
+        self.low = low
+        self.high = high
+    
+    @property
+    def size(self) -> int:
+        return len(self.sorted_counts)
+    
+    def percentiles(self, counts: np.ndarray) -> np.ndarray:
+        """동점은 중간 순위로 처리한 0~1 백분위 (정렬 배열 이진 탐색, O(log n))"""
+        counts = np.asarray(counts, dtype=float)
+        below = np.searchsorted(self.sorted_counts, counts, side="left")
+        not_above = np.searchsorted(self.sorted_counts, counts, side="right")
+        return (below + not_above) / (2 * self.size)
+    
+    def scores(self, counts: np.ndarray) -> np.ndarray:
+        return self.low + (self.high - self.low) * self.percentiles(counts)
+    
+    def score(self, count: float) -> float:
+        return float(self.scores(np.array([count]))[0])
+    
+    def info(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "median": float(np.median(self.sorted_counts)) if self.size else None,
+            "min": float(self.sorted_counts[0]) if self.size else None,
+            "max": float(self.sorted_counts[-1]) if self.size else None
+        }
+
+COUNT_SCORING_MODES = ("absolute", "relative")
+
+def resolve_count_scoring(requested: Optional[str] = None) -> str:
+    """요청값 > 환경변수(AIRISS_COUNT_SCORING) > "absolute" 순으로 횟수/건수 평가 방식 결정 (그 외 값은 ValueError)"""
+    mode = requested or os.environ.get("AIRISS_COUNT_SCORING", "absolute")
+    if mode not in COUNT_SCORING_MODES:
+        raise ValueError(f"지원하지 않는 횟수 평가 방식입니다: {mode} (absolute 또는 relative)")
+    return mode
+
 # 🆕 NEW: 정량데이터 분석기 추가 (v2.0 코드 그대로)
 class QuantitativeAnalyzer:
     """평가등급, 점수 등 정량데이터 분석 전용 클래스"""
     
+    # 컬럼명 키워드 → (데이터 유형, 정규화 함수) - 위에서부터 먼저 맞는 규칙 적용
+    COLUMN_RULES = [
+        ("score", ['점수', 'score', '평점', 'rating'], "normalize_score", "normalize_score_column"),
+        ("grade", ['등급', 'grade', '평가', 'level'], "convert_grade_to_score", "convert_grade_column"),
+        ("rate", ['달성률', '비율', 'rate', '%', 'percent'], "normalize_percentage", "normalize_percentage_column"),
+        ("count", ['횟수', '건수', 'count', '회', '번'], "normalize_count", "normalize_count_column"),
+    ]
+    
     def __init__(self):
         self.grade_mappings = self.setup_grade_mappings()
+        # 열 단위 변환용: 스칼라 버전과 같은 방식(strip/upper)으로 정규화한 키 → float 점수
+        self.normalized_grade_mappings = {
+            str(grade).strip().upper(): float(score) for grade, score in self.grade_mappings.items()
+        }
         self.score_weights = self.setup_score_weights()
+        self._column_plans = {}
         logger.info("✅ 정량데이터 분석기 초기화 완료")
     
     def setup_grade_mappings(self) -> Dict[str, Dict]:
@@ -284,32 +355,235 @@ class QuantitativeAnalyzer:
             'certificate_score': 0.05    # 자격증/인증 점수
         }
     
-    def extract_quantitative_data(self, row: pd.Series) -> Dict[str, Any]:
-        """행 데이터에서 정량적 요소 추출"""
-        quant_data = {}
-        
-        # 컬럼명에서 정량 데이터 패턴 찾기
-        for col_name, value in row.items():
+    def build_column_plan(self, columns) -> List[Dict[str, Any]]:
+        """컬럼명만 보고 정량 컬럼별 유형/정규화 함수를 한 번에 결정 (업로드 시 1회 계산)"""
+        plan = []
+        for position, col_name in enumerate(columns):
             col_lower = str(col_name).lower()
-            
-            # 점수 관련 컬럼 찾기
-            if any(keyword in col_lower for keyword in ['점수', 'score', '평점', 'rating']):
-                quant_data[f'score_{col_name}'] = self.normalize_score(value)
-            
-            # 등급 관련 컬럼 찾기  
-            elif any(keyword in col_lower for keyword in ['등급', 'grade', '평가', 'level']):
-                quant_data[f'grade_{col_name}'] = self.convert_grade_to_score(value)
-            
-            # 달성률/백분율 관련
-            elif any(keyword in col_lower for keyword in ['달성률', '비율', 'rate', '%', 'percent']):
-                quant_data[f'rate_{col_name}'] = self.normalize_percentage(value)
-            
-            # 횟수/건수 관련
-            elif any(keyword in col_lower for keyword in ['횟수', '건수', 'count', '회', '번']):
-                quant_data[f'count_{col_name}'] = self.normalize_count(value)
-                
+            for kind, keywords, normalizer, column_normalizer in self.COLUMN_RULES:
+                if any(keyword in col_lower for keyword in keywords):
+                    plan.append({
+                        "column": col_name,
+                        "position": position,
+                        "kind": kind,
+                        "key": f'{kind}_{col_name}',
+                        "normalizer": normalizer,
+                        "column_normalizer": column_normalizer
+                    })
+                    break
+        return plan
+    
+    def column_plan(self, columns) -> List[Dict[str, Any]]:
+        """같은 컬럼 구성의 계획은 재사용"""
+        cache_key = tuple(columns)
+        plan = self._column_plans.get(cache_key)
+        if plan is None:
+            plan = self.build_column_plan(cache_key)
+            if len(self._column_plans) >= 64:
+                self._column_plans.clear()
+            self._column_plans[cache_key] = plan
+        return plan
+    
+    def extract_quantitative_data(self, row: pd.Series, plan: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """행 데이터에서 정량적 요소 추출 - 컬럼 계획에 있는 컬럼만 정규화"""
+        if plan is None:
+            plan = self.column_plan(row.index)
+        
+        quant_data = {}
+        for entry in plan:
+            normalizer = getattr(self, entry["normalizer"])
+            if entry.get("distribution") is not None:
+                quant_data[entry["key"]] = normalizer(row.iloc[entry["position"]], entry["distribution"])
+            else:
+                quant_data[entry["key"]] = normalizer(row.iloc[entry["position"]])
         return quant_data
     
+    def extract_quantitative_columns(self, df: pd.DataFrame, plan: Optional[List[Dict[str, Any]]] = None) -> Dict[str, np.ndarray]:
+        """DataFrame 전체에 컬럼 계획을 열 단위로 적용 (키 순서는 extract_quantitative_data와 동일)"""
+        if plan is None:
+            plan = self.column_plan(df.columns)
+        
+        columns = {}
+        for entry in plan:
+            normalizer = getattr(self, entry["column_normalizer"])
+            if entry.get("distribution") is not None:
+                columns[entry["key"]] = normalizer(df.iloc[:, entry["position"]], entry["distribution"])
+            else:
+                columns[entry["key"]] = normalizer(df.iloc[:, entry["position"]])
+        return columns
+    
+    def with_count_distributions(self, plan: List[Dict[str, Any]], df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """작업 데이터의 횟수/건수 분포를 붙인 계획 사본 반환 (조직 상대평가용, 작업당 1회)
+        
+        유효 값이 CountDistribution.MIN_SAMPLES 미만인 컬럼은 기존 절대 기준을 유지한다.
+        """
+        job_plan = []
+        for entry in plan:
+            entry = dict(entry)
+            if entry["kind"] == "count":
+                values = df.iloc[:, entry["position"]].reset_index(drop=True)
+                counts = self._numeric_column(values, ['회', '건', '번'])[~self._missing_mask(values)]
+                distribution = CountDistribution(counts)
+                if distribution.size >= CountDistribution.MIN_SAMPLES:
+                    entry["distribution"] = distribution
+            job_plan.append(entry)
+        return job_plan
+    
+    @staticmethod
+    def _missing_mask(values: pd.Series) -> np.ndarray:
+        """스칼라 버전의 `pd.isna(value) or value == ''` 조건"""
+        missing = values.isna().to_numpy()
+        if not pd.api.types.is_numeric_dtype(values.dtype):
+            missing = missing | (values == '').to_numpy(dtype=bool, na_value=False)
+        return missing
+    
+    @staticmethod
+    def _as_text(values: pd.Series) -> pd.Series:
+        """스칼라 버전의 str(value)와 같은 문자열 Series (nullable 정수 열도 '1.0'이 아닌 '1')"""
+        return values.astype(object).map(str)
+    
+    @staticmethod
+    def _parse_column(text: pd.Series) -> np.ndarray:
+        """문자열 Series를 float()로 변환 (변환 실패는 NaN)
+        
+        pd.to_numeric은 긴 소수 문자열에서 float()와 마지막 자리가 달라질 수 있어,
+        고유값만 float()로 변환해 스칼라 버전과 같은 값을 보장한다.
+        """
+        codes, uniques = pd.factorize(text)
+        parsed = np.full(len(uniques), np.nan)
+        for i, value in enumerate(uniques):
+            try:
+                parsed[i] = float(value)
+            except ValueError:
+                pass
+        return parsed[codes]
+    
+    def _numeric_column(self, values: pd.Series, strip_tokens: List[str]) -> np.ndarray:
+        """`float(str(value).replace(...))`의 열 단위 버전 (변환 실패는 NaN)"""
+        # int/float64 열은 str() 왕복 없이도 float() 결과가 같음
+        if values.dtype.kind in 'iu' or values.dtype == np.float64:
+            return values.to_numpy(dtype=float)
+        
+        text = self._as_text(values)
+        for token in strip_tokens:
+            text = text.str.replace(token, '', regex=False)
+        return self._parse_column(text)
+    
+    def _apply_fallback(self, result: np.ndarray, values: pd.Series, mask: np.ndarray, scalar) -> np.ndarray:
+        """변환 실패/NaN 행만 스칼라 함수로 처리 (경고 로그, 'nan' 문자열 처리 등 기존 동작 유지)
+        
+        스칼라 결과는 str(value)에만 의존하므로 같은 문자열은 한 번만 계산한다.
+        """
+        rows = np.flatnonzero(mask)
+        if len(rows):
+            subset = values.iloc[rows]
+            codes, uniques = pd.factorize(self._as_text(subset))
+            firsts = np.unique(codes, return_index=True)[1]
+            fallback = np.array([scalar(subset.iloc[first]) for first in firsts], dtype=float)
+            result[rows] = fallback[codes]
+        return result
+    
+    def normalize_score_column(self, values: pd.Series) -> np.ndarray:
+        """normalize_score의 열 단위 버전"""
+        values = pd.Series(values).reset_index(drop=True)
+        missing = self._missing_mask(values)
+        score = self._numeric_column(values, ['%', '점'])
+        
+        with np.errstate(invalid='ignore', over='ignore'):
+            result = np.select(
+                [missing, (0 <= score) & (score <= 1), (0 <= score) & (score <= 5),
+                 (0 <= score) & (score <= 10), (0 <= score) & (score <= 100)],
+                [50.0, score * 100, (score - 1) * 25, score * 10, score],
+                default=np.clip(score, 0, 100)
+            )
+        return self._apply_fallback(result, values, np.isnan(score) & ~missing, self.normalize_score)
+    
+    def normalize_percentage_column(self, values: pd.Series) -> np.ndarray:
+        """normalize_percentage의 열 단위 버전"""
+        values = pd.Series(values).reset_index(drop=True)
+        missing = self._missing_mask(values)
+        percent = self._numeric_column(values, ['%', '퍼센트'])
+        
+        with np.errstate(invalid='ignore', over='ignore'):
+            result = np.select(
+                [missing, (0 <= percent) & (percent <= 1), (0 <= percent) & (percent <= 100)],
+                [50.0, percent * 100, percent],
+                default=np.clip(percent, 0, 100)
+            )
+        return self._apply_fallback(result, values, np.isnan(percent) & ~missing, self.normalize_percentage)
+    
+    def normalize_count_column(self, values: pd.Series, distribution: Optional[CountDistribution] = None) -> np.ndarray:
+        """normalize_count의 열 단위 버전 (분포가 있으면 한 번의 searchsorted로 상대 점수)"""
+        values = pd.Series(values).reset_index(drop=True)
+        missing = self._missing_mask(values)
+        count = self._numeric_column(values, ['회', '건', '번'])
+        
+        if distribution is not None:
+            result = np.where(missing, 50.0, distribution.scores(count))
+            return self._apply_fallback(result, values, np.isnan(count) & ~missing,
+                                        lambda value: self.normalize_count(value, distribution))
+        
+        with np.errstate(invalid='ignore', over='ignore'):
+            result = np.select(
+                [missing, count <= 0, count <= 2, count <= 5, count <= 10],
+                [50.0, 30.0, 50.0, 70.0, 85.0],
+                default=95.0
+            )
+        return self._apply_fallback(result, values, np.isnan(count) & ~missing, self.normalize_count)
+    
+    def convert_grade_column(self, values: pd.Series) -> np.ndarray:
+        """convert_grade_to_score의 열 단위 버전
+        
+        고유값만 변환한다: 정규화 매핑 → 0~100 숫자 → 패턴 매칭 순이며, 패턴 매칭까지
+        실패한 등급은 값마다 경고하지 않고 열별로 건수를 모아 한 번만 경고한다.
+        """
+        values = pd.Series(values).reset_index(drop=True)
+        result = np.full(len(values), 50.0)
+        present = np.flatnonzero(~self._missing_mask(values))
+        if not len(present):
+            return result
+        
+        # 숫자 열은 값 자체로, 그 외는 str(value)로 고유값 추출
+        subset = values.iloc[present]
+        if subset.dtype.kind in 'iu' or subset.dtype == np.float64:
+            codes, uniques = pd.factorize(subset)
+            text = self._as_text(pd.Series(uniques))
+        else:
+            codes, uniques = pd.factorize(self._as_text(subset))
+            text = pd.Series(uniques, dtype=object)
+        grade_str = text.str.strip().str.upper()
+        
+        # 1) 등급 매핑
+        scores = grade_str.map(self.normalized_grade_mappings).to_numpy(dtype=float, na_value=np.nan, copy=True)
+        
+        # 2) 0~100 숫자 점수
+        unmapped = np.flatnonzero(np.isnan(scores))
+        numbers = self._parse_column(grade_str.iloc[unmapped])
+        with np.errstate(invalid='ignore'):
+            in_range = (0 <= numbers) & (numbers <= 100)
+        scores[unmapped[in_range]] = numbers[in_range]
+        
+        # 3) 패턴 매칭, 실패 시 기본값 50
+        unknown = []
+        for i in unmapped[~in_range]:
+            score = self.match_grade_pattern(grade_str.iloc[i])
+            if score is None:
+                unknown.append(i)
+                score = 50.0
+            scores[i] = score
+        
+        if unknown:
+            counts = np.bincount(codes, minlength=len(uniques))
+            unknown.sort(key=lambda i: -counts[i])
+            examples = ", ".join(f"{text.iloc[i]}({counts[i]}건)" for i in unknown[:10])
+            logger.warning(
+                f"알 수 없는 등급 형식 - 컬럼 '{values.name}': {len(unknown)}종 {int(counts[unknown].sum())}건, "
+                f"기본값 50 적용 [{examples}{', ...' if len(unknown) > 10 else ''}]"
+            )
+        
+        result[present] = scores[codes]
+        return result
+    
     def convert_grade_to_score(self, grade_value) -> float:
         """등급을 점수로 변환"""
         if pd.isna(grade_value) or grade_value == '':
@@ -334,6 +608,15 @@ class QuantitativeAnalyzer:
             pass
         
         # 패턴 매칭
+        score = self.match_grade_pattern(grade_str)
+        if score is not None:
+            return score
+        
+        logger.warning(f"알 수 없는 등급 형식: {grade_value}, 기본값 50 적용")
+        return 50.0
+    
+    def match_grade_pattern(self, grade_str: str) -> Optional[float]:
+        """등급 문자열에 포함된 평가어로 점수 추정 (해당 없으면 None)"""
         if '우수' in grade_str or 'excellent' in grade_str.lower():
             return 90.0
         elif '양호' in grade_str or 'good' in grade_str.lower():
@@ -342,9 +625,7 @@ class QuantitativeAnalyzer:
             return 60.0
         elif '미흡' in grade_str or 'poor' in grade_str.lower():
             return 45.0
-        
-        logger.warning(f"알 수 없는 등급 형식: {grade_value}, 기본값 50 적용")
-        return 50.0
+        return None
     
     def normalize_score(self, score_value) -> float:
         """점수 값 정규화 (0-100 범위로)"""
@@ -391,7 +672,7 @@ class QuantitativeAnalyzer:
             logger.warning(f"백분율 변환 실패: {percent_value}, 기본값 50 적용")
             return 50.0
     
-    def normalize_count(self, count_value) -> float:
+    def normalize_count(self, count_value, distribution: Optional[CountDistribution] = None) -> float:
         """횟수/건수를 점수로 변환 (상대적 평가)"""
         if pd.isna(count_value) or count_value == '':
             return 50.0
@@ -399,6 +680,10 @@ class QuantitativeAnalyzer:
         try:
             count = float(str(count_value).replace('회', '').replace('건', '').replace('번', ''))
             
+            # 🆕 작업 단위 조직 분포가 있으면 조직 내 상대 위치로 평가
+            if distribution is not None:
+                return distribution.score(count)
+            
             # 임시적으로 로그 스케일 적용 (실제로는 조직 평균과 비교해야 함)
             if count <= 0:
                 return 30.0
@@ -432,14 +717,7 @@ class QuantitativeAnalyzer:
         
         for data_key, score in quant_data.items():
             # 데이터 유형별 가중치 적용
-            if 'grade_' in data_key:
-                weight = 0.4  # 등급 데이터는 높은 가중치
-            elif 'score_' in data_key:
-                weight = 0.3  # 점수 데이터
-            elif 'rate_' in data_key:
-                weight = 0.2  # 비율 데이터
-            else:
-                weight = 0.1  # 기타
+            weight = self.column_weight(data_key)
             
             total_score += score * weight
             total_weight += weight
@@ -476,10 +754,801 @@ class QuantitativeAnalyzer:
             "data_count": data_count
         }
 
+    def column_weight(self, data_key: str) -> float:
+        """정량 항목 키(유형_컬럼명)별 가중치"""
+        if 'grade_' in data_key:
+            return 0.4  # 등급 데이터는 높은 가중치
+        elif 'score_' in data_key:
+            return 0.3  # 점수 데이터
+        elif 'rate_' in data_key:
+            return 0.2  # 비율 데이터
+        else:
+            return 0.1  # 기타
+    
+    def quantitative_matrix(self, columns: Dict[str, np.ndarray]) -> "QuantitativeMatrix":
+        """extract_quantitative_columns 결과를 가중치 벡터와 함께 행렬로 구성"""
+        return QuantitativeMatrix(list(columns), columns, [self.column_weight(key) for key in columns])
+    
+    def calculate_quantitative_scores(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """calculate_quantitative_score의 행렬 버전 - 기여도 없이 점수/신뢰도/품질 배열만 계산"""
+        return self.quantitative_matrix(columns).scores()
+
+def round_array(values: np.ndarray, ndigits: int = 1) -> np.ndarray:
+    """파이썬 round()와 같은 결과를 내는 배열 반올림 (경계값만 round()로 재계산)"""
+    values = np.asarray(values, dtype=float)
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    rounded = np.round(scaled) / scale
+    # x.x5 근처는 부동소수 오차로 np.round와 round()가 갈릴 수 있음
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(value, ndigits) for value in values[near_half].tolist()]
+    return rounded
+
+# 🆕 NEW: 정량 점수 행렬 (직원 × 정량 항목, NaN = 항목 없음)
+class QuantitativeMatrix:
+    """calculate_quantitative_score를 마스크 가중평균으로 일괄 계산 - 기여도는 개별 직원 조회 시에만 계산"""
+    
+    def __init__(self, keys: List[str], columns: Dict[str, np.ndarray], weights: List[float]):
+        self.keys = tuple(keys)
+        self.weights = np.asarray(weights, dtype=float)
+        if self.keys:
+            self.values = np.column_stack([np.asarray(columns[key], dtype=float) for key in self.keys])
+        else:
+            self.values = np.empty((0, 0))
+        self.present = ~np.isnan(self.values)
+    
+    def __len__(self) -> int:
+        return self.values.shape[0]
+    
+    def scores(self) -> Dict[str, np.ndarray]:
+        """행별 정량 점수/신뢰도/데이터 품질/데이터 개수"""
+        n_rows = len(self)
+        total_score = np.zeros(n_rows)
+        total_weight = np.zeros(n_rows)
+        # 스칼라 버전과 같은 덧셈 순서를 유지하려고 항목 순서대로 누적
+        for column, weight in enumerate(self.weights):
+            present = self.present[:, column]
+            total_score += np.where(present, self.values[:, column] * weight, 0.0)
+            total_weight += np.where(present, weight, 0.0)
+        
+        has_weight = total_weight > 0
+        final_score = np.where(has_weight, total_score / np.where(has_weight, total_weight, 1.0), 50.0)
+        confidence = np.where(has_weight, np.minimum(total_weight * 20, 100), 0.0)
+        
+        data_count = self.present.sum(axis=1)
+        data_quality = np.select(
+            [data_count >= 5, data_count >= 3, data_count >= 1],
+            ["높음", "중간", "낮음"],
+            default="없음"
+        ).astype(object)
+        
+        return {
+            "quantitative_score": round_array(final_score),
+            "confidence": round_array(confidence),
+            "data_quality": data_quality,
+            "data_count": data_count
+        }
+    
+    def row_data(self, row: int) -> Dict[str, float]:
+        """한 직원의 정량 항목 점수 (extract_quantitative_data 형식)"""
+        return {
+            key: float(self.values[row, column])
+            for column, key in enumerate(self.keys) if self.present[row, column]
+        }
+    
+    def contributing_factors(self, row: int) -> Dict[str, Dict[str, float]]:
+        """한 직원의 항목별 점수/가중치/기여도"""
+        factors = {}
+        for column, key in enumerate(self.keys):
+            if self.present[row, column]:
+                score = float(self.values[row, column])
+                weight = float(self.weights[column])
+                factors[key] = {
+                    "score": round(score, 1),
+                    "weight": weight,
+                    "contribution": round(score * weight, 1)
+                }
+        return factors
+
+# 🆕 NEW: 점수 계산 핫패스용 프레임워크 인덱스 (영역 순서/가중치 벡터/키워드 번호 범위)
+class FrameworkIndex:
+    """AIRISS_FRAMEWORK를 한 번 컴파일한 불변 인덱스
+    
+    영역 순서는 프레임워크 정의 순서로 고정되고, 가중치는 읽기 전용 NumPy 벡터,
+    키워드는 (영역, 긍정/부정, 키워드) 항목 튜플과 영역별 번호 범위로 보관한다.
+    """
+    
+    def __init__(self, framework: Dict[str, Dict]):
+        self.dimensions = tuple(framework.keys())
+        self.positions = MappingProxyType({dimension: i for i, dimension in enumerate(self.dimensions)})
+        
+        weights = np.array([framework[dimension]["weight"] for dimension in self.dimensions], dtype=float)
+        weights.setflags(write=False)
+        self.weights = weights
+        
+        keywords = []
+        ranges = {}
+        for dimension in self.dimensions:
+            dimension_ranges = {}
+            for polarity in ("positive", "negative"):
+                start = len(keywords)
+                keywords.extend((dimension, polarity, word) for word in framework[dimension]["keywords"][polarity])
+                dimension_ranges[polarity] = (start, len(keywords))
+            ranges[dimension] = MappingProxyType(dimension_ranges)
+        self.keywords = tuple(keywords)
+        self.ranges = MappingProxyType(ranges)
+    
+    def score_matrix(self, dimension_scores: Dict[str, Any]) -> tuple:
+        """영역별 점수(스칼라 또는 배열)를 고정 영역 순서의 (행 x 영역) 행렬과 존재 마스크로 변환"""
+        columns = [np.atleast_1d(np.asarray(dimension_scores[dimension], dtype=float))
+                   if dimension in dimension_scores else None
+                   for dimension in self.dimensions]
+        rows = max((len(column) for column in columns if column is not None), default=1)
+        scores = np.zeros((rows, len(self.dimensions)), dtype=float)
+        present = np.zeros(len(self.dimensions), dtype=bool)
+        for position, column in enumerate(columns):
+            if column is not None:
+                scores[:, position] = column
+                present[position] = True
+        return scores, present
+    
+    def weighted_average(self, scores: np.ndarray, present: np.ndarray = None) -> np.ndarray:
+        """가중 평균 (행렬-벡터 곱) - 기존 합산 순서를 지켜 스칼라 계산과 같은 값 보장"""
+        scores = np.atleast_2d(scores)
+        if present is None:
+            present = np.ones(len(self.dimensions), dtype=bool)
+        
+        # BLAS 내적은 합산 순서가 달라 마지막 자리가 바뀔 수 있으므로 영역 순서대로 누적
+        weighted_sum = np.zeros(scores.shape[0], dtype=float)
+        total_weight = 0.0
+        for position in np.flatnonzero(present):
+            weight = self.weights[position]
+            weighted_sum = weighted_sum + scores[:, position] * weight
+            total_weight = total_weight + float(weight)
+        
+        if total_weight <= 0:
+            return np.full(scores.shape[0], 50.0)
+        return weighted_sum / total_weight
+
+# 🆕 NEW: OK등급 기준표 (텍스트/정량/하이브리드 공통)
+OK_GRADE_THRESHOLDS = [
+    # (하한 점수, 등급, 설명, 백분위)
+    (95, "OK★★★", "최우수 등급 (TOP 1%)", "상위 1%"),
+    (90, "OK★★", "우수 등급 (TOP 5%)", "상위 5%"),
+    (85, "OK★", "우수+ 등급 (TOP 10%)", "상위 10%"),
+    (80, "OK A", "양호 등급 (TOP 20%)", "상위 20%"),
+    (75, "OK B+", "양호- 등급 (TOP 30%)", "상위 30%"),
+    (70, "OK B", "보통 등급 (TOP 40%)", "상위 40%"),
+    (60, "OK C", "개선필요 등급 (TOP 60%)", "상위 60%"),
+    (None, "OK D", "집중개선 등급 (하위 40%)", "하위 40%"),
+]
+
+class GradeTable:
+    """점수 구간 기준표 - 단건은 bisect, 점수 컬럼 전체는 np.searchsorted로 등급 산정"""
+    
+    def __init__(self, thresholds: List[tuple]):
+        # 오름차순으로 뒤집어 i번째 하한을 넘으면 i+1번째 등급
+        rows = list(reversed(thresholds))
+        self.cutoff_list = [cutoff for cutoff, *_ in rows[1:]]
+        self.cutoffs = np.array(self.cutoff_list, dtype=float)
+        self.grades = np.array([grade for _, grade, _, _ in rows], dtype=object)
+        self.descriptions = np.array([description for _, _, description, _ in rows], dtype=object)
+        self.percentiles = np.array([percentile for _, _, _, percentile in rows], dtype=object)
+    
+    def index(self, score: float) -> int:
+        # NaN은 모든 비교가 거짓이므로 기존 if/elif 체인처럼 최하위 등급
+        if score != score:
+            return 0
+        return bisect.bisect_right(self.cutoff_list, score)
+    
+    def indices(self, scores: np.ndarray) -> np.ndarray:
+        scores = np.asarray(scores, dtype=float)
+        positions = np.searchsorted(self.cutoffs, scores, side="right")
+        positions[np.isnan(scores)] = 0
+        return positions
+    
+    def lookup(self, score: float, suffix: str = "") -> Dict[str, str]:
+        """단건 점수의 등급/설명/백분위"""
+        position = self.index(score)
+        return {
+            "grade": self.grades[position],
+            "grade_description": self.descriptions[position] + suffix,
+            "percentile": self.percentiles[position]
+        }
+    
+    def assign(self, scores: np.ndarray, suffix: str = "") -> Dict[str, np.ndarray]:
+        """점수 배열 전체를 한 번의 배열 연산으로 등급 산정"""
+        positions = self.indices(scores)
+        descriptions = self.descriptions + suffix if suffix else self.descriptions
+        return {
+            "grade": self.grades[positions],
+            "grade_description": descriptions[positions],
+            "percentile": self.percentiles[positions]
+        }
+
+OK_GRADE_TABLE = GradeTable(OK_GRADE_THRESHOLDS)
+HYBRID_GRADE_SUFFIX = " - 정량+정성 통합분석"
+
+# 🆕 NEW: 8대 영역 키워드를 한 번에 찾는 단일 패스 매칭 엔진
+class KeywordAutomaton:
+    """AIRISS_FRAMEWORK 전체 키워드를 트라이 정규식 하나로 컴파일한 매칭 엔진
+    
+    텍스트를 한 번만 훑어서 각 위치에서 시작하는 가장 긴 키워드를 찾고,
+    그 키워드의 접두사인 키워드들을 함께 적중 처리한다. 기존 `word in text_lower`
+    부분 매칭과 결과가 완전히 같다.
+    """
+    
+    def __init__(self, index: FrameworkIndex):
+        # (영역, 긍정/부정, 키워드) 항목 번호와 영역별 범위는 프레임워크 인덱스를 그대로 사용
+        self.dimensions = index.dimensions
+        self.entries = index.keywords
+        self.ranges = index.ranges
+        
+        word_ids = {}
+        for entry_id, (_, _, word) in enumerate(self.entries):
+            word_ids.setdefault(word, []).append(entry_id)
+        # 빈 키워드는 기존 부분 매칭에서 항상 참이므로 별도 보관
+        self.always = tuple(word_ids.pop("", ()))
+        
+        # 가장 긴 매칭 키워드 -> 같은 위치에서 함께 매칭되는 모든 항목 번호
+        self.closure = {
+            word: tuple(sorted(
+                entry_id
+                for other, ids in word_ids.items() if word.startswith(other)
+                for entry_id in ids
+            ))
+            for word in word_ids
+        }
+        self.pattern = re.compile(self._build_trie_pattern(word_ids.keys())) if word_ids else None
+        
+        # 문장 분리 - 키워드에 쓰이지 않는 구분자에서만 잘라야 문장별 매칭 합이 전체 매칭과 같음
+        keyword_chars = set("".join(word_ids.keys()))
+        delimiters = [char for char in ".!?\n\r" if char not in keyword_chars]
+        self.sentence_pattern = re.compile("[" + re.escape("".join(delimiters)) + "]+") if delimiters else None
+        self.sentence_joiner = delimiters[0] if delimiters else ""
+        self.strip_sentences = not any(char.isspace() for char in keyword_chars)
+        
+        # 키워드 구성 지문 - 키워드가 바뀌면 캐시 키도 달라짐
+        self.fingerprint = hashlib.sha1(
+            json.dumps(self.entries, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()[:16]
+    
+    @staticmethod
+    def _build_trie_pattern(words) -> str:
+        """키워드 트라이를 탐욕적(가장 긴 매칭 우선) 정규식으로 변환"""
+        trie = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = True
+        
+        def build(node) -> str:
+            is_terminal = "" in node
+            branches = [re.escape(char) + build(child)
+                        for char, child in sorted(node.items()) if char != ""]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            return "(?:" + body + ")?" if is_terminal else body
+        
+        return build(trie)
+    
+    def scan(self, text_lower: str) -> set:
+        """소문자 텍스트에서 등장하는 모든 키워드 항목 번호를 한 번에 수집"""
+        return set(self.always).union(self.scan_many([text_lower])[0])
+    
+    def scan_many(self, texts_lower: List[str]) -> List[set]:
+        """여러 조각을 구분자로 이어 한 번에 스캔하고 조각별 적중 항목 번호를 돌려줌"""
+        found = [set() for _ in texts_lower]
+        if self.pattern is None or not texts_lower:
+            return found
+        
+        joined = self.sentence_joiner.join(texts_lower)
+        starts = []
+        offset = 0
+        for text_lower in texts_lower:
+            starts.append(offset)
+            offset += len(text_lower) + len(self.sentence_joiner)
+        
+        # 각 위치의 가장 긴 키워드만 찾고, 접두사 키워드는 closure로 확장
+        search = self.pattern.search
+        match = search(joined)
+        while match:
+            position = match.start()
+            found[bisect.bisect_right(starts, position) - 1].update(self.closure[match.group()])
+            match = search(joined, position + 1)
+        return found
+    
+    def split_sentences(self, text_lower: str) -> List[str]:
+        """텍스트를 문장 단위로 분리 (키워드가 문장 경계를 넘지 않도록 보장된 구분자 사용)"""
+        if self.sentence_pattern is None:
+            return [text_lower]
+        sentences = self.sentence_pattern.split(text_lower)
+        if self.strip_sentences:
+            sentences = [sentence.strip() for sentence in sentences]
+        return [sentence for sentence in sentences if sentence]
+    
+    def match(self, found) -> Dict[str, Dict[str, List[str]]]:
+        """적중 항목 번호로 영역별 긍정/부정 매칭 키워드 목록 구성 (프레임워크 키워드 순서 유지)"""
+        matches = {}
+        for dimension in self.dimensions:
+            matches[dimension] = {}
+            for polarity in ("positive", "negative"):
+                start, stop = self.ranges[dimension][polarity]
+                matches[dimension][polarity] = [
+                    self.entries[entry_id][2] for entry_id in range(start, stop) if entry_id in found
+                ]
+        return matches
+    
+    def hit_matrix(self, found_sets: List[frozenset]) -> np.ndarray:
+        """텍스트별 키워드 항목 적중 여부 행렬 (행: 텍스트, 열: 키워드 항목)"""
+        hits = np.zeros((len(found_sets), len(self.entries)), dtype=np.uint8)
+        for row, found in enumerate(found_sets):
+            if found:
+                hits[row, list(found)] = 1
+        return hits
+
+# 🆕 NEW: 작업별 키워드 적중 행렬 (직원 × 프레임워크 키워드, 비트 압축 보관)
+class KeywordHitMatrix:
+    """작업 단위 키워드 통계를 행렬 축약으로 계산하기 위한 적중 행렬"""
+    
+    def __init__(self, uids: List[str], hits: np.ndarray, engine: KeywordAutomaton):
+        self.uids = tuple(uids)
+        self.rows = {str(uid).lower(): row for row, uid in reversed(list(enumerate(self.uids)))}
+        self.engine = engine
+        self.n_keywords = hits.shape[1]
+        self.packed = np.packbits(hits.astype(np.uint8, copy=False), axis=1)
+    
+    @property
+    def hits(self) -> np.ndarray:
+        """uint8 (직원 수, 키워드 수) 행렬로 복원"""
+        return self.unpack()
+    
+    @property
+    def nbytes(self) -> int:
+        return self.packed.nbytes
+    
+    def unpack(self, rows=None) -> np.ndarray:
+        """rows(불리언 마스크 또는 행 번호 배열)에 해당하는 직원만 복원, None이면 전체"""
+        packed = self.packed if rows is None else self.packed[np.asarray(rows)]
+        return np.unpackbits(packed, axis=1, count=self.n_keywords)
+    
+    def keyword_counts(self, rows=None, hits: np.ndarray = None) -> np.ndarray:
+        """키워드별 적중 직원 수 (hits: 이미 복원한 행렬이 있으면 재사용)"""
+        if hits is None:
+            hits = self.unpack(rows)
+        return hits.sum(axis=0, dtype=np.int64)
+    
+    def dimension_signals(self, rows=None, hits: np.ndarray = None) -> Dict[str, Dict[str, np.ndarray]]:
+        """직원별 영역 긍정/부정 신호 수"""
+        if hits is None:
+            hits = self.unpack(rows)
+        return {
+            dimension: {
+                polarity: hits[:, slice(*self.engine.ranges[dimension][polarity])].sum(axis=1, dtype=np.int64)
+                for polarity in ("positive", "negative")
+            }
+            for dimension in self.engine.dimensions
+        }
+    
+    def summary(self, top_n: int = 10, rows=None) -> Dict[str, Any]:
+        """영역/극성별 신호 합계, 신호 보유 직원 비율, 상위 키워드 (rows로 점수 구간 등 일부 직원만 집계)"""
+        hits = self.unpack(rows)
+        counts = self.keyword_counts(hits=hits)
+        total = hits.shape[0]
+        dimensions = {}
+        for dimension in self.engine.dimensions:
+            dimensions[dimension] = {}
+            for polarity in ("positive", "negative"):
+                start, stop = self.engine.ranges[dimension][polarity]
+                block = hits[:, start:stop]
+                order = np.argsort(-counts[start:stop], kind="stable")[:top_n]
+                dimensions[dimension][polarity] = {
+                    "total_signals": int(block.sum()),
+                    "employee_rate": round(float(block.any(axis=1).mean()) * 100, 1) if total else 0,
+                    "top_keywords": [
+                        {"keyword": self.engine.entries[start + i][2], "count": int(counts[start + i])}
+                        for i in order if counts[start + i] > 0
+                    ]
+                }
+        return {"total_employees": total, "total_keywords": self.n_keywords, "dimensions": dimensions}
+    
+    def employee_keywords(self, uid: str) -> Optional[Dict[str, Dict[str, List[str]]]]:
+        """직원 한 명의 영역별 긍정/부정 적중 키워드"""
+        row = self.rows.get(str(uid).lower())
+        if row is None:
+            return None
+        found = np.flatnonzero(np.unpackbits(self.packed[row], count=self.n_keywords))
+        return self.engine.match(set(found.tolist()))
+
+# 🆕 NEW: 키워드 분석 결과 캐시 (동일 파일 재업로드/재분석 시 스캔 생략)
+class TextAnalysisCache:
+    """의견 해시 + 프레임워크 지문을 키로 키워드 적중 결과를 보관하는 LRU 캐시"""
+    
+    def __init__(self, maxsize: int = 20000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(text_lower: str, fingerprint: str) -> str:
+        """정규화(소문자)된 의견 내용과 키워드 구성으로 캐시 키 생성"""
+        digest = hashlib.blake2b(text_lower.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{fingerprint}:{digest}"
+    
+    def get(self, key) -> Optional[frozenset]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key, value: frozenset):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total * 100, 1) if total > 0 else 0
+            }
+
+text_analysis_cache = TextAnalysisCache(int(os.environ.get("AIRISS_TEXT_CACHE_SIZE", 20000)))
+# 평가자 문장은 행 안팎에서 반복되므로 문장 단위 적중 결과도 별도 보관
+sentence_hit_cache = TextAnalysisCache(int(os.environ.get("AIRISS_SENTENCE_CACHE_SIZE", 200000)))
+
+def combine_cache_stats(stats_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """여러 프로세스의 캐시 현황 합산 (크기/적중/미적중 합계, 적중률은 합계로 다시 계산)"""
+    combined = {field: sum(stats[field] for stats in stats_list) for field in ("size", "maxsize", "hits", "misses")}
+    total = combined["hits"] + combined["misses"]
+    combined["hit_rate"] = round(combined["hits"] / total * 100, 1) if total > 0 else 0
+    combined["processes"] = len(stats_list)
+    return combined
+
+class WorkerCacheStats:
+    """채점 워커 프로세스별 키워드 캐시 현황 (워커가 청크 결과와 함께 보낸 최신 값)"""
+    
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+    
+    def record(self, pid: int, stats: Dict[str, Dict[str, Any]]):
+        with self._lock:
+            self._stats[pid] = stats
+    
+    def clear(self):
+        """워커 풀을 버리거나 종료하면 해당 프로세스의 캐시도 사라지므로 초기화"""
+        with self._lock:
+            self._stats.clear()
+    
+    def combined(self, name: str, main_stats: Dict[str, Any]) -> Dict[str, Any]:
+        """메인 프로세스 + 워커 프로세스의 name 캐시 합산"""
+        with self._lock:
+            worker_stats = [stats[name] for stats in self._stats.values()]
+        return combine_cache_stats([main_stats] + worker_stats)
+
+worker_cache_stats = WorkerCacheStats()
+
+# 🆕 NEW: 키워드 사전 핫리로드 (YAML 변경 시 백그라운드 컴파일 후 원자적 교체)
+def validate_framework(data: Any) -> Dict[str, Dict]:
+    """YAML에서 읽은 프레임워크 구조 검증 - 잘못된 파일은 반영하지 않음"""
+    if not isinstance(data, dict) or not data:
+        raise ValueError("프레임워크는 영역 이름을 키로 하는 매핑이어야 합니다")
+    
+    for dimension, info in data.items():
+        if not isinstance(info, dict):
+            raise ValueError(f"{dimension}: 영역 정의가 매핑이 아닙니다")
+        keywords = info.get("keywords")
+        if not isinstance(keywords, dict):
+            raise ValueError(f"{dimension}: keywords 항목이 없습니다")
+        for polarity in ("positive", "negative"):
+            words = keywords.get(polarity)
+            if not isinstance(words, list) or not all(isinstance(word, str) for word in words):
+                raise ValueError(f"{dimension}: keywords.{polarity}는 문자열 목록이어야 합니다")
+        weight = info.get("weight")
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight < 0:
+            raise ValueError(f"{dimension}: weight는 0 이상의 숫자여야 합니다")
+    return data
+
+class FrameworkVersion:
+    """컴파일까지 끝난 프레임워크 한 버전 - 작업 시작 시 고정해서 끝까지 사용"""
+    
+    def __init__(self, framework: Dict[str, Dict], version: int, source: str):
+        self.framework = framework
+        self.version = version
+        self.source = source
+        self.index = FrameworkIndex(framework)
+        self.engine = KeywordAutomaton(self.index)
+        self.fingerprint = self.engine.fingerprint
+        self.loaded_at = datetime.now()
+    
+    def info(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "source": self.source,
+            "fingerprint": self.fingerprint,
+            "dimensions": list(self.index.dimensions),
+            "keyword_count": len(self.index.keywords),
+            "loaded_at": self.loaded_at.isoformat()
+        }
+
+class FrameworkRegistry:
+    """키워드 사전 파일을 감시하다가 바뀌면 새 버전을 컴파일해 원자적으로 교체
+    
+    교체는 참조 하나를 바꾸는 것이므로 이미 current()로 버전을 받아간 작업은
+    옛 버전으로 끝까지 진행되고, 이후 시작하는 작업부터 새 버전을 사용한다.
+    """
+    
+    def __init__(self, path: str, builtin: Dict[str, Dict]):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._watcher = None
+        self._current = FrameworkVersion(builtin, 1, "builtin")
+        self.reload()
+    
+    def current(self) -> FrameworkVersion:
+        return self._current
+    
+    def load_file(self) -> Dict[str, Dict]:
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError("PyYAML 모듈이 없어 키워드 사전 파일을 읽을 수 없습니다")
+        
+        with open(self.path, encoding="utf-8") as f:
+            return validate_framework(yaml.safe_load(f))
+    
+    def reload(self, force: bool = False) -> bool:
+        """파일이 바뀌었으면 새 버전으로 교체 (실패 시 기존 버전 유지)"""
+        with self._lock:
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                return False
+            if not force and mtime == self._mtime:
+                return False
+            self._mtime = mtime
+            
+            try:
+                # 파싱/컴파일은 교체 전에 끝내므로 채점 중인 작업은 멈추지 않음
+                compiled = FrameworkVersion(self.load_file(), self._current.version + 1, self.path)
+            except Exception as e:
+                logger.error(f"키워드 사전 리로드 실패 (v{self._current.version} 유지): {e}")
+                return False
+            
+            self._current = compiled
+        
+        logger.info(f"✅ 키워드 사전 v{compiled.version} 적용: {self.path} ({len(compiled.index.keywords)}개 키워드)")
+        return True
+    
+    def start_watching(self, interval: float = 2.0):
+        """백그라운드 스레드에서 파일 변경 감시 시작"""
+        if self._watcher is not None:
+            return
+        
+        def watch():
+            while True:
+                time.sleep(interval)
+                self.reload()
+        
+        self._watcher = threading.Thread(target=watch, name="framework-watcher", daemon=True)
+        self._watcher.start()
+
+framework_registry = FrameworkRegistry(os.environ.get("AIRISS_FRAMEWORK_FILE", "airiss_framework.yaml"), AIRISS_FRAMEWORK)
+
+# 🆕 NEW: AI 호출 토큰 추정 / 분당 요청·토큰 예산 제한
+def estimate_tokens(text: str) -> int:
+    """한글 음절은 약 1토큰, 그 외 문자는 약 4자당 1토큰으로 추정"""
+    hangul = sum(1 for ch in text if '\uac00' <= ch <= '\ud7a3')
+    return hangul + (len(text) - hangul) // 4 + 1
+
+# 🆕 NEW: AI 프롬프트용 평가 의견 압축 (중복 문장 제거 + 토큰 예산)
+OPINION_SUMMARY_MARKER = "하이브리드 분석 결과:"
+OPINION_SENTENCE_SPLIT = re.compile(r'(?<=[.!?。])(?!\d)\s*|\s*\n\s*')
+
+def truncate_to_tokens(text: str, budget: int) -> str:
+    """추정 토큰 수가 예산 이하가 되는 가장 긴 앞부분"""
+    if estimate_tokens(text) <= budget:
+        return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) <= budget:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo]
+
+def compact_opinion(text: str, budget: int) -> str:
+    """평가 의견을 문장 단위로 중복 제거 후 토큰 예산 안으로 압축 - 하이브리드 분석 요약은 예산과 무관하게 항상 유지"""
+    head, marker, summary = str(text).partition(OPINION_SUMMARY_MARKER)
+    summary_lines = [line.strip() for line in summary.split('\n') if line.strip()]
+    head = head.strip()
+    label = ""
+    if head.startswith("평가 의견:"):
+        label, head = "평가 의견: ", head[len("평가 의견:"):].strip()
+    
+    # 같은 문장(공백/끝 문장부호 차이 무시)은 처음 나온 것만 유지 - 평가자 의견이 반복 취합된 경우가 많음
+    seen = set()
+    sentences = []
+    for sentence in OPINION_SENTENCE_SPLIT.split(head):
+        sentence = " ".join(sentence.split())
+        key = sentence.rstrip('.!?。 ')
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        sentences.append(sentence)
+    
+    kept = []
+    used = 0
+    for sentence in sentences:
+        cost = estimate_tokens(sentence)
+        if used + cost > budget:
+            # 남은 예산이 의미 있는 크기면 마지막 문장은 잘라서 포함
+            if budget - used >= 20:
+                kept.append(truncate_to_tokens(sentence, budget - used).rstrip() + "…")
+            break
+        kept.append(sentence)
+        used += cost
+    
+    parts = [label + " ".join(kept)] if kept else []
+    if marker:
+        parts.append("\n".join([marker] + summary_lines))
+    return "\n\n".join(parts)
+
+def resolve_opinion_token_budget() -> int:
+    """AI 프롬프트 평가 의견 토큰 예산 (AIRISS_AI_OPINION_TOKENS, 기본 1000)"""
+    return max(50, int(os.environ.get("AIRISS_AI_OPINION_TOKENS", 1000)))
+
+class TokenBucketLimiter:
+    """분당 요청 수(RPM)와 분당 토큰 수(TPM) 예산을 지키는 토큰 버킷 (0이면 해당 예산 제한 없음)
+    
+    버킷은 모듈 전역으로 공유되므로 여러 이벤트 루프(스레드)에서 쓰일 수 있다. 대기 순서를 지키는
+    asyncio.Lock은 루프마다 따로 만들고, 버킷 잔량 갱신은 threading.Lock으로 보호한다.
+    """
+    
+    def __init__(self, rpm: int = 0, tpm: int = 0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.requests = float(rpm)
+        self.tokens = float(tpm)
+        self.updated = time.monotonic()
+        self.waited = 0.0
+        self._state_lock = threading.Lock()
+        self._loop_locks = weakref.WeakKeyDictionary()
+    
+    def _loop_lock(self) -> asyncio.Lock:
+        """현재 이벤트 루프 전용 대기열 잠금 (asyncio.Lock은 처음 쓰인 루프에 묶임)"""
+        loop = asyncio.get_running_loop()
+        with self._state_lock:
+            lock = self._loop_locks.get(loop)
+            if lock is None:
+                lock = self._loop_locks[loop] = asyncio.Lock()
+            return lock
+    
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        if self.rpm:
+            self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60)
+    
+    async def acquire(self, tokens: int) -> int:
+        """요청 1건과 예상 토큰을 예약 (예산이 찰 때까지 대기, 도착 순서대로), 예약한 토큰 수 반환"""
+        if self.tpm:
+            tokens = min(tokens, self.tpm)  # 버킷보다 큰 요청이 영원히 대기하지 않도록
+        async with self._loop_lock():
+            while True:
+                with self._state_lock:
+                    self._refill()
+                    wait = 0.0
+                    if self.rpm and self.requests < 1:
+                        wait = max(wait, (1 - self.requests) * 60 / self.rpm)
+                    if self.tpm and self.tokens < tokens:
+                        wait = max(wait, (tokens - self.tokens) * 60 / self.tpm)
+                    if wait <= 0:
+                        if self.rpm:
+                            self.requests -= 1
+                        if self.tpm:
+                            self.tokens -= tokens
+                        return tokens
+                    self.waited += wait
+                await asyncio.sleep(wait)
+    
+    def settle(self, reserved: int, used: int):
+        """응답의 실제 사용 토큰으로 예약분 보정 (호출이 실패했으면 used는 실제로 처리된 만큼, 없으면 0 = 전액 환불)"""
+        if self.tpm:
+            with self._state_lock:
+                self._refill()
+                self.tokens = min(self.tpm, self.tokens + reserved - used)
+
+class AIRateLimiters:
+    """API 키/모델별 토큰 버킷 (OpenAI 예산은 조직·모델 단위이므로 작업 간 공유)"""
+    
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._limiters = {}
+    
+    def get(self, api_key: str, model: str) -> TokenBucketLimiter:
+        key = (hashlib.sha256(api_key.encode()).hexdigest(), model)
+        if key not in self._limiters:
+            self._limiters[key] = TokenBucketLimiter(self.rpm, self.tpm)
+        return self._limiters[key]
+
+ai_rate_limiters = AIRateLimiters(int(os.environ.get("AIRISS_AI_RPM", 500)), int(os.environ.get("AIRISS_AI_TPM", 200000)))
+
+def resolve_ai_concurrency(requested: Optional[int] = None) -> int:
+    """요청값 > 환경변수(AIRISS_AI_CONCURRENCY) > 4 순으로 동시 AI 호출 수 결정"""
+    concurrency = requested if requested else int(os.environ.get("AIRISS_AI_CONCURRENCY", 4))
+    return max(1, concurrency)
+
+def resolve_ai_batch_size(requested: Optional[int] = None) -> int:
+    """요청값 > 환경변수(AIRISS_AI_BATCH_SIZE) > 1 순으로 AI 호출 1회당 직원 수 결정"""
+    batch_size = requested if requested else int(os.environ.get("AIRISS_AI_BATCH_SIZE", 1))
+    return max(1, batch_size)
+
+# 🆕 모델별 응답(completion) 토큰 상한 - 다중 직원 호출의 max_tokens가 이를 넘으면 API가 400으로 거절
+MODEL_OUTPUT_TOKEN_LIMITS = {
+    "gpt-3.5-turbo": 4096,
+    "gpt-4": 4096,
+    "gpt-4-turbo": 4096,
+    "gpt-4o": 16384,
+    "gpt-4o-mini": 16384,
+}
+
+def model_output_token_limit(model: str) -> int:
+    """환경변수(AIRISS_AI_MAX_OUTPUT_TOKENS) > 모델별 상한 > 4096"""
+    if os.environ.get("AIRISS_AI_MAX_OUTPUT_TOKENS"):
+        return int(os.environ["AIRISS_AI_MAX_OUTPUT_TOKENS"])
+    return MODEL_OUTPUT_TOKEN_LIMITS.get(model, 4096)
+
+def fit_ai_batch_size(batch_size: int, model: str, max_tokens: int) -> int:
+    """직원당 max_tokens로 모델 응답 상한을 넘지 않는 최대 묶음 크기"""
+    return max(1, min(batch_size, model_output_token_limit(model) // max(1, max_tokens)))
+
 # 기존 AIRISSAnalyzer 클래스 (100% 그대로 유지)
 class AIRISSAnalyzer:
+    # 🆕 단일/다중 직원 프롬프트가 함께 쓰는 시스템 메시지와 8대 영역 설명
+    SYSTEM_PROMPT = "당신은 OK금융그룹의 전문 HR 분석가입니다. AIRISS 8대 영역(업무성과, KPI달성, 태도마인드, 커뮤니케이션, 리더십협업, 전문성학습, 창의혁신, 조직적응)을 기반으로 직원 평가를 분석하고 OK금융그룹 인재상에 맞는 구체적이고 실행 가능한 피드백을 제공합니다."
+    PROMPT_DIMENSIONS = """【AIRISS 8대 영역 (OK금융그룹 가중치)】
+1. 업무성과 (25%) - 업무 산출물의 양과 질
+2. KPI달성 (20%) - 핵심성과지표 달성도  
+3. 태도마인드 (15%) - 업무에 대한 태도와 마인드셋
+4. 커뮤니케이션 (15%) - 의사소통 능력과 스타일
+5. 리더십협업 (10%) - 리더십과 협업 능력
+6. 전문성학습 (8%) - 전문성과 학습능력
+7. 창의혁신 (5%) - 창의성과 혁신 마인드
+8. 조직적응 (2%) - 조직문화 적응도와 윤리성"""
+    
     def __init__(self):
-        self.framework = AIRISS_FRAMEWORK
+        self.frameworks = framework_registry
+        self.text_cache = text_analysis_cache
+        self.sentence_cache = sentence_hit_cache
         self.openai_available = False
         self.openai = None
         try:
@@ -490,26 +1559,128 @@ class AIRISSAnalyzer:
         except ImportError:
             logger.warning("⚠️ OpenAI 모듈 없음 - 키워드 분석만 가능")
     
-    def analyze_text(self, text: str, dimension: str) -> Dict[str, Any]:
+    def resolve_framework(self, framework: Optional[FrameworkVersion] = None) -> FrameworkVersion:
+        """작업에 고정된 프레임워크 버전, 없으면 현재 버전"""
+        return framework if framework is not None else self.frameworks.current()
+    
+    @property
+    def framework(self) -> Dict[str, Dict]:
+        """현재 키워드 사전 정의 (파일이 바뀌면 새 버전, 내장 AIRISS_FRAMEWORK 고정값이 아님)"""
+        return self.frameworks.current().framework
+    
+    @property
+    def framework_index(self) -> FrameworkIndex:
+        return self.frameworks.current().index
+    
+    @property
+    def keyword_engine(self) -> KeywordAutomaton:
+        return self.frameworks.current().engine
+    
+    def analyze_text(self, text: str, dimension: str, framework: Optional[FrameworkVersion] = None) -> Dict[str, Any]:
         """텍스트 분석하여 점수 산출 - 기존 알고리즘 그대로"""
         if not text or text.lower() in ['nan', 'null', '', 'none']:
             return {"score": 50, "confidence": 0, "signals": {"positive": 0, "negative": 0, "positive_words": [], "negative_words": []}}
         
-        keywords = self.framework[dimension]["keywords"]
-        text_lower = text.lower()
-        
-        # 키워드 매칭 - 부분 매칭도 포함
-        positive_matches = []
-        negative_matches = []
+        # 키워드 매칭 - 부분 매칭도 포함 (단일 패스 엔진)
+        framework = self.resolve_framework(framework)
+        matches = framework.engine.match(self.find_keywords(text.lower(), framework))[dimension]
+        return self.score_matches(text, matches["positive"], matches["negative"])
+    
+    def find_keywords(self, text_lower: str, framework: Optional[FrameworkVersion] = None) -> frozenset:
+        """키워드 적중 항목 번호 조회 - 캐시에 없을 때만 텍스트 스캔"""
+        framework = self.resolve_framework(framework)
+        key = self.text_cache.make_key(text_lower, framework.fingerprint)
+        found = self.text_cache.get(key)
+        if found is None:
+            found = self.scan_sentences(text_lower, framework)
+            self.text_cache.put(key, found)
+        return found
+    
+    def scan_sentences(self, text_lower: str, framework: Optional[FrameworkVersion] = None) -> frozenset:
+        """문장별 적중 캐시를 합쳐 의견 전체 적중 항목 계산 - 처음 보는 문장만 스캔"""
+        engine = self.resolve_framework(framework).engine
+        found = set(engine.always)
+        unseen = []
+        for sentence in dict.fromkeys(engine.split_sentences(text_lower)):
+            sentence_hits = self.sentence_cache.get((engine.fingerprint, sentence))
+            if sentence_hits is None:
+                unseen.append(sentence)
+            else:
+                found |= sentence_hits
         
-        for word in keywords["positive"]:
-            if word in text_lower:
-                positive_matches.append(word)
+        for sentence, sentence_hits in zip(unseen, engine.scan_many(unseen)):
+            sentence_hits = frozenset(sentence_hits)
+            self.sentence_cache.put((engine.fingerprint, sentence), sentence_hits)
+            found |= sentence_hits
+        return frozenset(found)
+    
+    def analyze_all(self, text: str, framework: Optional[FrameworkVersion] = None) -> Dict[str, Dict[str, Any]]:
+        """8대 영역 텍스트 분석을 한 번의 키워드 스캔으로 수행"""
+        framework = self.resolve_framework(framework)
+        if not text or text.lower() in ['nan', 'null', '', 'none']:
+            return {dimension: self.analyze_text(text, dimension, framework) for dimension in framework.index.dimensions}
         
-        for word in keywords["negative"]:
-            if word in text_lower:
-                negative_matches.append(word)
+        matches = framework.engine.match(self.find_keywords(text.lower(), framework))
+        return {
+            dimension: self.score_matches(text, matches[dimension]["positive"], matches[dimension]["negative"])
+            for dimension in framework.index.dimensions
+        }
+    
+    def analyze_texts(self, opinions: pd.Series, framework: Optional[FrameworkVersion] = None) -> Dict[str, Dict[str, np.ndarray]]:
+        """의견 Series 전체를 영역별 배열(긍정/부정 신호 수, 점수, 신뢰도)로 일괄 분석
         
+        점수/신뢰도 공식은 analyze_text와 같고, 행 순서는 입력 Series 순서를 따른다.
+        """
+        framework = self.resolve_framework(framework)
+        texts = [str(value) for value in opinions]
+        lowered = [text.lower() for text in texts]
+        lengths = np.fromiter((len(text) for text in texts), dtype=float, count=len(texts))
+        empty = np.array([text_lower in ['nan', 'null', '', 'none'] for text_lower in lowered], dtype=bool)
+        hits = self.hit_rows(lowered, framework)
+        
+        # 길이 보너스/신뢰도는 영역과 무관하므로 한 번만 계산
+        length_bonus = np.where(lengths > 50, np.minimum((lengths - 50) / 100 * 5, 10), 0)
+        length_confidence = np.minimum(lengths / 20, 20)
+        
+        results = {}
+        for dimension in framework.index.dimensions:
+            ranges = framework.index.ranges[dimension]
+            positive = hits[:, slice(*ranges["positive"])].sum(axis=1, dtype=np.int64)
+            negative = hits[:, slice(*ranges["negative"])].sum(axis=1, dtype=np.int64)
+            
+            final_score = 50 + np.minimum(positive * 8, 45) - np.minimum(negative * 10, 40) + length_bonus
+            final_score = np.clip(final_score, 10, 100)
+            confidence = np.minimum(np.minimum((positive + negative) * 12, 80) + length_confidence, 100)
+            
+            results[dimension] = {
+                "positive": positive,
+                "negative": negative,
+                "score": np.where(empty, 50.0, round_array(final_score)),
+                "confidence": np.where(empty, 0.0, round_array(confidence))
+            }
+        return results
+    
+    def hit_rows(self, texts_lower: List[str], framework: Optional[FrameworkVersion] = None) -> np.ndarray:
+        """소문자 의견 목록의 키워드 적중 행렬 (빈 의견 행은 0)"""
+        framework = self.resolve_framework(framework)
+        if not texts_lower:
+            return np.zeros((0, len(framework.engine.entries)), dtype=np.uint8)
+        
+        # 같은 의견은 한 번만 스캔
+        codes, uniques = pd.factorize(pd.Series(texts_lower, dtype=object))
+        hits = framework.engine.hit_matrix([self.find_keywords(text_lower, framework) for text_lower in uniques])[codes]
+        empty = np.array([text_lower in ['nan', 'null', '', 'none'] for text_lower in texts_lower], dtype=bool)
+        hits[empty] = 0
+        return hits
+    
+    def keyword_hit_matrix(self, uids: List[str], opinions: List[str], framework: Optional[FrameworkVersion] = None) -> KeywordHitMatrix:
+        """작업 결과 행 순서대로 직원별 키워드 적중 행렬 구성"""
+        framework = self.resolve_framework(framework)
+        hits = self.hit_rows([str(opinion).lower() for opinion in opinions], framework)
+        return KeywordHitMatrix(uids, hits, framework.engine)
+    
+    def score_matches(self, text: str, positive_matches: List[str], negative_matches: List[str]) -> Dict[str, Any]:
+        """매칭된 키워드로 영역 점수/신뢰도 계산 - 기존 알고리즘 그대로"""
         positive_count = len(positive_matches)
         negative_count = len(negative_matches)
         
@@ -544,62 +1715,31 @@ class AIRISSAnalyzer:
             }
         }
     
-    def calculate_overall_score(self, dimension_scores: Dict[str, float]) -> Dict[str, Any]:
+    def calculate_overall_score(self, dimension_scores: Dict[str, float], framework: Optional[FrameworkVersion] = None) -> Dict[str, Any]:
         """종합 점수 계산 - 기존 알고리즘 그대로"""
-        weighted_sum = 0
-        total_weight = 0
-        
-        for dimension, score in dimension_scores.items():
-            if dimension in self.framework:
-                weight = self.framework[dimension]["weight"]
-                weighted_sum += score * weight
-                total_weight += weight
-        
-        overall_score = weighted_sum / total_weight if total_weight > 0 else 50
-        
-        # 기존 등급 체계 그대로
-        if overall_score >= 95:
-            grade = "OK★★★"
-            grade_desc = "최우수 등급 (TOP 1%)"
-            percentile = "상위 1%"
-        elif overall_score >= 90:
-            grade = "OK★★"
-            grade_desc = "우수 등급 (TOP 5%)"
-            percentile = "상위 5%"
-        elif overall_score >= 85:
-            grade = "OK★"
-            grade_desc = "우수+ 등급 (TOP 10%)"
-            percentile = "상위 10%"
-        elif overall_score >= 80:
-            grade = "OK A"
-            grade_desc = "양호 등급 (TOP 20%)"
-            percentile = "상위 20%"
-        elif overall_score >= 75:
-            grade = "OK B+"
-            grade_desc = "양호- 등급 (TOP 30%)"
-            percentile = "상위 30%"
-        elif overall_score >= 70:
-            grade = "OK B"
-            grade_desc = "보통 등급 (TOP 40%)"
-            percentile = "상위 40%"
-        elif overall_score >= 60:
-            grade = "OK C"
-            grade_desc = "개선필요 등급 (TOP 60%)"
-            percentile = "상위 60%"
-        else:
-            grade = "OK D"
-            grade_desc = "집중개선 등급 (하위 40%)"
-            percentile = "하위 40%"
+        index = self.resolve_framework(framework).index
+        scores, present = index.score_matrix(dimension_scores)
+        overall_score = float(index.weighted_average(scores, present)[0])
+        
+        # 기존 등급 체계 그대로 (공통 기준표)
+        grade_info = OK_GRADE_TABLE.lookup(overall_score)
         
         return {
             "overall_score": round(overall_score, 1),
-            "grade": grade,
-            "grade_description": grade_desc,
-            "percentile": percentile,
+            "grade": grade_info["grade"],
+            "grade_description": grade_info["grade_description"],
+            "percentile": grade_info["percentile"],
             "weighted_scores": dimension_scores
         }
     
-    async def generate_ai_feedback(self, uid: str, opinion: str, api_key: str = None, model: str = "gpt-3.5-turbo", max_tokens: int = 1200) -> Dict[str, Any]:
+    def calculate_overall_scores(self, dimension_scores: Dict[str, np.ndarray], framework: Optional[FrameworkVersion] = None) -> Dict[str, np.ndarray]:
+        """영역별 점수 배열로 전체 행의 종합 점수/등급을 한 번에 계산 (행렬-벡터 곱)"""
+        index = self.resolve_framework(framework).index
+        scores, present = index.score_matrix(dimension_scores)
+        overall_scores = index.weighted_average(scores, present)
+        return {"overall_score": round_array(overall_scores), **OK_GRADE_TABLE.assign(overall_scores)}
+    
+    async def generate_ai_feedback(self, uid: str, opinion: str, api_key: str = None, model: str = "gpt-3.5-turbo", max_tokens: int = 1200, on_delta=None) -> Dict[str, Any]:
         """OpenAI를 사용한 상세 AI 피드백 생성 - 기존 코드 그대로"""
         logger.info(f"AI 피드백 생성 시작: {uid}, API 키 존재: {bool(api_key)}, 모델: {model}")
         
@@ -642,31 +1782,19 @@ class AIRISSAnalyzer:
         start_time = datetime.now()
         
         try:
-            client = self.openai.OpenAI(api_key=api_key.strip())
-            
             prompt = self.create_ok_prompt(uid, opinion, model, max_tokens)
+            messages = [
+                {
+                    "role": "system", 
+                    "content": self.SYSTEM_PROMPT
+                },
+                {
+                    "role": "user", 
+                    "content": prompt
+                }
+            ]
             
-            logger.info(f"OpenAI API 호출 시작: 모델={model}, 토큰={max_tokens}")
-            
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "당신은 OK금융그룹의 전문 HR 분석가입니다. AIRISS 8대 영역(업무성과, KPI달성, 태도마인드, 커뮤니케이션, 리더십협업, 전문성학습, 창의혁신, 조직적응)을 기반으로 직원 평가를 분석하고 OK금융그룹 인재상에 맞는 구체적이고 실행 가능한 피드백을 제공합니다."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                max_tokens=max_tokens,
-                temperature=0.7,
-                timeout=30
-            )
-            
-            feedback_text = response.choices[0].message.content.strip()
-            logger.info(f"OpenAI API 응답 수신 완료: {len(feedback_text)}자")
+            feedback_text, tokens_used, cache_hit = await self.complete_chat(api_key, model, messages, max_tokens, on_delta=on_delta)
             
             strengths, weaknesses, complete_feedback = self.parse_ai_response(feedback_text)
             
@@ -678,7 +1806,8 @@ class AIRISSAnalyzer:
                 "ai_feedback": complete_feedback,
                 "processing_time": round(processing_time, 2),
                 "model_used": model,
-                "tokens_used": response.usage.total_tokens if hasattr(response, 'usage') else max_tokens,
+                "tokens_used": tokens_used,
+                "cache_hit": cache_hit,
                 "error": None
             }
             
@@ -687,7 +1816,9 @@ class AIRISSAnalyzer:
             error_msg = str(e)
             logger.error(f"OpenAI API 오류: {error_msg}")
             
-            if "api_key" in error_msg.lower():
+            if isinstance(e, CircuitOpenError):
+                error_detail = f"같은 API 키의 오류가 반복되어 호출을 일시 중단했습니다. ({error_msg})"
+            elif "api_key" in error_msg.lower():
                 error_detail = "API 키가 잘못되었거나 만료되었습니다."
             elif "quota" in error_msg.lower():
                 error_detail = "API 사용량 한도를 초과했습니다."
@@ -708,23 +1839,143 @@ class AIRISSAnalyzer:
                 "error": error_detail
             }
     
+    async def complete_chat(self, api_key: str, model: str, messages: List[Dict[str, str]], max_tokens: int,
+                            temperature: float = 0.7, cacheable=None, on_delta=None) -> tuple:
+        """채팅 완성 1회 - 디스크 캐시 확인, 분당 예산 확보 후 호출, (응답 텍스트, 토큰 수, 캐시 적중) 반환
+        
+        cacheable(응답 텍스트)가 False면 캐시에 저장하지 않는다.
+        on_delta가 있으면 스트리밍으로 받으며 조각이 도착할 때마다 지금까지의 텍스트로 호출한다.
+        재시도로 새 시도를 시작할 때는 빈 문자열로 호출해 실패한 시도의 부분 텍스트를 지운다.
+        """
+        # 🆕 API 키별로 재사용하는 비동기 클라이언트 - keep-alive 연결 풀 공유, 응답 대기 중에도 이벤트 루프는 계속 동작
+        client = openai_clients.get_async(api_key.strip())
+        
+        # 🆕 같은 엔드포인트/모델/메시지/설정의 응답이 디스크 캐시에 있으면 API 호출 없이 바로 사용
+        cache_key = llm_response_cache.make_key(model, messages, max_tokens, temperature, endpoint=client_endpoint(client))
+        # SQLite 조회/저장은 이벤트 루프를 막지 않도록 I/O 스레드 풀에서
+        cached = await task_executors.run_io(llm_response_cache.get, cache_key)
+        if cached is not None:
+            logger.info("AI 응답 캐시 사용")
+            if on_delta is not None:
+                on_delta(cached[0])
+            return cached[0], cached[1], True
+        
+        limiter = ai_rate_limiters.get(api_key.strip(), model)
+        prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
+        estimated = prompt_tokens + max_tokens
+        
+        async def attempt():
+            # 🆕 시도마다 분당 요청/토큰 예산 확보 후 호출 (재시도도 예산을 사용)
+            reserved = await limiter.acquire(estimated)
+            text = ""
+            try:
+                logger.info(f"OpenAI API 호출 시작: 모델={model}, 토큰={max_tokens}, 스트리밍={on_delta is not None}")
+                if on_delta is None:
+                    response = await client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        timeout=30
+                    )
+                    text = response.choices[0].message.content
+                    usage = getattr(response, 'usage', None)
+                else:
+                    # 🆕 스트리밍 - 조각마다 on_delta로 부분 텍스트 전달, 사용량은 마지막 조각으로 받음
+                    on_delta("")  # 재시도라면 실패한 시도의 부분 텍스트 초기화
+                    stream = await client.chat.completions.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        timeout=30,
+                        stream=True,
+                        stream_options={"include_usage": True}
+                    )
+                    usage = None
+                    async for chunk in stream:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            text += chunk.choices[0].delta.content
+                            on_delta(text)
+                        if getattr(chunk, 'usage', None):
+                            usage = chunk.usage
+            except BaseException:
+                # 🆕 실패/취소된 시도의 예약분 정산 - 받은 응답이 없으면 전액 환불, 스트리밍 도중 끊겼으면 받은 만큼만 사용 처리
+                limiter.settle(reserved, prompt_tokens + estimate_tokens(text) if text else 0)
+                raise
+            limiter.settle(reserved, usage.total_tokens if usage else reserved)
+            return text, usage
+        
+        # 🆕 429/5xx/타임아웃은 지수 백오프 재시도, 키/한도 오류나 반복 실패는 서킷 브레이커로 즉시 중단
+        text, usage = await ai_resilience.call_async(api_key.strip(), attempt)
+        
+        text = text.strip()
+        tokens_used = usage.total_tokens if usage else max_tokens
+        logger.info(f"OpenAI API 응답 수신 완료: {len(text)}자")
+        if cacheable is None or cacheable(text):
+            await task_executors.run_io(llm_response_cache.put, cache_key, model, text, tokens_used)
+        return text, tokens_used, False
+    
+    async def generate_ai_feedback_batch(self, employees: List[tuple], api_key: str = None, model: str = "gpt-3.5-turbo",
+                                         max_tokens: int = 1200) -> List[Dict[str, Any]]:
+        """여러 직원 (UID, 의견)의 AI 피드백을 한 번의 호출로 생성 - 응답에서 빠진 직원은 단일 호출로 보완, 입력 순서대로 반환"""
+        feedbacks = [None] * len(employees)
+        uid_counts = {}
+        for uid, _ in employees:
+            uid_counts[str(uid).strip()] = uid_counts.get(str(uid).strip(), 0) + 1
+        
+        if len(employees) > 1 and self.openai_available and api_key and api_key.startswith('sk-'):
+            start_time = datetime.now()
+            messages = [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": self.create_ok_batch_prompt(employees)}
+            ]
+            try:
+                # 출력은 직원 수만큼 늘어나므로 토큰 한도도 직원 수에 비례 (모델 응답 상한 이내)
+                response_text, tokens_used, cache_hit = await self.complete_chat(
+                    api_key, model, messages, min(max_tokens * len(employees), model_output_token_limit(model)),
+                    cacheable=lambda text: bool(self.parse_ai_batch_response(text))
+                )
+                parsed = self.parse_ai_batch_response(response_text)
+            except Exception as e:
+                logger.warning(f"다중 직원 AI 호출 실패, 단일 호출로 대체: {e}")
+                parsed, tokens_used, cache_hit = {}, 0, False
+            
+            processing_time = round((datetime.now() - start_time).total_seconds(), 2)
+            for i, (uid, _) in enumerate(employees):
+                key = str(uid).strip()
+                # 같은 배치에 UID가 중복되면 응답을 구분할 수 없으므로 단일 호출로 처리
+                if key in parsed and uid_counts[key] == 1:
+                    strengths, weaknesses, complete_feedback = parsed[key]
+                    feedbacks[i] = {
+                        "ai_strengths": strengths,
+                        "ai_weaknesses": weaknesses,
+                        "ai_feedback": complete_feedback,
+                        "processing_time": processing_time,
+                        "model_used": model,
+                        "tokens_used": tokens_used // len(employees),
+                        "cache_hit": cache_hit,
+                        "batch_size": len(employees),
+                        "error": None
+                    }
+        
+        missing = [i for i, feedback in enumerate(feedbacks) if feedback is None]
+        if missing and len(employees) > 1:
+            logger.info(f"다중 직원 응답 누락 {len(missing)}/{len(employees)}명 - 단일 호출로 보완")
+        # 호출자가 잡은 동시 호출 슬롯 1개 안에서 처리하므로 순서대로 호출 (ai_concurrency 한도 유지)
+        for i in missing:
+            feedbacks[i] = await self.generate_ai_feedback(employees[i][0], employees[i][1], api_key, model, max_tokens)
+        return feedbacks
+    
     def create_ok_prompt(self, uid: str, opinion: str, model: str, max_tokens: int) -> str:
         """OK금융그룹 맞춤 AI 프롬프트 생성 - 기존 코드 그대로"""
         return f"""
 OK금융그룹 직원 {uid}의 평가 의견을 AIRISS 8대 영역을 기반으로 종합 분석해주세요.
 
 【평가 의견】
-{opinion[:1500]}
+{compact_opinion(opinion, resolve_opinion_token_budget())}
 
-【AIRISS 8대 영역 (OK금융그룹 가중치)】
-1. 업무성과 (25%) - 업무 산출물의 양과 질
-2. KPI달성 (20%) - 핵심성과지표 달성도  
-3. 태도마인드 (15%) - 업무에 대한 태도와 마인드셋
-4. 커뮤니케이션 (15%) - 의사소통 능력과 스타일
-5. 리더십협업 (10%) - 리더십과 협업 능력
-6. 전문성학습 (8%) - 전문성과 학습능력
-7. 창의혁신 (5%) - 창의성과 혁신 마인드
-8. 조직적응 (2%) - 조직문화 적응도와 윤리성
+{self.PROMPT_DIMENSIONS}
 
 【출력 형식】
 [장점]
@@ -747,6 +1998,70 @@ OK금융그룹 인재상과 AIRISS 8대 영역을 종합하여 실행 가능한
 반드시 각 섹션을 완전히 작성하고 OK금융그룹 실무에 바로 적용할 수 있도록 구체적으로 작성해주세요.
         """
     
+    def create_ok_batch_prompt(self, employees: List[tuple]) -> str:
+        """여러 직원 평가 의견을 한 번에 분석하는 프롬프트 - 8대 영역 설명은 한 번만 넣고 UID별 JSON 배열 응답 요청"""
+        budget = resolve_opinion_token_budget()
+        opinions = "\n\n".join(f"[직원 {uid}]\n{compact_opinion(opinion, budget)}" for uid, opinion in employees)
+        return f"""
+OK금융그룹 직원 {len(employees)}명의 평가 의견을 직원별로 AIRISS 8대 영역을 기반으로 종합 분석해주세요.
+
+【평가 의견】
+{opinions}
+
+{self.PROMPT_DIMENSIONS}
+
+【출력 형식】
+아래 형식의 JSON 배열만 출력하세요 (설명 문장이나 코드 블록 표시 없이). 직원마다 객체 1개씩, uid는 위 직원 ID를 그대로 적습니다.
+[
+  {{
+    "uid": "직원 ID",
+    "strengths": "1. 핵심장점1 (관련 AIRISS 영역 명시)\\n2. 핵심장점2 (관련 AIRISS 영역 명시)\\n3. 핵심장점3 (관련 AIRISS 영역 명시)",
+    "weaknesses": "1. 개선점1 (관련 AIRISS 영역 명시)\\n2. 개선점2 (관련 AIRISS 영역 명시)\\n3. 개선점3 (관련 AIRISS 영역 명시)",
+    "feedback": "OK금융그룹 인재상과 AIRISS 8대 영역을 종합한 실행 가능한 피드백 500-700자 (핵심 강점과 활용 방안, 우선 개선 영역과 실행 방법, 향후 6개월 발전 계획, 조직 기여도 향상 방안)"
+  }}
+]
+
+반드시 모든 직원의 객체를 빠짐없이 완전하게 작성하고 OK금융그룹 실무에 바로 적용할 수 있도록 구체적으로 작성해주세요.
+        """
+    
+    def parse_ai_batch_response(self, response: str) -> Dict[str, tuple]:
+        """다중 직원 JSON 응답을 UID별 (장점, 개선점, 종합 피드백)으로 분리 - 항목이 비었거나 형식이 어긋난 직원은 제외"""
+        start, end = response.find('['), response.rfind(']')
+        if start < 0 or end <= start:
+            return {}
+        try:
+            items = json.loads(response[start:end + 1])
+        except ValueError as e:
+            logger.warning(f"다중 직원 AI 응답 JSON 파싱 오류: {e}")
+            return {}
+        
+        parsed = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict) or item.get("uid") in (None, ""):
+                continue
+            sections = []
+            for field in ("strengths", "weaknesses", "feedback"):
+                value = item.get(field)
+                if isinstance(value, list):
+                    value = "\n".join(str(v) for v in value)
+                sections.append(self.clean_text(str(value)) if value else "")
+            if all(sections):
+                parsed[str(item["uid"]).strip()] = tuple(sections)
+        return parsed
+    
+    def split_partial_feedback(self, text: str) -> Dict[str, str]:
+        """스트리밍 중인 응답에서 지금까지 도착한 [장점]/[개선점]/[종합 피드백] 구간 (기본 문구 없이 있는 그대로)"""
+        sections = {"ai_strengths": "", "ai_weaknesses": "", "ai_feedback": ""}
+        markers = [("[장점]", "ai_strengths"), ("[개선점]", "ai_weaknesses"), ("[종합 피드백]", "ai_feedback"), ("[종합피드백]", "ai_feedback")]
+        found = sorted((text.find(marker), marker, field) for marker, field in markers if marker in text)
+        if not found:
+            sections["ai_feedback"] = text.strip()
+            return sections
+        for i, (position, marker, field) in enumerate(found):
+            end = found[i + 1][0] if i + 1 < len(found) else len(text)
+            sections[field] = text[position + len(marker):end].strip()
+        return sections
+    
     def parse_ai_response(self, response: str) -> tuple:
         """AI 응답 파싱 - 기존 코드 그대로"""
         try:
@@ -822,20 +2137,18 @@ class AIRISSHybridAnalyzer:
         
         logger.info("✅ AIRISS v3.0 하이브리드 분석기 초기화 완료")
     
-    def comprehensive_analysis(self, uid: str, opinion: str, row_data: pd.Series) -> Dict[str, Any]:
+    def comprehensive_analysis(self, uid: str, opinion: str, row_data: pd.Series, framework: Optional[FrameworkVersion] = None,
+                               quantitative_plan: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """종합 분석: 텍스트 + 정량 데이터"""
         
         # 1. 기존 텍스트 분석 (100% 그대로)
-        text_results = {}
-        for dimension in AIRISS_FRAMEWORK.keys():
-            text_results[dimension] = self.text_analyzer.analyze_text(opinion, dimension)
+        text_results = self.text_analyzer.analyze_all(opinion, framework)
+        dimension_scores = {dim: result["score"] for dim, result in text_results.items()}
         
-        text_overall = self.text_analyzer.calculate_overall_score(
-            {dim: result["score"] for dim, result in text_results.items()}
-        )
+        text_overall = self.text_analyzer.calculate_overall_score(dimension_scores, framework)
         
         # 2. 정량 데이터 분석 (신규)
-        quant_data = self.quantitative_analyzer.extract_quantitative_data(row_data)
+        quant_data = self.quantitative_analyzer.extract_quantitative_data(row_data, quantitative_plan)
         quant_results = self.quantitative_analyzer.calculate_quantitative_score(quant_data)
         
         # 3. 하이브리드 점수 계산
@@ -865,7 +2178,7 @@ class AIRISSHybridAnalyzer:
             "text_analysis": {
                 "overall_score": text_overall["overall_score"],
                 "grade": text_overall["grade"],
-                "dimension_scores": {dim: result["score"] for dim, result in text_results.items()},
+                "dimension_scores": dimension_scores,
                 "dimension_details": text_results
             },
             
@@ -898,56 +2211,119 @@ class AIRISSHybridAnalyzer:
             }
         }
     
+    def prepare_batch_inputs(self, df: pd.DataFrame, uid_cols: List[str], opinion_cols: List[str],
+                             quantitative_cols: List[str], analysis_mode: str = "hybrid") -> tuple:
+        """행 단위 처리와 같은 규칙으로 UID/의견 추출 - (UID 목록, 의견 목록, 분석 대상 행 위치 배열)
+        
+        iterrows()와 같은 값을 보도록 df.values에서 읽고, 빈 의견은 ""로 바꾼다.
+        정량 컬럼도 없는 빈 의견 행은 분석 대상에서 빠진다.
+        """
+        values = df.values
+        if uid_cols:
+            uids = [str(value) for value in values[:, df.columns.get_loc(uid_cols[0])]]
+        else:
+            uids = [f"user_{idx}" for idx in df.index]
+        if opinion_cols:
+            opinions = [str(value) for value in values[:, df.columns.get_loc(opinion_cols[0])]]
+        else:
+            opinions = [""] * len(df)
+        
+        rows = []
+        for position, opinion in enumerate(opinions):
+            # 빈 값 표기는 4자 이하라 긴 의견은 lower() 없이 통과
+            if not opinion or (len(opinion) <= 4 and opinion.lower() in ['nan', 'null', '', 'none']):
+                if analysis_mode != "quantitative" and not quantitative_cols:
+                    continue
+                opinions[position] = ""
+            rows.append(position)
+        return uids, opinions, np.array(rows, dtype=int)
+    
+    def comprehensive_analysis_batch(self, df: pd.DataFrame, uid_cols: List[str], opinion_cols: List[str], quantitative_cols: List[str],
+                                     framework: Optional[FrameworkVersion] = None,
+                                     quantitative_plan: Optional[List[Dict[str, Any]]] = None) -> pd.DataFrame:
+        """comprehensive_analysis + 결과 레코드 생성을 DataFrame 단위로 수행
+        
+        반환 DataFrame은 분석 대상 행을 원래 순서대로 담고(index = df 내 행 위치), 컬럼은
+        process_analysis_v3의 행 단위 결과 레코드(AI/분석시간 컬럼 제외)와 같다.
+        정량 항목이 하나도 없는 데이터는 행 단위 처리에서도 레코드를 만들 수 없으므로 지원하지 않는다.
+        """
+        framework = self.text_analyzer.resolve_framework(framework)
+        if quantitative_plan is None:
+            quantitative_plan = self.quantitative_analyzer.column_plan(df.columns)
+        if not quantitative_plan:
+            raise ValueError("정량 항목이 없는 데이터는 일괄 분석을 지원하지 않습니다")
+        
+        uids, opinions, rows = self.prepare_batch_inputs(df, uid_cols, opinion_cols, quantitative_cols)
+        opinions = [opinions[row] for row in rows]
+        
+        # 1. 텍스트 분석 (영역별 배열 → 종합 점수/등급)
+        text_results = self.text_analyzer.analyze_texts(pd.Series(opinions, dtype=object), framework)
+        text_overall = self.text_analyzer.calculate_overall_scores(
+            {dimension: result["score"] for dimension, result in text_results.items()}, framework
+        )
+        
+        # 2. 정량 분석 (iterrows와 같은 값으로 열 단위 정규화 → 점수 행렬)
+        row_values = pd.DataFrame(df.values[rows], columns=df.columns)
+        quant_matrix = self.quantitative_analyzer.quantitative_matrix(
+            self.quantitative_analyzer.extract_quantitative_columns(row_values, quantitative_plan)
+        )
+        quant_results = quant_matrix.scores()
+        
+        # 3. 데이터 품질별 가중치 선택 후 하이브리드 점수
+        data_quality = quant_results["data_quality"]
+        text_weight = np.select([data_quality == "없음", data_quality == "낮음"], [0.8, 0.7],
+                                default=self.hybrid_weights['text_analysis'])
+        quant_weight = np.select([data_quality == "없음", data_quality == "낮음"], [0.2, 0.3],
+                                 default=self.hybrid_weights['quantitative_analysis'])
+        
+        hybrid_score = text_overall["overall_score"] * text_weight + quant_results["quantitative_score"] * quant_weight
+        
+        # 4. 통합 신뢰도 (텍스트 종합 결과에는 신뢰도가 없어 행 단위와 같이 70 적용)
+        hybrid_confidence = 70 * text_weight + quant_results["confidence"] * quant_weight
+        
+        # 5. 하이브리드 등급 산정
+        hybrid_grades = self.calculate_hybrid_grades(hybrid_score)
+        
+        columns = {
+            "UID": [uids[row] for row in rows],
+            "원본의견": [opinion[:500] + "..." if len(opinion) > 500 else opinion for opinion in opinions],
+            "AIRISS_v2_종합점수": round_array(hybrid_score),
+            "OK등급": hybrid_grades["grade"],
+            "등급설명": hybrid_grades["grade_description"],
+            "백분위": hybrid_grades["percentile"],
+            "분석신뢰도": round_array(hybrid_confidence),
+            "텍스트_종합점수": text_overall["overall_score"],
+            "텍스트_등급": text_overall["grade"],
+            "정량_종합점수": quant_results["quantitative_score"],
+            "정량_신뢰도": quant_results["confidence"],
+            "정량_데이터품질": data_quality,
+            "정량_데이터개수": quant_results["data_count"],
+            "분석모드": "hybrid",
+            "텍스트_가중치": round_array(text_weight * 100),
+            "정량_가중치": round_array(quant_weight * 100)
+        }
+        
+        for dimension, result in text_results.items():
+            columns[f"{dimension}_텍스트점수"] = result["score"]
+            columns[f"{dimension}_신뢰도"] = result["confidence"]
+            columns[f"{dimension}_긍정신호"] = result["positive"]
+            columns[f"{dimension}_부정신호"] = result["negative"]
+        
+        for column, factor_name in enumerate(quant_matrix.keys):
+            clean_name = factor_name.replace("grade_", "").replace("score_", "").replace("rate_", "").replace("count_", "")
+            scores = quant_matrix.values[:, column]
+            columns[f"정량_{clean_name}"] = round_array(scores)
+            columns[f"정량_{clean_name}_기여도"] = round_array(scores * quant_matrix.weights[column])
+        
+        return pd.DataFrame(columns, index=rows)
+    
     def calculate_hybrid_grade(self, score: float) -> Dict[str, str]:
         """하이브리드 점수를 OK등급으로 변환"""
-        if score >= 95:
-            return {
-                "grade": "OK★★★",
-                "grade_description": "최우수 등급 (TOP 1%) - 정량+정성 통합분석",
-                "percentile": "상위 1%"
-            }
-        elif score >= 90:
-            return {
-                "grade": "OK★★",
-                "grade_description": "우수 등급 (TOP 5%) - 정량+정성 통합분석",
-                "percentile": "상위 5%"
-            }
-        elif score >= 85:
-            return {
-                "grade": "OK★",
-                "grade_description": "우수+ 등급 (TOP 10%) - 정량+정성 통합분석",
-                "percentile": "상위 10%"
-            }
-        elif score >= 80:
-            return {
-                "grade": "OK A",
-                "grade_description": "양호 등급 (TOP 20%) - 정량+정성 통합분석",
-                "percentile": "상위 20%"
-            }
-        elif score >= 75:
-            return {
-                "grade": "OK B+",
-                "grade_description": "양호- 등급 (TOP 30%) - 정량+정성 통합분석",
-                "percentile": "상위 30%"
-            }
-        elif score >= 70:
-            return {
-                "grade": "OK B",
-                "grade_description": "보통 등급 (TOP 40%) - 정량+정성 통합분석",
-                "percentile": "상위 40%"
-            }
-        elif score >= 60:
-            return {
-                "grade": "OK C",
-                "grade_description": "개선필요 등급 (TOP 60%) - 정량+정성 통합분석",
-                "percentile": "상위 60%"
-            }
-        else:
-            return {
-                "grade": "OK D",
-                "grade_description": "집중개선 등급 (하위 40%) - 정량+정성 통합분석",
-                "percentile": "하위 40%"
-            }
+        return OK_GRADE_TABLE.lookup(score, HYBRID_GRADE_SUFFIX)
+    
+    def calculate_hybrid_grades(self, scores: np.ndarray) -> Dict[str, np.ndarray]:
+        """하이브리드 점수 컬럼 전체를 OK등급으로 변환"""
+        return OK_GRADE_TABLE.assign(scores, HYBRID_GRADE_SUFFIX)
 
 # 🆕 하이브리드 분석기 인스턴스 생성
 hybrid_analyzer = AIRISSHybridAnalyzer()
@@ -961,6 +2337,11 @@ class AnalysisRequest(BaseModel):
     enable_ai_feedback: bool = False
     openai_model: str = "gpt-3.5-turbo"
     max_tokens: int = 1200
+    workers: Optional[int] = None  # 🆕 채점 프로세스 수 (없으면 AIRISS_ANALYSIS_WORKERS, 기본 1, 0=이벤트 루프 안 시간 분할)
+    count_scoring: Optional[str] = None  # 🆕 횟수/건수 평가 방식: "absolute"(기존 구간) 또는 "relative"(조직 내 상대 위치)
+    ai_concurrency: Optional[int] = None  # 🆕 동시 AI 호출 수 (없으면 AIRISS_AI_CONCURRENCY, 기본 4)
+    ai_batch_size: Optional[int] = None  # 🆕 AI 호출 1회에 묶는 직원 수 (없으면 AIRISS_AI_BATCH_SIZE, 기본 1=직원별 호출)
+    ai_stream: Optional[bool] = None  # 🆕 직원별 호출을 스트리밍으로 받아 진행 중 피드백 공개 (없으면 AIRISS_AI_STREAM, 기본 사용)
 
 # 🆕 NEW: v3.0 메인 페이지 HTML (검색 링크 추가)
 @app.get("/", response_class=HTMLResponse)
@@ -2343,6 +3724,12 @@ async def get_main_page():
                             <div class="stat-label">AI 피드백 성공</div>
                         </div>
                         ` : ''}
+                        ${status.ai_cache_hit_count ? `
+                        <div class="stat-card">
+                            <div class="stat-number">${status.ai_cache_hit_count}</div>
+                            <div class="stat-label">AI 캐시 재사용</div>
+                        </div>
+                        ` : ''}
                         ${hybridInfo.quantitative_data_count ? `
                         <div class="stat-card">
                             <div class="stat-number">${hybridInfo.quantitative_data_count}</div>
@@ -3009,6 +4396,7 @@ async def get_search_page():
         // 전역 변수
         let radarChart = null;
         let currentStats = null;
+        let aiStreamTimer = null;  // 🆕 진행 중 작업의 AI 피드백 스트리밍 조회 타이머
         
         // 페이지 로드시 초기화
         document.addEventListener('DOMContentLoaded', function() {
@@ -3051,7 +4439,9 @@ async def get_search_page():
                     jobs.forEach(job => {
                         const option = document.createElement('option');
                         option.value = job.job_id;
-                        option.textContent = `${job.filename} (${job.processed}명, ${job.end_time || '시간 정보 없음'})`;
+                        option.textContent = job.in_progress
+                            ? `${job.filename} (${job.processed}명, 진행 중 - AI 피드백 생성 중)`
+                            : `${job.filename} (${job.processed}명, ${job.end_time || '시간 정보 없음'})`;
                         jobSelect.appendChild(option);
                     });
                 } else {
@@ -3082,6 +4472,7 @@ async def get_search_page():
             }
             
             // UI 상태 변경
+            stopAIStream();
             showLoading(true);
             hideError();
             hideAllResults();
@@ -3112,6 +4503,9 @@ async def get_search_page():
                     
                     // 프로필 표시
                     displayEmployeeProfile(result.employee, currentStats);
+                    
+                    // 🆕 AI 피드백이 아직 생성 중이면 도착하는 대로 표시
+                    watchAIStream(jobId, result.employee.UID || result.employee.uid);
                 } else {
                     // 결과 없음
                     showNoResults();
@@ -3125,6 +4519,46 @@ async def get_search_page():
             }
         }
         
+        // 🆕 AI 피드백 스트리밍 조회 중단
+        function stopAIStream() {
+            if (aiStreamTimer) {
+                clearTimeout(aiStreamTimer);
+                aiStreamTimer = null;
+            }
+        }
+        
+        // 🆕 진행 중 작업의 AI 피드백을 0.5초마다 조회해 도착한 부분까지 표시 (완료/오류 시 중단)
+        async function watchAIStream(jobId, uid) {
+            stopAIStream();
+            if (!uid) return;
+            
+            try {
+                const response = await fetch(`/api/ai-stream/${jobId}?uid=${encodeURIComponent(uid)}`);
+                if (!response.ok) return;  // 스트리밍 작업이 아니거나 AI 대상이 아님
+                
+                const live = await response.json();
+                if (live.status !== 'pending') {
+                    const inProgress = live.status === 'streaming' ? ' ▌' : '';
+                    if (live.ai_feedback) {
+                        document.getElementById('aiFeedback').style.display = 'block';
+                        document.getElementById('aiFeedbackContent').textContent = live.ai_feedback + inProgress;
+                    }
+                    if (live.ai_strengths) {
+                        document.getElementById('strengthsContent').textContent = live.ai_strengths;
+                    }
+                    if (live.ai_weaknesses) {
+                        document.getElementById('improvementContent').textContent = live.ai_weaknesses;
+                    }
+                }
+                
+                if (live.status === 'pending' || live.status === 'streaming') {
+                    aiStreamTimer = setTimeout(() => watchAIStream(jobId, uid), 500);
+                }
+            } catch (error) {
+                console.error('[AIRISS v3.0] AI 스트리밍 조회 오류:', error);
+            }
+        }
+        
         // 통계 정보 표시
         function displayStatistics(stats) {
             if (!stats) return;
@@ -3535,14 +4969,17 @@ async def get_completed_jobs():
     try:
         completed_jobs = []
         for job_id, job_data in store.jobs.items():
-            if job_data.get("status") == "completed" and job_data.get("results"):
+            # 🆕 AI 스트리밍 중인 작업도 진행 중 결과 조회를 위해 포함
+            in_progress = job_data.get("status") == "processing" and ai_live_feedback.is_live(job_id)
+            if (job_data.get("status") == "completed" or in_progress) and job_data.get("results"):
                 file_data = store.get_file(job_data["file_id"])
                 completed_jobs.append({
                     "job_id": job_id,
                     "filename": file_data["filename"] if file_data else "Unknown",
                     "processed": job_data["processed"],
                     "end_time": job_data["end_time"].strftime("%Y-%m-%d %H:%M") if job_data.get("end_time") else "",
-                    "analysis_mode": job_data.get("analysis_mode", "hybrid")
+                    "analysis_mode": job_data.get("analysis_mode", "hybrid"),
+                    "in_progress": in_progress
                 })
         
         # 최신순 정렬
@@ -3553,96 +4990,105 @@ async def get_completed_jobs():
         logger.error(f"작업 목록 조회 오류: {e}")
         raise HTTPException(status_code=500, detail="작업 목록 조회 실패")
 
+def build_employee_search_response(results: List[Dict], uid: str = None, grade: str = None) -> Dict[str, Any]:
+    """직원 검색 응답 구성 - 전체 평균/등급 분포 통계와 대상 직원의 상대 위치 (동기)"""
+    # 전체 통계 데이터 계산
+    df_results = pd.DataFrame(results)
+    
+    # 평균 점수 계산
+    avg_scores = {
+        "hybrid_avg": round(df_results["AIRISS_v2_종합점수"].mean(), 1),
+        "text_avg": round(df_results["텍스트_종합점수"].mean(), 1),
+        "quant_avg": round(df_results["정량_종합점수"].mean(), 1),
+        "confidence_avg": round(df_results["분석신뢰도"].mean(), 1)
+    }
+    
+    # 8대 영역별 평균
+    dimensions = ['업무성과', 'KPI달성', '태도마인드', '커뮤니케이션',
+                 '리더십협업', '전문성학습', '창의혁신', '조직적응']
+    
+    dimension_avgs = {}
+    for dim in dimensions:
+        col_name = f"{dim}_텍스트점수"
+        if col_name in df_results.columns:
+            dimension_avgs[dim] = round(df_results[col_name].mean(), 1)
+    
+    # 등급 분포
+    grade_distribution = df_results["OK등급"].value_counts().to_dict()
+    total_count = len(results)
+    
+    # 최고 등급 비율 계산
+    top_grades = ["OK★★★", "OK★★", "OK★"]
+    top_grade_count = sum(grade_distribution.get(g, 0) for g in top_grades)
+    top_grade_ratio = round((top_grade_count / total_count) * 100, 1) if total_count > 0 else 0
+    
+    # UID로 검색
+    employee_data = None
+    if uid:
+        for employee in results:
+            if str(employee.get("UID", "")).lower() == uid.lower():
+                employee_data = dict(employee)  # 저장된 결과 레코드는 수정하지 않고 응답용 사본에 표시
+                
+                # 개인의 상대적 위치 계산
+                hybrid_score = employee.get("AIRISS_v2_종합점수", 0)
+                higher_count = (df_results["AIRISS_v2_종합점수"] > hybrid_score).sum()
+                percentile_rank = round(((total_count - higher_count) / total_count) * 100, 1)
+                employee_data["percentile_rank"] = percentile_rank
+                
+                # 각 점수별 평균 대비 차이 계산
+                employee_data["score_differences"] = {
+                    "hybrid_diff": round(hybrid_score - avg_scores["hybrid_avg"], 1),
+                    "text_diff": round(employee.get("텍스트_종합점수", 0) - avg_scores["text_avg"], 1),
+                    "quant_diff": round(employee.get("정량_종합점수", 0) - avg_scores["quant_avg"], 1),
+                    "confidence_diff": round(employee.get("분석신뢰도", 0) - avg_scores["confidence_avg"], 1)
+                }
+                
+                break
+    
+    # 등급으로 필터링
+    if grade and not employee_data:
+        for employee in results:
+            if employee.get("OK등급") == grade:
+                employee_data = dict(employee)  # 저장된 결과 레코드는 수정하지 않고 응답용 사본에 표시
+                # 상대적 위치 계산
+                hybrid_score = employee.get("AIRISS_v2_종합점수", 0)
+                higher_count = (df_results["AIRISS_v2_종합점수"] > hybrid_score).sum()
+                percentile_rank = round(((total_count - higher_count) / total_count) * 100, 1)
+                employee_data["percentile_rank"] = percentile_rank
+                break
+    
+    if not employee_data and results:
+        employee_data = dict(results[0])
+    
+    return {
+        "employee": employee_data,
+        "statistics": {
+            "total_count": total_count,
+            "average_scores": avg_scores,
+            "dimension_averages": dimension_avgs,
+            "grade_distribution": grade_distribution,
+            "top_grade_ratio": top_grade_ratio
+        }
+    }
+
 @app.get("/api/employee/{job_id}")
 async def search_employee(job_id: str, uid: str = None, grade: str = None):
     """개별 직원 데이터 검색 - 전체 평균 및 통계 포함"""
     try:
         job_data = store.get_job(job_id)
-        if not job_data or job_data.get("status") != "completed":
+        in_progress = job_data is not None and job_data.get("status") == "processing" and ai_live_feedback.is_live(job_id)
+        if not job_data or (job_data.get("status") != "completed" and not in_progress):
             raise HTTPException(status_code=404, detail="완료된 작업을 찾을 수 없습니다")
         
         results = job_data.get("results", [])
         if not results:
             raise HTTPException(status_code=404, detail="분석 결과가 없습니다")
+        if in_progress:
+            # 진행 중 작업은 AI 피드백이 레코드를 계속 갱신하므로 현재 시점 사본으로 계산
+            results = [dict(record) for record in results]
         
-        # 전체 통계 데이터 계산
-        df_results = pd.DataFrame(results)
-        
-        # 평균 점수 계산
-        avg_scores = {
-            "hybrid_avg": round(df_results["AIRISS_v2_종합점수"].mean(), 1),
-            "text_avg": round(df_results["텍스트_종합점수"].mean(), 1),
-            "quant_avg": round(df_results["정량_종합점수"].mean(), 1),
-            "confidence_avg": round(df_results["분석신뢰도"].mean(), 1)
-        }
-        
-        # 8대 영역별 평균
-        dimensions = ['업무성과', 'KPI달성', '태도마인드', '커뮤니케이션',
-                     '리더십협업', '전문성학습', '창의혁신', '조직적응']
-        
-        dimension_avgs = {}
-        for dim in dimensions:
-            col_name = f"{dim}_텍스트점수"
-            if col_name in df_results.columns:
-                dimension_avgs[dim] = round(df_results[col_name].mean(), 1)
-        
-        # 등급 분포
-        grade_distribution = df_results["OK등급"].value_counts().to_dict()
-        total_count = len(results)
-        
-        # 최고 등급 비율 계산
-        top_grades = ["OK★★★", "OK★★", "OK★"]
-        top_grade_count = sum(grade_distribution.get(g, 0) for g in top_grades)
-        top_grade_ratio = round((top_grade_count / total_count) * 100, 1) if total_count > 0 else 0
-        
-        # UID로 검색
-        employee_data = None
-        if uid:
-            for employee in results:
-                if str(employee.get("UID", "")).lower() == uid.lower():
-                    employee_data = employee
-                    
-                    # 개인의 상대적 위치 계산
-                    hybrid_score = employee.get("AIRISS_v2_종합점수", 0)
-                    higher_count = (df_results["AIRISS_v2_종합점수"] > hybrid_score).sum()
-                    percentile_rank = round(((total_count - higher_count) / total_count) * 100, 1)
-                    employee_data["percentile_rank"] = percentile_rank
-                    
-                    # 각 점수별 평균 대비 차이 계산
-                    employee_data["score_differences"] = {
-                        "hybrid_diff": round(hybrid_score - avg_scores["hybrid_avg"], 1),
-                        "text_diff": round(employee.get("텍스트_종합점수", 0) - avg_scores["text_avg"], 1),
-                        "quant_diff": round(employee.get("정량_종합점수", 0) - avg_scores["quant_avg"], 1),
-                        "confidence_diff": round(employee.get("분석신뢰도", 0) - avg_scores["confidence_avg"], 1)
-                    }
-                    
-                    break
-        
-        # 등급으로 필터링
-        if grade and not employee_data:
-            for employee in results:
-                if employee.get("OK등급") == grade:
-                    employee_data = employee
-                    # 상대적 위치 계산
-                    hybrid_score = employee.get("AIRISS_v2_종합점수", 0)
-                    higher_count = (df_results["AIRISS_v2_종합점수"] > hybrid_score).sum()
-                    percentile_rank = round(((total_count - higher_count) / total_count) * 100, 1)
-                    employee_data["percentile_rank"] = percentile_rank
-                    break
-        
-        if not employee_data and results:
-            employee_data = results[0]
-        
-        return {
-            "employee": employee_data,
-            "statistics": {
-                "total_count": total_count,
-                "average_scores": avg_scores,
-                "dimension_averages": dimension_avgs,
-                "grade_distribution": grade_distribution,
-                "top_grade_ratio": top_grade_ratio
-            }
-        }
+        # 통계/검색용 DataFrame 작업은 스레드 풀에서
+        return await task_executors.run_io(build_employee_search_response, results, uid, grade)
         
     except HTTPException:
         raise
@@ -3650,6 +5096,77 @@ async def search_employee(job_id: str, uid: str = None, grade: str = None):
         logger.error(f"직원 검색 오류: {e}")
         raise HTTPException(status_code=500, detail="검색 중 오류가 발생했습니다")
 
+@app.get("/api/ai-stream/{job_id}")
+async def get_ai_stream(job_id: str, uid: str, occurrence: int = 0):
+    """직원별 실시간 AI 피드백 - 수신 중이면 지금까지 도착한 구간, 완료되면 최종 결과
+    
+    occurrence는 같은 UID 행이 여러 개일 때 결과 순서상 몇 번째 행인지 (기본 0 = 검색 결과와 같은 첫 행).
+    작업이 끝나 실시간 상태가 삭제된 뒤에는 저장된 결과 레코드로 응답한다.
+    """
+    job_data = store.get_job(job_id)
+    if not job_data or not (job_data.get("ai_stream") and job_data.get("enable_ai_feedback") and job_data.get("openai_api_key")):
+        raise HTTPException(status_code=404, detail="AI 스트리밍 작업을 찾을 수 없습니다")
+    
+    entries = ai_live_feedback.get(job_id, uid)
+    if entries is None:
+        if job_data.get("status") != "completed":
+            raise HTTPException(status_code=404, detail="AI 스트리밍 작업을 찾을 수 없습니다")
+        entries = [{"status": "done", "record": record} for record in job_data.get("results", []) if str(record.get("UID")) == uid]
+    if not 0 <= occurrence < len(entries):
+        raise HTTPException(status_code=404, detail="해당 직원의 AI 피드백이 없습니다")
+    
+    entry = entries[occurrence]
+    if entry["status"] in ("done", "error"):
+        record = entry["record"]
+        sections = {
+            "ai_strengths": record.get("AI_장점", ""),
+            "ai_weaknesses": record.get("AI_개선점", ""),
+            "ai_feedback": record.get("AI_종합피드백", "")
+        }
+    else:
+        sections = hybrid_analyzer.text_analyzer.split_partial_feedback(entry["text"])
+    return {"uid": uid, "occurrence": occurrence, "occurrences": len(entries), "status": entry["status"], **sections}
+
+@app.get("/api/keywords/{job_id}")
+async def get_keyword_statistics(job_id: str, uid: str = None, top_n: int = 10, dimension: str = None,
+                                 min_score: float = None, max_score: float = None):
+    """작업별 키워드 적중 통계 (영역/극성별 합계, 상위 키워드, 직원별 적중 키워드)
+    
+    min_score/max_score를 주면 해당 점수 구간 직원만 집계 - dimension이 있으면 그 영역 텍스트점수,
+    없으면 종합점수 기준 (예: dimension=커뮤니케이션&max_score=50 → 커뮤니케이션 저점자의 키워드)
+    """
+    job_data = store.get_job(job_id)
+    if not job_data or job_data.get("status") != "completed":
+        raise HTTPException(status_code=404, detail="완료된 작업을 찾을 수 없습니다")
+    
+    keyword_hits = job_data.get("keyword_hits")
+    if keyword_hits is None:
+        raise HTTPException(status_code=404, detail="키워드 분석 결과가 없습니다")
+    
+    rows = None
+    if min_score is not None or max_score is not None:
+        if dimension is not None and dimension not in keyword_hits.engine.dimensions:
+            raise HTTPException(status_code=400, detail=f"알 수 없는 영역입니다: {dimension}")
+        score_column = f"{dimension}_텍스트점수" if dimension else "AIRISS_v2_종합점수"
+        # 적중 행렬은 결과 레코드와 같은 순서로 생성됨
+        scores = np.array([float(r.get(score_column, np.nan)) for r in job_data.get("results", [])])
+        rows = np.isfinite(scores)
+        if min_score is not None:
+            rows &= scores >= min_score
+        if max_score is not None:
+            rows &= scores <= max_score
+    
+    response = keyword_hits.summary(top_n, rows=rows)
+    if rows is not None:
+        response["filter"] = {"score_column": score_column, "min_score": min_score, "max_score": max_score,
+                              "matched_employees": int(rows.sum())}
+    if uid:
+        employee_keywords = keyword_hits.employee_keywords(uid)
+        if employee_keywords is None:
+            raise HTTPException(status_code=404, detail="직원을 찾을 수 없습니다")
+        response["employee"] = {"uid": uid, "keywords": employee_keywords}
+    return response
+
 @app.get("/api/employees/{job_id}")
 async def get_employees_list(job_id: str, limit: int = 50):
     """직원 목록 조회 (자동완성용)"""
@@ -3673,6 +5190,32 @@ async def get_employees_list(job_id: str, limit: int = 50):
     except Exception as e:
         logger.error(f"직원 목록 조회 오류: {e}")
         raise HTTPException(status_code=500, detail="목록 조회 실패")
+def read_upload_dataframe(filename: str, contents: bytes) -> pd.DataFrame:
+    """업로드 파일(Excel/CSV)을 DataFrame으로 읽기 (기존 코드 그대로, 동기)"""
+    if filename.endswith(('.xlsx', '.xls')):
+        df = pd.read_excel(io.BytesIO(contents))
+        logger.info("Excel 파일 처리 완료")
+    elif filename.endswith('.csv'):
+        encodings = ['utf-8', 'cp949', 'euc-kr', 'iso-8859-1']
+        df = None
+        
+        for encoding in encodings:
+            try:
+                df = pd.read_csv(io.StringIO(contents.decode(encoding)))
+                logger.info(f"CSV 파일 처리 완료 (인코딩: {encoding})")
+                break
+            except UnicodeDecodeError:
+                continue
+            except Exception as e:
+                logger.warning(f"인코딩 {encoding} 실패: {e}")
+                continue
+        
+        if df is None:
+            raise HTTPException(status_code=400, detail="CSV 파일 인코딩을 인식할 수 없습니다")
+    else:
+        raise HTTPException(status_code=400, detail="지원되지 않는 파일 형식입니다")
+    return df
+
 # 🆕 업로드 엔드포인트 수정 (정량데이터 감지 추가) - v2.0 코드 그대로
 @app.post("/upload")
 async def upload_file(file: UploadFile = File(...)):
@@ -3680,31 +5223,9 @@ async def upload_file(file: UploadFile = File(...)):
     try:
         logger.info(f"AIRISS v3.0 파일 업로드 시작: {file.filename}")
         
-        # 파일 내용 읽기 (기존 코드 그대로)
+        # 파일 내용 읽기 (파싱은 스레드 풀에서)
         contents = await file.read()
-        
-        if file.filename.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(io.BytesIO(contents))
-            logger.info("Excel 파일 처리 완료")
-        elif file.filename.endswith('.csv'):
-            encodings = ['utf-8', 'cp949', 'euc-kr', 'iso-8859-1']
-            df = None
-            
-            for encoding in encodings:
-                try:
-                    df = pd.read_csv(io.StringIO(contents.decode(encoding)))
-                    logger.info(f"CSV 파일 처리 완료 (인코딩: {encoding})")
-                    break
-                except UnicodeDecodeError:
-                    continue
-                except Exception as e:
-                    logger.warning(f"인코딩 {encoding} 실패: {e}")
-                    continue
-            
-            if df is None:
-                raise HTTPException(status_code=400, detail="CSV 파일 인코딩을 인식할 수 없습니다")
-        else:
-            raise HTTPException(status_code=400, detail="지원되지 않는 파일 형식입니다")
+        df = await task_executors.run_io(read_upload_dataframe, file.filename, contents)
         
         # 파일 ID 생성 및 저장
         file_id = str(uuid.uuid4())
@@ -3761,7 +5282,8 @@ async def upload_file(file: UploadFile = File(...)):
             'columns': all_columns,
             'uid_columns': uid_columns,
             'opinion_columns': opinion_columns,
-            'quantitative_columns': quantitative_columns  # 🆕 추가
+            'quantitative_columns': quantitative_columns,  # 🆕 추가
+            'quantitative_plan': hybrid_analyzer.quantitative_analyzer.column_plan(all_columns)  # 🆕 컬럼별 유형/정규화 계획 (1회 계산)
         })
         
         logger.info(f"AIRISS v3.0 파일 저장 완료: {file_id}")
@@ -3792,6 +5314,11 @@ async def upload_file(file: UploadFile = File(...)):
 @app.post("/analyze")
 async def start_analysis(request: AnalysisRequest):
     """분석 작업 시작 - v3.0 하이브리드 분석 지원"""
+    try:
+        count_scoring = resolve_count_scoring(request.count_scoring)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         # 파일 데이터 확인
         file_data = store.get_file(request.file_id)
@@ -3811,6 +5338,11 @@ async def start_analysis(request: AnalysisRequest):
             "openai_api_key": request.openai_api_key,
             "openai_model": request.openai_model,
             "max_tokens": request.max_tokens,
+            "workers": request.workers,
+            "count_scoring": count_scoring,
+            "ai_concurrency": resolve_ai_concurrency(request.ai_concurrency),
+            "ai_batch_size": resolve_ai_batch_size(request.ai_batch_size),
+            "ai_stream": request.ai_stream if request.ai_stream is not None else os.environ.get("AIRISS_AI_STREAM", "1") == "1",
             "start_time": datetime.now(),
             "total": request.sample_size,
             "processed": 0,
@@ -3818,6 +5350,7 @@ async def start_analysis(request: AnalysisRequest):
             "progress": 0.0,
             "results": [],
             "version": "3.0",  # 🆕 추가
+            "framework": framework_registry.current(),  # 🆕 작업 시작 시점의 키워드 사전 버전 고정
             "hybrid_analysis_info": {}  # 🆕 추가
         })
         
@@ -3838,6 +5371,426 @@ async def start_analysis(request: AnalysisRequest):
         logger.error(f"AIRISS v3.0 분석 시작 오류: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
+# 🆕 NEW: 한 행의 키워드/정량 채점 (직렬 루프와 프로세스 풀 워커가 함께 사용)
+def analyze_row(idx, row: pd.Series, uid_cols: List[str], opinion_cols: List[str], quantitative_cols: List[str],
+                analysis_mode: str, framework: FrameworkVersion, analyzer: "AIRISSHybridAnalyzer" = None,
+                quantitative_plan: Optional[List[Dict[str, Any]]] = None) -> tuple:
+    """(상태, UID, 의견, 결과 레코드 또는 오류 메시지, 정량데이터 개수) 반환 - 상태는 ok/skipped/failed"""
+    analyzer = analyzer or hybrid_analyzer
+    uid = None
+    opinion = ""
+    data_count = 0
+    try:
+        # UID와 의견 추출
+        uid = str(row[uid_cols[0]]) if uid_cols else f"user_{idx}"
+        opinion = str(row[opinion_cols[0]]) if opinion_cols else ""
+        
+        # 빈 의견 처리
+        if not opinion or opinion.lower() in ['nan', 'null', '', 'none']:
+            # 정량데이터만 있는 경우도 처리 가능하도록 수정
+            if analysis_mode != "quantitative" and not quantitative_cols:
+                return "skipped", uid, opinion, None, 0
+            opinion = ""  # 빈 의견으로 설정
+        
+        # 🆕 분석 모드에 따른 처리
+        if analysis_mode == "text":
+            # 텍스트 분석만
+            analysis_result = analyzer.text_analyzer.calculate_overall_score({
+                dim: result["score"]
+                for dim, result in analyzer.text_analyzer.analyze_all(opinion, framework).items()
+            }, framework)
+            comprehensive_result = {
+                "text_analysis": analysis_result,
+                "quantitative_analysis": {"quantitative_score": 50, "confidence": 0},
+                "hybrid_analysis": analysis_result,
+                "analysis_metadata": {"analysis_version": "AIRISS v3.0 - Text Only"}
+            }
+        
+        elif analysis_mode == "quantitative":
+            # 정량 분석만
+            quant_data = analyzer.quantitative_analyzer.extract_quantitative_data(row, quantitative_plan)
+            quant_result = analyzer.quantitative_analyzer.calculate_quantitative_score(quant_data)
+            grade_info = analyzer.calculate_hybrid_grade(quant_result["quantitative_score"])
+            
+            comprehensive_result = {
+                "text_analysis": {"overall_score": 50, "grade": "OK C"},
+                "quantitative_analysis": quant_result,
+                "hybrid_analysis": {
+                    "overall_score": quant_result["quantitative_score"],
+                    "grade": grade_info["grade"],
+                    "grade_description": grade_info["grade_description"],
+                    "confidence": quant_result["confidence"]
+                },
+                "analysis_metadata": {"analysis_version": "AIRISS v3.0 - Quantitative Only"}
+            }
+        
+        else:  # hybrid (기본값)
+            # 하이브리드 통합 분석
+            comprehensive_result = analyzer.comprehensive_analysis(uid, opinion, row, framework, quantitative_plan)
+        
+        # 정량데이터 사용 여부 체크용 (레코드 생성이 실패해도 집계에 반영)
+        data_count = comprehensive_result["quantitative_analysis"]["data_count"]
+        
+        # 결과 레코드 생성 (v3.0 형식)
+        result_record = {
+            "UID": uid,
+            "원본의견": opinion[:500] + "..." if len(opinion) > 500 else opinion,
+            
+            # 🆕 하이브리드 통합 점수 (메인)
+            "AIRISS_v2_종합점수": comprehensive_result["hybrid_analysis"]["overall_score"],
+            "OK등급": comprehensive_result["hybrid_analysis"]["grade"],
+            "등급설명": comprehensive_result["hybrid_analysis"]["grade_description"],
+            "백분위": comprehensive_result["hybrid_analysis"]["percentile"],
+            "분석신뢰도": comprehensive_result["hybrid_analysis"]["confidence"],
+            
+            # 텍스트 분석 결과 (기존 유지)
+            "텍스트_종합점수": comprehensive_result["text_analysis"]["overall_score"],
+            "텍스트_등급": comprehensive_result["text_analysis"]["grade"],
+            
+            # 정량 분석 결과 (신규)
+            "정량_종합점수": comprehensive_result["quantitative_analysis"]["quantitative_score"],
+            "정량_신뢰도": comprehensive_result["quantitative_analysis"]["confidence"],
+            "정량_데이터품질": comprehensive_result["quantitative_analysis"]["data_quality"],
+            "정량_데이터개수": comprehensive_result["quantitative_analysis"]["data_count"],
+            
+            # 분석 구성 정보
+            "분석모드": analysis_mode,
+            "텍스트_가중치": comprehensive_result["hybrid_analysis"].get("analysis_composition", {}).get("text_weight", "N/A"),
+            "정량_가중치": comprehensive_result["hybrid_analysis"].get("analysis_composition", {}).get("quantitative_weight", "N/A")
+        }
+        
+        # 8대 영역별 텍스트 점수 추가 (기존 유지)
+        if "dimension_scores" in comprehensive_result["text_analysis"]:
+            for dimension, score in comprehensive_result["text_analysis"]["dimension_scores"].items():
+                result_record[f"{dimension}_텍스트점수"] = score
+                if "dimension_details" in comprehensive_result["text_analysis"]:
+                    details = comprehensive_result["text_analysis"]["dimension_details"].get(dimension, {})
+                    result_record[f"{dimension}_신뢰도"] = details.get("confidence", 0)
+                    result_record[f"{dimension}_긍정신호"] = details.get("signals", {}).get("positive", 0)
+                    result_record[f"{dimension}_부정신호"] = details.get("signals", {}).get("negative", 0)
+        
+        # 정량 데이터 세부 정보 추가 (신규)
+        if comprehensive_result["quantitative_analysis"]["contributing_factors"]:
+            for factor_name, factor_info in comprehensive_result["quantitative_analysis"]["contributing_factors"].items():
+                clean_name = factor_name.replace("grade_", "").replace("score_", "").replace("rate_", "").replace("count_", "")
+                result_record[f"정량_{clean_name}"] = factor_info["score"]
+                result_record[f"정량_{clean_name}_기여도"] = factor_info["contribution"]
+        
+        return "ok", uid, opinion, result_record, data_count
+    
+    except Exception as e:
+        return "failed", uid, opinion, str(e), data_count
+
+# 🆕 NEW: 행 묶음 채점 - 하이브리드 모드는 DataFrame 일괄 분석, 그 외는 행 단위 analyze_row
+def score_rows(df: pd.DataFrame, uid_cols: List[str], opinion_cols: List[str], quantitative_cols: List[str],
+               analysis_mode: str, framework: FrameworkVersion, analyzer: "AIRISSHybridAnalyzer" = None,
+               quantitative_plan: Optional[List[Dict[str, Any]]] = None) -> List[tuple]:
+    """analyze_row와 같은 (상태, UID, 의견, 결과 레코드, 정량데이터 개수) 목록을 행 순서대로 반환"""
+    analyzer = analyzer or hybrid_analyzer
+    if quantitative_plan is None:
+        quantitative_plan = analyzer.quantitative_analyzer.column_plan(df.columns)
+    
+    if analysis_mode == "hybrid" and quantitative_plan and uid_cols and opinion_cols and df.columns.is_unique:
+        try:
+            uids, opinions, rows = analyzer.prepare_batch_inputs(df, uid_cols, opinion_cols, quantitative_cols)
+            result_df = analyzer.comprehensive_analysis_batch(df, uid_cols, opinion_cols, quantitative_cols, framework, quantitative_plan)
+            
+            scored = [("skipped", uid, opinion, None, 0) for uid, opinion in zip(uids, opinions)]
+            for row, record in zip(rows, result_df.to_dict("records")):
+                scored[row] = ("ok", uids[row], opinions[row], record, record["정량_데이터개수"])
+            return scored
+        except Exception as e:
+            logger.warning(f"일괄 하이브리드 분석 실패, 행 단위 분석으로 전환: {e}")
+    
+    return [
+        analyze_row(idx, row, uid_cols, opinion_cols, quantitative_cols, analysis_mode, framework, analyzer, quantitative_plan)
+        for idx, row in df.iterrows()
+    ]
+
+# 🆕 NEW: 협력적 시간 분할 스케줄러 (고정 sleep 대신 시간 예산을 다 쓰면 이벤트 루프에 양보)
+class TimeSliceScheduler:
+    """분석 작업이 이벤트 루프를 budget초 이상 연속으로 점유하지 않도록 양보 시점과 청크 크기를 조절
+    
+    일괄 채점은 호출당 고정 비용이 있어 청크가 min_chunk보다 작아지지는 않는다.
+    """
+    
+    def __init__(self, budget: float = 0.01, min_chunk: int = 64, max_chunk: int = 8192):
+        self.budget = budget
+        self.chunk_size = min_chunk
+        self.min_chunk = min_chunk
+        self.max_chunk = max_chunk
+        self.slice_start = time.perf_counter()
+        self.yields = 0
+    
+    @classmethod
+    def from_env(cls) -> "TimeSliceScheduler":
+        return cls(budget=float(os.environ.get("AIRISS_TIME_SLICE_MS", 10)) / 1000)
+    
+    def record_chunk(self, rows: int, elapsed: float):
+        """직전 청크 처리 시간이 예산보다 많이 짧으면 청크를 키우고, 많이 길면 줄임"""
+        if rows < self.chunk_size:
+            return
+        if elapsed < self.budget / 2:
+            self.chunk_size = min(self.max_chunk, self.chunk_size * 2)
+        elif elapsed > self.budget * 2:
+            self.chunk_size = max(self.min_chunk, self.chunk_size // 2)
+    
+    async def checkpoint(self):
+        """현재 시간 조각의 예산을 다 썼으면 양보하고 새 조각 시작"""
+        if time.perf_counter() - self.slice_start >= self.budget:
+            await asyncio.sleep(0)
+            self.yields += 1
+            self.slice_start = time.perf_counter()
+
+async def iter_scored_rows(sample_df: pd.DataFrame, uid_cols: List[str], opinion_cols: List[str], quantitative_cols: List[str],
+                           analysis_mode: str, framework: FrameworkVersion, quantitative_plan: List[Dict[str, Any]],
+                           scheduler: TimeSliceScheduler):
+    """직렬 채점을 시간 예산에 맞춘 청크 단위로 진행하며 행 결과를 순서대로 내보냄"""
+    start = 0
+    while start < len(sample_df):
+        chunk = sample_df.iloc[start:start + scheduler.chunk_size]
+        started = time.perf_counter()
+        scored_rows = score_rows(chunk, uid_cols, opinion_cols, quantitative_cols, analysis_mode, framework,
+                                 quantitative_plan=quantitative_plan)
+        scheduler.record_chunk(len(chunk), time.perf_counter() - started)
+        start += len(chunk)
+        for scored in scored_rows:
+            yield scored
+        await scheduler.checkpoint()
+
+async def iter_pool_scored_rows(scored_rows: List[tuple]):
+    for scored in scored_rows:
+        yield scored
+
+# 🆕 NEW: 대용량 작업용 프로세스 풀 병렬 채점
+_worker_state = {}
+
+def resolve_analysis_workers(requested: Optional[int] = None) -> int:
+    """요청값 > 환경변수(AIRISS_ANALYSIS_WORKERS) > 1 순으로 채점 프로세스 수 결정, CPU 수로 제한
+    
+    0이면 프로세스 풀 없이 이벤트 루프 안에서 시간 분할로 채점한다.
+    """
+    workers = requested if requested is not None else int(os.environ.get("AIRISS_ANALYSIS_WORKERS", 1))
+    return max(0, min(workers, os.cpu_count() or 1))
+
+def _init_analysis_worker():
+    """프로세스 풀 워커 초기화 - 분석기를 워커당 한 번만 생성"""
+    logging.getLogger(__name__).setLevel(logging.WARNING)
+    _worker_state["analyzer"] = AIRISSHybridAnalyzer()
+    _worker_state["frameworks"] = {}
+
+def _worker_cache_stats() -> tuple:
+    """워커 프로세스의 키워드 캐시 현황 - 부모 프로세스의 /health와 작업 로그에서 합산"""
+    return os.getpid(), {"text": text_analysis_cache.stats(), "sentence": sentence_hit_cache.stats()}
+
+def _score_chunk(chunk: pd.DataFrame, uid_cols: List[str], opinion_cols: List[str], quantitative_cols: List[str],
+                 analysis_mode: str, framework_spec: tuple, quantitative_plan: Optional[List[Dict[str, Any]]] = None) -> tuple:
+    """워커에서 청크 단위 채점 - (채점 결과, 워커 캐시 현황)"""
+    scored = score_rows(chunk, uid_cols, opinion_cols, quantitative_cols, analysis_mode, _worker_framework(framework_spec),
+                        _worker_state["analyzer"], quantitative_plan)
+    return scored, _worker_cache_stats()
+
+def _worker_framework(framework_spec: tuple) -> FrameworkVersion:
+    """작업에 고정된 키워드 사전 버전은 워커당 한 번만 컴파일"""
+    framework_definition, version, source = framework_spec
+    frameworks = _worker_state["frameworks"]
+    if version not in frameworks:
+        frameworks.clear()
+        frameworks[version] = FrameworkVersion(framework_definition, version, source)
+    return frameworks[version]
+
+def _keyword_hit_chunk(opinions: List[str], framework_spec: tuple) -> tuple:
+    """워커에서 청크 단위 키워드 적중 행렬 계산 - (적중 행렬, 워커 캐시 현황)"""
+    hits = _worker_state["analyzer"].text_analyzer.hit_rows(
+        [str(opinion).lower() for opinion in opinions], _worker_framework(framework_spec)
+    )
+    return hits, _worker_cache_stats()
+
+class AnalysisWorkerPool:
+    """워커 수별 ProcessPoolExecutor를 작업 간에 재사용
+    
+    서버 프로세스는 이미 여러 스레드(키워드 사전 감시, I/O 스레드 풀)와 락을 쓰고 있어 fork하면 다른 스레드가
+    잡고 있던 락이 복사되어 워커가 멈출 수 있으므로 기본은 spawn (AIRISS_WORKER_START_METHOD로 forkserver 등 선택).
+    """
+    
+    def __init__(self, start_method: str = None):
+        self.start_method = start_method or os.environ.get("AIRISS_WORKER_START_METHOD", "spawn")
+        self._pools = {}
+        self._lock = threading.Lock()
+    
+    def get(self, workers: int) -> ProcessPoolExecutor:
+        with self._lock:
+            pool = self._pools.get(workers)
+            if pool is None:
+                pool = ProcessPoolExecutor(
+                    max_workers=workers, initializer=_init_analysis_worker,
+                    mp_context=multiprocessing.get_context(self.start_method)
+                )
+                self._pools[workers] = pool
+            return pool
+    
+    def discard(self, workers: int):
+        """워커가 비정상 종료된 풀은 버리고 다음 작업에서 새로 생성"""
+        with self._lock:
+            pool = self._pools.pop(workers, None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+            worker_cache_stats.clear()
+    
+    def shutdown(self):
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+        worker_cache_stats.clear()
+
+# 🆕 NEW: 이벤트 루프 밖 실행 관리 (pandas/openpyxl → 스레드 풀, 채점 → 프로세스 풀)
+class TaskExecutors:
+    """CPU/파일 작업을 이벤트 루프 밖에서 실행하는 async API"""
+    
+    def __init__(self, io_threads: int = 4):
+        self.io_threads = io_threads
+        self.process_pools = AnalysisWorkerPool()
+        self._io_pool = None
+        self._lock = threading.Lock()
+    
+    def io_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(max_workers=self.io_threads, thread_name_prefix="airiss-io")
+            return self._io_pool
+    
+    async def run_io(self, func, *args, **kwargs):
+        """pandas 변환, Excel 읽기/쓰기 등을 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.io_pool(), functools.partial(func, *args, **kwargs))
+    
+    async def run_cpu(self, workers: int, func, *args):
+        """채점 등 CPU 작업을 워커 수별 프로세스 풀에서 실행 (인자/결과는 pickle 가능해야 함)"""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.process_pools.get(workers), func, *args)
+        except BrokenProcessPool:
+            self.process_pools.discard(workers)
+            raise
+    
+    def shutdown(self):
+        self.process_pools.shutdown()
+        with self._lock:
+            io_pool, self._io_pool = self._io_pool, None
+        if io_pool is not None:
+            io_pool.shutdown(wait=False, cancel_futures=True)
+
+task_executors = TaskExecutors(int(os.environ.get("AIRISS_IO_THREADS", 4)))
+
+POOL_MAX_CHUNK_ROWS = int(os.environ.get("AIRISS_POOL_CHUNK_ROWS", 1000))
+
+async def score_rows_in_pool(sample_df: pd.DataFrame, uid_cols: List[str], opinion_cols: List[str], quantitative_cols: List[str],
+                             analysis_mode: str, framework: FrameworkVersion, workers: int,
+                             quantitative_plan: Optional[List[Dict[str, Any]]] = None) -> List[tuple]:
+    """sample_df를 청크로 나눠 프로세스 풀에서 채점하고 원래 행 순서대로 합침"""
+    # 워커당 여러 청크를 줘서 행 길이 편차로 인한 대기 시간을 줄임
+    # 결과 역직렬화는 GIL을 잡은 채 한 번에 일어나므로 청크 크기 상한으로 이벤트 루프 정지 시간을 제한
+    chunk_size = max(1, min(POOL_MAX_CHUNK_ROWS, -(-len(sample_df) // (workers * 4))))
+    framework_spec = (framework.framework, framework.version, framework.source)
+    
+    chunks = await asyncio.gather(*[
+        task_executors.run_cpu(workers, _score_chunk, sample_df.iloc[start:start + chunk_size],
+                               uid_cols, opinion_cols, quantitative_cols, analysis_mode, framework_spec, quantitative_plan)
+        for start in range(0, len(sample_df), chunk_size)
+    ])
+    for _, (pid, stats) in chunks:
+        worker_cache_stats.record(pid, stats)
+    return [scored for chunk, _ in chunks for scored in chunk]
+
+async def keyword_hit_matrix_in_pool(uids: List[str], opinions: List[str], framework: FrameworkVersion, workers: int) -> KeywordHitMatrix:
+    """작업 결과 의견의 키워드 적중 행렬을 프로세스 풀에서 청크 단위로 계산"""
+    if not opinions:
+        return hybrid_analyzer.text_analyzer.keyword_hit_matrix(uids, opinions, framework)
+    chunk_size = max(1, min(POOL_MAX_CHUNK_ROWS, -(-len(opinions) // (workers * 4))))
+    framework_spec = (framework.framework, framework.version, framework.source)
+    
+    chunks = await asyncio.gather(*[
+        task_executors.run_cpu(workers, _keyword_hit_chunk, opinions[start:start + chunk_size], framework_spec)
+        for start in range(0, len(opinions), chunk_size)
+    ])
+    for _, (pid, stats) in chunks:
+        worker_cache_stats.record(pid, stats)
+    return KeywordHitMatrix(uids, np.concatenate([hits for hits, _ in chunks]), framework.engine)
+
+# 🆕 NEW: 직원 AI 피드백을 결과 레코드에 기록 (단일/다중 직원 호출)
+def build_enhanced_opinion(result_record: Dict[str, Any], opinion: str) -> str:
+    """하이브리드 결과를 포함한 AI 분석용 상세 의견"""
+    return f"""
+                    평가 의견: {opinion}
+                    
+                    하이브리드 분석 결과:
+                    - 종합 점수: {result_record["AIRISS_v2_종합점수"]}점
+                    - OK 등급: {result_record["OK등급"]}
+                    - 텍스트 분석: {result_record["텍스트_종합점수"]}점
+                    - 정량 분석: {result_record["정량_종합점수"]}점
+                    - 분석 신뢰도: {result_record["분석신뢰도"]}%
+                    """
+
+# 🆕 NEW: 진행 중 작업의 직원별 실시간 AI 피드백 상태 (스트리밍 사용 시)
+class AILiveFeedback:
+    """(작업 ID, UID)별 실시간 AI 상태 목록 - 같은 UID 행이 여러 개면 결과 순서대로 각자 보관, 작업이 끝나면 삭제
+    
+    이벤트 루프에서만 접근하므로 잠금은 쓰지 않는다.
+    """
+    
+    def __init__(self):
+        self._jobs = {}
+    
+    def start_job(self, job_id: str):
+        self._jobs[job_id] = {}
+    
+    def finish_job(self, job_id: str):
+        self._jobs.pop(job_id, None)
+    
+    def is_live(self, job_id: str) -> bool:
+        return job_id in self._jobs
+    
+    def add(self, job_id: str, uid: str, result_record: Dict[str, Any]) -> Dict[str, Any]:
+        """레코드 1행의 대기 상태 항목을 만들어 반환 - 스트리밍/완료 시 이 항목을 직접 갱신"""
+        entry = {"status": "pending", "text": "", "record": result_record}
+        self._jobs[job_id].setdefault(str(uid), []).append(entry)
+        return entry
+    
+    def get(self, job_id: str, uid: str) -> Optional[List[Dict[str, Any]]]:
+        """UID의 항목 목록 (결과 순서), 진행 중인 스트리밍 작업이 아니면 None"""
+        entries = self._jobs.get(job_id)
+        return None if entries is None else entries.get(str(uid), [])
+
+ai_live_feedback = AILiveFeedback()
+
+def apply_ai_feedback(result_record: Dict[str, Any], ai_feedback: Dict[str, Any], model: str, max_tokens: int) -> Dict[str, Any]:
+    """AI 피드백 결과를 레코드의 AI_* 컬럼에 기록"""
+    result_record["AI_장점"] = ai_feedback["ai_strengths"]
+    result_record["AI_개선점"] = ai_feedback["ai_weaknesses"]
+    result_record["AI_종합피드백"] = ai_feedback["ai_feedback"]
+    result_record["AI_처리시간"] = ai_feedback["processing_time"]
+    result_record["AI_사용모델"] = ai_feedback.get("model_used", model)
+    result_record["AI_토큰수"] = ai_feedback.get("tokens_used", max_tokens)
+    result_record["AI_오류"] = ai_feedback.get("error", "")
+    return ai_feedback
+
+async def attach_ai_feedback(result_record: Dict[str, Any], uid: str, opinion: str, api_key: str, model: str, max_tokens: int,
+                             on_delta=None) -> Dict[str, Any]:
+    """하이브리드 결과를 포함한 상세 정보로 AI 피드백 생성 후 레코드에 기록, 생성 결과 반환 (on_delta: 스트리밍 부분 텍스트 콜백)"""
+    ai_feedback = await hybrid_analyzer.text_analyzer.generate_ai_feedback(
+        uid, build_enhanced_opinion(result_record, opinion), api_key, model, max_tokens, on_delta=on_delta
+    )
+    return apply_ai_feedback(result_record, ai_feedback, model, max_tokens)
+
+async def attach_ai_feedback_batch(entries: List[tuple], api_key: str, model: str, max_tokens: int) -> List[Dict[str, Any]]:
+    """여러 직원 (레코드, UID, 의견)의 AI 피드백을 한 번의 호출로 생성 후 각 레코드에 기록"""
+    ai_feedbacks = await hybrid_analyzer.text_analyzer.generate_ai_feedback_batch(
+        [(uid, build_enhanced_opinion(result_record, opinion)) for result_record, uid, opinion in entries], api_key, model, max_tokens
+    )
+    return [apply_ai_feedback(result_record, ai_feedback, model, max_tokens)
+            for (result_record, _, _), ai_feedback in zip(entries, ai_feedbacks)]
+
 # 🆕 NEW: v3.0 하이브리드 분석 처리 함수 (v2.0과 동일하지만 버전명 업데이트)
 async def process_analysis_v3(job_id: str):
     """AIRISS v3.0 하이브리드 백그라운드 분석 처리"""
@@ -3852,8 +5805,9 @@ async def process_analysis_v3(job_id: str):
         api_key = job_data.get("openai_api_key", None)
         model = job_data.get("openai_model", "gpt-3.5-turbo")
         max_tokens = job_data.get("max_tokens", 1200)
+        framework = job_data.get("framework") or framework_registry.current()
         
-        logger.info(f"AIRISS v3.0 분석 처리 시작: 샘플={sample_size}, 모드={analysis_mode}, AI={enable_ai}")
+        logger.info(f"AIRISS v3.0 분석 처리 시작: 샘플={sample_size}, 모드={analysis_mode}, AI={enable_ai}, 키워드 사전=v{framework.version}")
         
         # 샘플 데이터 선택
         if sample_size == "all" or sample_size >= len(df):
@@ -3865,6 +5819,15 @@ async def process_analysis_v3(job_id: str):
         uid_cols = file_data["uid_columns"]
         opinion_cols = file_data["opinion_columns"]
         quantitative_cols = file_data.get("quantitative_columns", [])
+        quantitative_plan = file_data.get("quantitative_plan")
+        if quantitative_plan is None:
+            quantitative_plan = hybrid_analyzer.quantitative_analyzer.column_plan(sample_df.columns)
+        if job_data.get("count_scoring") == "relative":
+            # 🆕 횟수/건수는 이번 작업 대상 직원 분포 기준 상대평가 (분포는 작업당 1회 계산)
+            quantitative_plan = await task_executors.run_io(
+                hybrid_analyzer.quantitative_analyzer.with_count_distributions, quantitative_plan, sample_df
+            )
+            logger.info(f"횟수/건수 상대평가 적용: {[(e['column'], e['distribution'].info()) for e in quantitative_plan if e.get('distribution')]}")
         
         if not uid_cols or not opinion_cols:
             store.update_job(job_id, {
@@ -3874,166 +5837,150 @@ async def process_analysis_v3(job_id: str):
             return
         
         results = []
+        result_opinions = []  # 키워드 적중 행렬용 전체 의견 (결과 레코드는 500자로 잘림)
         total_rows = len(sample_df)
         ai_success_count = 0
         ai_fail_count = 0
         quantitative_data_count = 0
         
-        for idx, row in sample_df.iterrows():
+        def update_progress(current_processed: int):
+            progress = (current_processed + job_data["failed"]) / total_rows * 100
+            store.update_job(job_id, {
+                "processed": current_processed,
+                "progress": min(progress, 100)
+            })
+        
+        # 🆕 AI 피드백 동시 호출 수 제한 (분당 요청/토큰 예산은 generate_ai_feedback의 토큰 버킷이 담당)
+        ai_concurrency = job_data.get("ai_concurrency") or resolve_ai_concurrency()
+        ai_semaphore = asyncio.Semaphore(ai_concurrency)
+        ai_tasks = []
+        ai_done = {"success": 0, "fail": 0, "cache_hit": 0}
+        
+        ai_batch_size = job_data.get("ai_batch_size") or resolve_ai_batch_size()
+        if enable_ai and api_key:
+            fitted = fit_ai_batch_size(ai_batch_size, model, max_tokens)
+            if fitted < ai_batch_size:
+                logger.info(f"호출당 직원 수 {ai_batch_size} → {fitted} (모델 {model} 응답 상한 {model_output_token_limit(model)}토큰 / 직원당 {max_tokens})")
+                ai_batch_size = fitted
+        ai_batch = []
+        ai_batch_live = []
+        
+        # 🆕 스트리밍 사용 시 직원별 실시간 AI 상태(대기/수신 중/완료)를 공개 - 검색 대시보드가 진행 중에 조회, 작업이 끝나면 삭제
+        ai_live = bool(enable_ai and api_key and job_data.get("ai_stream"))
+        if ai_live:
+            ai_live_feedback.start_job(job_id)
+            store.update_job(job_id, {"results": results})
+        
+        def stream_to(live_entry: Optional[Dict[str, Any]]):
+            if live_entry is None:
+                return None
+            def on_delta(text: str):
+                # 빈 텍스트는 재시도 시작 - 이전 시도의 부분 응답을 지우고 대기 상태로
+                live_entry.update({"status": "streaming" if text else "pending", "text": text})
+            return on_delta
+        
+        async def run_ai_feedback(entries: List[tuple], live_entries: List[Optional[Dict[str, Any]]]):
+            """(레코드, UID, 의견) 묶음의 AI 피드백 생성 - 1명이면 단일 호출(스트리밍 가능), 여러 명이면 다중 직원 호출"""
+            async with ai_semaphore:
+                try:
+                    if len(entries) == 1:
+                        ai_feedbacks = [await attach_ai_feedback(*entries[0], api_key, model, max_tokens, on_delta=stream_to(live_entries[0]))]
+                    else:
+                        ai_feedbacks = await attach_ai_feedback_batch(entries, api_key, model, max_tokens)
+                except Exception as e:
+                    logger.error(f"AI 피드백 처리 오류 - UID {[uid for _, uid, _ in entries]}: {e}")
+                    for result_record, _, _ in entries:
+                        result_record["AI_오류"] = str(e)
+                    ai_feedbacks = [{"error": str(e)}] * len(entries)
+            for live_entry, ai_feedback in zip(live_entries, ai_feedbacks):
+                if live_entry is not None:
+                    live_entry.update({"status": "error" if ai_feedback.get("error") else "done", "text": ""})
+                # 캐시 적중도 성공으로 집계하고 적중 수는 따로 기록
+                if ai_feedback.get("cache_hit"):
+                    ai_done["cache_hit"] += 1
+                ai_done["fail" if ai_feedback.get("error") else "success"] += 1
+            update_progress(ai_done["success"] + ai_done["fail"])
+        
+        # 🆕 키워드/정량 채점 단계 - 프로세스 풀(이벤트 루프 밖) 또는 루프 안 시간 분할 처리
+        scheduler = TimeSliceScheduler.from_env()
+        workers = resolve_analysis_workers(job_data.get("workers"))
+        scored_rows = None
+        if workers > 0 and total_rows > 0:
+            logger.info(f"프로세스 풀 채점 시작: 워커 {workers}개, {total_rows}행")
             try:
-                # UID와 의견 추출
-                uid = str(row[uid_cols[0]]) if uid_cols else f"user_{idx}"
-                opinion = str(row[opinion_cols[0]]) if opinion_cols else ""
-                
-                # 빈 의견 처리
-                if not opinion or opinion.lower() in ['nan', 'null', '', 'none']:
-                    # 정량데이터만 있는 경우도 처리 가능하도록 수정
-                    if analysis_mode != "quantitative" and not quantitative_cols:
+                scored_rows = iter_pool_scored_rows(await score_rows_in_pool(
+                    sample_df, uid_cols, opinion_cols, quantitative_cols, analysis_mode, framework, workers, quantitative_plan
+                ))
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"프로세스 풀 채점 실패, 이벤트 루프 안에서 채점: {e}")
+        if scored_rows is None:
+            scored_rows = iter_scored_rows(
+                sample_df, uid_cols, opinion_cols, quantitative_cols, analysis_mode, framework, quantitative_plan, scheduler
+            )
+        
+        # 🆕 채점 중 오류로 작업이 실패하면 진행 중인 AI 호출을 취소 (버려진 작업에 API 예산을 쓰지 않도록)
+        try:
+            async for status, uid, opinion, payload, data_count in scored_rows:
+                # 시간 예산(기본 10ms)을 다 쓴 경우에만 이벤트 루프에 양보
+                await scheduler.checkpoint()
+                try:
+                    # 빈 의견 처리 (정량데이터도 없는 경우)
+                    if status == "skipped":
                         store.update_job(job_id, {"failed": job_data["failed"] + 1})
                         continue
-                    opinion = ""  # 빈 의견으로 설정
-                
-                # 🆕 분석 모드에 따른 처리
-                if analysis_mode == "text":
-                    # 텍스트 분석만
-                    analysis_result = hybrid_analyzer.text_analyzer.calculate_overall_score({
-                        dim: hybrid_analyzer.text_analyzer.analyze_text(opinion, dim)["score"] 
-                        for dim in AIRISS_FRAMEWORK.keys()
-                    })
-                    comprehensive_result = {
-                        "text_analysis": analysis_result,
-                        "quantitative_analysis": {"quantitative_score": 50, "confidence": 0},
-                        "hybrid_analysis": analysis_result,
-                        "analysis_metadata": {"analysis_version": "AIRISS v3.0 - Text Only"}
-                    }
-                
-                elif analysis_mode == "quantitative":
-                    # 정량 분석만
-                    quant_data = hybrid_analyzer.quantitative_analyzer.extract_quantitative_data(row)
-                    quant_result = hybrid_analyzer.quantitative_analyzer.calculate_quantitative_score(quant_data)
-                    grade_info = hybrid_analyzer.calculate_hybrid_grade(quant_result["quantitative_score"])
-                    
-                    comprehensive_result = {
-                        "text_analysis": {"overall_score": 50, "grade": "OK C"},
-                        "quantitative_analysis": quant_result,
-                        "hybrid_analysis": {
-                            "overall_score": quant_result["quantitative_score"],
-                            "grade": grade_info["grade"],
-                            "grade_description": grade_info["grade_description"],
-                            "confidence": quant_result["confidence"]
-                        },
-                        "analysis_metadata": {"analysis_version": "AIRISS v3.0 - Quantitative Only"}
-                    }
-                
-                else:  # hybrid (기본값)
-                    # 하이브리드 통합 분석
-                    comprehensive_result = hybrid_analyzer.comprehensive_analysis(uid, opinion, row)
                 
-                # 정량데이터 사용 여부 체크
-                if comprehensive_result["quantitative_analysis"]["data_count"] > 0:
-                    quantitative_data_count += 1
-                
-                # 결과 레코드 생성 (v3.0 형식)
-                result_record = {
-                    "UID": uid,
-                    "원본의견": opinion[:500] + "..." if len(opinion) > 500 else opinion,
-                    
-                    # 🆕 하이브리드 통합 점수 (메인)
-                    "AIRISS_v2_종합점수": comprehensive_result["hybrid_analysis"]["overall_score"],
-                    "OK등급": comprehensive_result["hybrid_analysis"]["grade"],
-                    "등급설명": comprehensive_result["hybrid_analysis"]["grade_description"],
-                    "백분위": comprehensive_result["hybrid_analysis"]["percentile"],
-                    "분석신뢰도": comprehensive_result["hybrid_analysis"]["confidence"],
-                    
-                    # 텍스트 분석 결과 (기존 유지)
-                    "텍스트_종합점수": comprehensive_result["text_analysis"]["overall_score"],
-                    "텍스트_등급": comprehensive_result["text_analysis"]["grade"],
-                    
-                    # 정량 분석 결과 (신규)
-                    "정량_종합점수": comprehensive_result["quantitative_analysis"]["quantitative_score"],
-                    "정량_신뢰도": comprehensive_result["quantitative_analysis"]["confidence"],
-                    "정량_데이터품질": comprehensive_result["quantitative_analysis"]["data_quality"],
-                    "정량_데이터개수": comprehensive_result["quantitative_analysis"]["data_count"],
-                    
-                    # 분석 구성 정보
-                    "분석모드": analysis_mode,
-                    "텍스트_가중치": comprehensive_result["hybrid_analysis"].get("analysis_composition", {}).get("text_weight", "N/A"),
-                    "정량_가중치": comprehensive_result["hybrid_analysis"].get("analysis_composition", {}).get("quantitative_weight", "N/A")
-                }
+                    # 정량데이터 사용 여부 체크
+                    if data_count > 0:
+                        quantitative_data_count += 1
                 
-                # 8대 영역별 텍스트 점수 추가 (기존 유지)
-                if "dimension_scores" in comprehensive_result["text_analysis"]:
-                    for dimension, score in comprehensive_result["text_analysis"]["dimension_scores"].items():
-                        result_record[f"{dimension}_텍스트점수"] = score
-                        if "dimension_details" in comprehensive_result["text_analysis"]:
-                            details = comprehensive_result["text_analysis"]["dimension_details"].get(dimension, {})
-                            result_record[f"{dimension}_신뢰도"] = details.get("confidence", 0)
-                            result_record[f"{dimension}_긍정신호"] = details.get("signals", {}).get("positive", 0)
-                            result_record[f"{dimension}_부정신호"] = details.get("signals", {}).get("negative", 0)
+                    if status == "failed":
+                        raise RuntimeError(payload)
                 
-                # 정량 데이터 세부 정보 추가 (신규)
-                if comprehensive_result["quantitative_analysis"]["contributing_factors"]:
-                    for factor_name, factor_info in comprehensive_result["quantitative_analysis"]["contributing_factors"].items():
-                        clean_name = factor_name.replace("grade_", "").replace("score_", "").replace("rate_", "").replace("count_", "")
-                        result_record[f"정량_{clean_name}"] = factor_info["score"]
-                        result_record[f"정량_{clean_name}_기여도"] = factor_info["contribution"]
+                    result_record = payload
                 
-                # AI 피드백 생성 (활성화된 경우)
-                if enable_ai and api_key:
-                    # 하이브리드 결과를 포함한 상세 정보로 AI 피드백 생성
-                    enhanced_opinion = f"""
-                    평가 의견: {opinion}
-                    
-                    하이브리드 분석 결과:
-                    - 종합 점수: {comprehensive_result["hybrid_analysis"]["overall_score"]}점
-                    - OK 등급: {comprehensive_result["hybrid_analysis"]["grade"]}
-                    - 텍스트 분석: {comprehensive_result["text_analysis"]["overall_score"]}점
-                    - 정량 분석: {comprehensive_result["quantitative_analysis"]["quantitative_score"]}점
-                    - 분석 신뢰도: {comprehensive_result["hybrid_analysis"]["confidence"]}%
-                    """
-                    
-                    ai_feedback = await hybrid_analyzer.text_analyzer.generate_ai_feedback(uid, enhanced_opinion, api_key, model, max_tokens)
-                    result_record["AI_장점"] = ai_feedback["ai_strengths"]
-                    result_record["AI_개선점"] = ai_feedback["ai_weaknesses"]
-                    result_record["AI_종합피드백"] = ai_feedback["ai_feedback"]
-                    result_record["AI_처리시간"] = ai_feedback["processing_time"]
-                    result_record["AI_사용모델"] = ai_feedback.get("model_used", model)
-                    result_record["AI_토큰수"] = ai_feedback.get("tokens_used", max_tokens)
-                    result_record["AI_오류"] = ai_feedback.get("error", "")
-                    
-                    if ai_feedback.get("error"):
-                        ai_fail_count += 1
+                    # AI 피드백 생성 (활성화된 경우) - 채점은 계속 진행하고 동시 호출 수 제한 하에 병렬 생성
+                    if enable_ai and api_key:
+                        ai_batch.append((result_record, uid, opinion))
+                        ai_batch_live.append(ai_live_feedback.add(job_id, uid, result_record) if ai_live else None)
+                        if len(ai_batch) >= ai_batch_size:
+                            ai_tasks.append(asyncio.create_task(run_ai_feedback(ai_batch, ai_batch_live)))
+                            ai_batch, ai_batch_live = [], []
                     else:
-                        ai_success_count += 1
-                else:
-                    result_record["AI_장점"] = "AI 피드백이 비활성화되어 있습니다." if not enable_ai else "API 키가 제공되지 않았습니다."
-                    result_record["AI_개선점"] = "AI 피드백이 비활성화되어 있습니다." if not enable_ai else "API 키가 제공되지 않았습니다."
-                    result_record["AI_종합피드백"] = "하이브리드 키워드+정량 분석만 수행되었습니다."
-                
-                result_record["분석시간"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                result_record["분석시스템"] = "AIRISS v3.0 - OK금융그룹 완전통합 대시보드 시스템"
+                        result_record["AI_장점"] = "AI 피드백이 비활성화되어 있습니다." if not enable_ai else "API 키가 제공되지 않았습니다."
+                        result_record["AI_개선점"] = "AI 피드백이 비활성화되어 있습니다." if not enable_ai else "API 키가 제공되지 않았습니다."
+                        result_record["AI_종합피드백"] = "하이브리드 키워드+정량 분석만 수행되었습니다."
                 
-                results.append(result_record)
+                    result_record["분석시간"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    result_record["분석시스템"] = "AIRISS v3.0 - OK금융그룹 완전통합 대시보드 시스템"
                 
-                # 진행률 업데이트
-                current_processed = len(results)
-                progress = (current_processed + job_data["failed"]) / total_rows * 100
-                store.update_job(job_id, {
-                    "processed": current_processed,
-                    "progress": min(progress, 100)
-                })
+                    results.append(result_record)
+                    result_opinions.append(opinion)
                 
-                # 속도 조절
-                if enable_ai and api_key:
-                    await asyncio.sleep(1)
-                else:
-                    await asyncio.sleep(0.1)
+                    # 진행률 업데이트 (AI 사용 시에는 피드백 완료 시점에 갱신)
+                    if not (enable_ai and api_key):
+                        update_progress(len(results))
                 
-            except Exception as e:
-                logger.error(f"개별 하이브리드 분석 오류 - UID {uid}: {e}")
-                current_failed = job_data["failed"] + 1
-                store.update_job(job_id, {"failed": current_failed})
-                continue
+                except Exception as e:
+                    logger.error(f"개별 하이브리드 분석 오류 - UID {uid}: {e}")
+                    current_failed = job_data["failed"] + 1
+                    store.update_job(job_id, {"failed": current_failed})
+                    continue
+        
+            if ai_batch:
+                ai_tasks.append(asyncio.create_task(run_ai_feedback(ai_batch, ai_batch_live)))
+            if ai_tasks:
+                await asyncio.gather(*ai_tasks)
+                ai_success_count = ai_done["success"]
+                ai_fail_count = ai_done["fail"]
+                limiter = ai_rate_limiters.get(api_key.strip(), model)
+                logger.info(f"AI 피드백 완료: 성공 {ai_success_count} (캐시 {ai_done['cache_hit']}), 실패 {ai_fail_count}, 동시 호출 {ai_concurrency}, 호출당 직원 {ai_batch_size}, 예산 대기 누적 {limiter.waited:.1f}초, 클라이언트 {openai_clients.stats()}, 캐시 {llm_response_cache.stats()}")
+        finally:
+            pending = [task for task in ai_tasks if not task.done()]
+            if pending:
+                logger.warning(f"작업 중단 - 진행 중인 AI 피드백 {len(pending)}건 취소")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
         
         # 결과 저장
         end_time = datetime.now()
@@ -4052,22 +5999,39 @@ async def process_analysis_v3(job_id: str):
             "total_quantitative_columns": len(quantitative_cols)
         }
         
+        # 🆕 직원 × 키워드 적중 행렬 (키워드 통계용, 의견/문장 캐시를 재사용하므로 재스캔 거의 없음)
+        keyword_hits = None
+        if results and analysis_mode != "quantitative":
+            result_uids = [r["UID"] for r in results]
+            if workers > 0:
+                try:
+                    keyword_hits = await keyword_hit_matrix_in_pool(result_uids, result_opinions, framework, workers)
+                except (BrokenProcessPool, OSError) as e:
+                    logger.warning(f"프로세스 풀 키워드 집계 실패, 스레드에서 집계: {e}")
+            if keyword_hits is None:
+                keyword_hits = await task_executors.run_io(
+                    hybrid_analyzer.text_analyzer.keyword_hit_matrix, result_uids, result_opinions, framework
+                )
+        
         store.update_job(job_id, {
             "results": results,
+            "keyword_hits": keyword_hits,
             "status": "completed",
             "end_time": end_time,
             "processing_time": f"{processing_time.seconds}초",
             "average_score": round(avg_score, 1),
             "ai_success_count": ai_success_count,
             "ai_fail_count": ai_fail_count,
+            "ai_cache_hit_count": ai_done["cache_hit"],
             "hybrid_analysis_info": hybrid_stats  # 🆕 추가
         })
         
         # Excel 파일 생성 (v3.0)
         if results:
-            await create_excel_report_v3(job_id, results, enable_ai, analysis_mode, hybrid_stats)
+            await create_excel_report_v3(job_id, results, enable_ai, analysis_mode, hybrid_stats, framework)
         
-        logger.info(f"AIRISS v3.0 분석 완료: {job_id}, 성공: {len(results)}, 실패: {job_data['failed']}")
+        logger.info(f"AIRISS v3.0 분석 완료: {job_id}, 성공: {len(results)}, 실패: {job_data['failed']}, 이벤트 루프 양보: {scheduler.yields}회")
+        logger.info(f"키워드 분석 캐시 현황 (메인+워커): 의견 {worker_cache_stats.combined('text', text_analysis_cache.stats())}, 문장 {worker_cache_stats.combined('sentence', sentence_hit_cache.stats())}")
         
     except Exception as e:
         logger.error(f"AIRISS v3.0 분석 처리 오류: {e}")
@@ -4075,11 +6039,23 @@ async def process_analysis_v3(job_id: str):
             "status": "failed",
             "error": str(e)
         })
+    finally:
+        # 🆕 완료/실패 후에는 저장된 결과 레코드가 최종본이므로 실시간 상태 삭제
+        ai_live_feedback.finish_job(job_id)
 
 # 🆕 NEW: v3.0 Excel 보고서 생성 함수 (v2.0과 거의 동일)
-async def create_excel_report_v3(job_id: str, results: List[Dict], enable_ai: bool = False, analysis_mode: str = "hybrid", hybrid_stats: Dict = {}):
-    """AIRISS v3.0 Excel 보고서 생성"""
+async def create_excel_report_v3(job_id: str, results: List[Dict], enable_ai: bool = False, analysis_mode: str = "hybrid", hybrid_stats: Dict = {}, framework: Optional[FrameworkVersion] = None):
+    """AIRISS v3.0 Excel 보고서 생성 - openpyxl 작업은 스레드 풀에서 실행
+    
+    작업은 이미 completed 상태라 조회 요청과 동시에 실행될 수 있으므로 레코드 사본으로 작성
+    """
+    snapshot = [dict(record) for record in results]
+    await task_executors.run_io(write_excel_report_v3, job_id, snapshot, enable_ai, analysis_mode, hybrid_stats, framework)
+
+def write_excel_report_v3(job_id: str, results: List[Dict], enable_ai: bool = False, analysis_mode: str = "hybrid", hybrid_stats: Dict = {}, framework: Optional[FrameworkVersion] = None):
+    """AIRISS v3.0 Excel 보고서 파일 작성 (동기)"""
     try:
+        framework_definition = (framework or framework_registry.current()).framework
         os.makedirs('results', exist_ok=True)
         
         # 결과 데이터프레임 생성
@@ -4139,7 +6115,7 @@ async def create_excel_report_v3(job_id: str, results: List[Dict], enable_ai: bo
             })
         
         # 8대 영역별 평균 점수 (텍스트 기준)
-        for dimension in AIRISS_FRAMEWORK.keys():
+        for dimension in framework_definition.keys():
             col_name = f"{dimension}_텍스트점수"
             if col_name in df_results.columns:
                 avg_score = round(df_results[col_name].mean(), 1)
@@ -4166,8 +6142,8 @@ async def create_excel_report_v3(job_id: str, results: List[Dict], enable_ai: bo
             
             # 8대 영역별 상세 시트 (텍스트 분석 기준)
             dimension_analysis = []
-            for dimension in AIRISS_FRAMEWORK.keys():
-                dimension_info = AIRISS_FRAMEWORK[dimension]
+            for dimension in framework_definition.keys():
+                dimension_info = framework_definition[dimension]
                 col_name = f"{dimension}_텍스트점수"
                 
                 if col_name in df_results.columns:
@@ -4234,6 +6210,30 @@ async def create_excel_report_v3(job_id: str, results: List[Dict], enable_ai: bo
     except Exception as e:
         logger.error(f"AIRISS v3.0 Excel 보고서 생성 오류: {e}")
 
+# 🆕 NEW: 키워드 사전 버전 조회/즉시 리로드
+@app.on_event("startup")
+async def start_framework_watcher():
+    """키워드 사전 파일 변경 감시 시작 (재시작 없이 반영)"""
+    framework_registry.start_watching()
+
+@app.on_event("shutdown")
+async def shutdown_analysis_workers():
+    """채점 프로세스 풀 / 파일 작업 스레드 풀 / OpenAI 연결 풀 정리"""
+    task_executors.shutdown()
+    await openai_clients.aclose()
+    llm_response_cache.close()
+
+@app.get("/api/framework")
+async def get_framework_info():
+    """현재 적용 중인 키워드 사전 버전 정보"""
+    return framework_registry.current().info()
+
+@app.post("/api/framework/reload")
+async def reload_framework():
+    """키워드 사전 파일 즉시 다시 읽기 - 컴파일은 스레드에서 수행해 채점을 멈추지 않음"""
+    reloaded = await asyncio.to_thread(framework_registry.reload, True)
+    return {"reloaded": reloaded, **framework_registry.current().info()}
+
 # 기존 상태 확인, 다운로드 엔드포인트는 그대로 유지
 @app.get("/status/{job_id}")
 async def get_analysis_status(job_id: str):
@@ -4265,7 +6265,9 @@ async def get_analysis_status(job_id: str):
         "error": job_data.get("error", ""),
         "ai_success_count": job_data.get("ai_success_count", 0),
         "ai_fail_count": job_data.get("ai_fail_count", 0),
+        "ai_cache_hit_count": job_data.get("ai_cache_hit_count", 0),
         "version": job_data.get("version", "3.0"),  # 🆕 추가
+        "framework_version": job_data["framework"].version if job_data.get("framework") else None,
         "hybrid_analysis_info": job_data.get("hybrid_analysis_info", {})  # 🆕 추가
     }
 
@@ -4305,6 +6307,9 @@ async def health_check():
         "name": "AIRISS v3.0",
         "branding": "OK금융그룹 완전통합 대시보드 시스템",
         "timestamp": datetime.now().isoformat(),
+        # 🆕 채점은 기본적으로 워커 프로세스에서 하므로 워커가 보고한 캐시까지 합산
+        "text_analysis_cache": worker_cache_stats.combined("text", text_analysis_cache.stats()),
+        "sentence_hit_cache": worker_cache_stats.combined("sentence", sentence_hit_cache.stats()),
         "features": {
             "ok_branding_complete": True,
             "ok_fonts": True,
@@ -4377,6 +6382,9 @@ if __name__ == "__main__":
     print(f"📊 API 문서: {render_url}/docs")
     print(f"❤️  시스템 상태: {render_url}/health")
     print("🤖 OpenAI 모듈:", "설치됨" if hybrid_analyzer.text_analyzer.openai_available else "미설치")
+    ai_endpoint = openai_clients.base_url or os.environ.get("OPENAI_BASE_URL")
+    if ai_endpoint:
+        print(f"🔗 AI 엔드포인트: {ai_endpoint}")
     print("🎨 OK체 폰트 경로: /static/fonts/")
     print("🔬 지원 분석 모드: 텍스트 | 정량 | 하이브리드")
     print("📊 지원 등급 형식: S/A/B/C/D, 우수/양호/보통, 1-5점, 0-100점, 백분율")
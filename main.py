@@ -6,6 +6,7 @@ from datetime import datetime
 import os
 import re
 from dotenv import load_dotenv
+from ai_client import openai_clients, llm_response_cache, ai_resilience, client_endpoint
 
 # 환경 변수 로드
 load_dotenv()
@@ -100,41 +101,56 @@ def analyze_and_regenerate_feedback():
 **중요: 반드시 마지막 문장을 완전히 끝내고, 최소 500자 이상 작성하세요.**
 """
 
-    # 5. API 호출 함수 (최적화)
+    # 5. API 호출 함수 (최적화) - 대시보드와 같은 API 키별 재사용 클라이언트 (keep-alive 연결 유지)
+    # AIRISS_AI_BASE_URL을 지정하면 해당 OpenAI 호환 서버(예: 로컬 ai_stub_server.py)로 호출
+    client = openai_clients.get_sync(api_key)
+    if client_endpoint(client):
+        print(f"🔗 API 엔드포인트: {client_endpoint(client)}")
+    
     def generate_complete_feedback(opinion, uid, max_retries=3):
         """완전한 피드백 생성 - 재시도 및 검증 포함"""
+        messages = [
+            {"role": "system", "content": "당신은 전문적인 HR 분석가입니다. 항상 완전하고 구체적인 피드백을 제공합니다."},
+            {"role": "user", "content": create_optimized_prompt(opinion, uid)}
+        ]
+        
+        # 이전 실행에서 품질 검증을 통과한 응답이 캐시에 있으면 재사용
+        cache_key = llm_response_cache.make_key("gpt-4-turbo", messages, 1500, 0.7, endpoint=client_endpoint(client))
+        cached = llm_response_cache.get(cache_key)
+        if cached is not None:
+            print(f"   💾 캐시 사용: {len(cached[0])}자")
+            return cached[0]
         
         for attempt in range(max_retries):
             try:
                 print(f"   🤖 UID {uid} 분석 시도 {attempt + 1}/{max_retries}")
                 
-                response = openai.chat.completions.create(
+                # 429/5xx/타임아웃은 공용 호출 계층이 지수 백오프(Retry-After 우선)로 재시도
+                response = ai_resilience.call_sync(api_key, lambda: client.chat.completions.create(
                     model="gpt-4-turbo",  # 최신 모델 사용
-                    messages=[
-                        {"role": "system", "content": "당신은 전문적인 HR 분석가입니다. 항상 완전하고 구체적인 피드백을 제공합니다."},
-                        {"role": "user", "content": create_optimized_prompt(opinion, uid)}
-                    ],
+                    messages=messages,
                     max_tokens=1500,  # 충분한 토큰 할당
                     temperature=0.7,
                     top_p=0.9,
                     frequency_penalty=0.0,
                     presence_penalty=0.0
-                )
+                ))
                 
                 feedback = response.choices[0].message.content.strip()
                 
                 # 응답 품질 검증
                 if len(feedback) >= 400 and feedback.endswith(('.', '다', '요', '니다', '습니다')):
                     print(f"   ✅ 성공: {len(feedback)}자 생성")
+                    usage = getattr(response, 'usage', None)
+                    llm_response_cache.put(cache_key, "gpt-4-turbo", feedback, usage.total_tokens if usage else 0)
                     return feedback
                 else:
                     print(f"   ⚠️ 품질 미달: {len(feedback)}자, 재시도...")
-                    time.sleep(2)
                     
             except Exception as e:
                 print(f"   ❌ API 오류: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(5)  # 오류 시 대기
+                # 재시도 후에도 실패했거나 키/한도 오류(서킷 열림 포함)면 이 직원은 포기
+                break
                     
         print(f"   🔴 실패: UID {uid}")
         return None
@@ -166,9 +182,6 @@ def analyze_and_regenerate_feedback():
                 'improvement': len(new_feedback) - (len(str(row['AI_피드백'])) if pd.notna(row['AI_피드백']) else 0)
             })
         
-        # API 제한 준수
-        time.sleep(2)
-        
         # 진행상황 출력
         if (len(results)) % 10 == 0:
             elapsed = time.time() - start_time
@@ -250,6 +263,8 @@ if __name__ == "__main__":
         print("   openai.api_key = 'sk-...'")
     else:
         result_file = analyze_and_regenerate_feedback()
+        openai_clients.close()
+        llm_response_cache.close()
         if result_file:
             print(f"\n✅ 성공! 파일: {result_file}")
         else:
@@ -0,0 +1,10 @@
+# AIRISS 테스트 공통 설정 - 저장소 루트의 단일 파일 모듈(airiss_v3_dashboard, ai_client)을 import 경로에 추가
+# 파일명: tests/conftest.py
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 테스트가 작업 디렉터리에 AI 응답 캐시 파일을 만들지 않도록 비활성화
+os.environ.setdefault("AIRISS_AI_CACHE_PATH", "")
@@ -0,0 +1,171 @@
+# 다중 직원 AI 호출 테스트 - 배치 JSON 응답 파싱, 누락/오류 시 단일 호출 보완, 평가 의견 압축 한도
+# 파일명: tests/test_ai_batch.py
+
+import asyncio
+import json
+
+import pytest
+
+import airiss_v3_dashboard as airiss
+
+SECTIONS = {"strengths": "1. 책임감", "weaknesses": "1. 공유 부족", "feedback": "데이터 관리 체계화 권장"}
+
+
+def batch_item(uid, **overrides):
+    item = {"uid": uid, **SECTIONS}
+    item.update(overrides)
+    return item
+
+
+@pytest.fixture
+def analyzer():
+    return airiss.AIRISSAnalyzer()
+
+
+# ---- parse_ai_batch_response ----
+
+def test_parse_plain_array(analyzer):
+    parsed = analyzer.parse_ai_batch_response(json.dumps([batch_item("A1"), batch_item("A2")], ensure_ascii=False))
+    assert parsed == {"A1": ("1. 책임감", "1. 공유 부족", "데이터 관리 체계화 권장"),
+                      "A2": ("1. 책임감", "1. 공유 부족", "데이터 관리 체계화 권장")}
+
+
+def test_parse_array_wrapped_in_prose_and_code_fence(analyzer):
+    response = "분석 결과입니다.\n```json\n" + json.dumps([batch_item(" A1 ")], ensure_ascii=False) + "\n```\n감사합니다."
+    assert list(analyzer.parse_ai_batch_response(response)) == ["A1"]
+
+
+def test_parse_numeric_uid_and_list_sections(analyzer):
+    parsed = analyzer.parse_ai_batch_response(json.dumps([batch_item(1005099, strengths=["1. 책임감", "2. 소통"])]))
+    assert parsed["1005099"][0] == "1. 책임감\n2. 소통"
+
+
+@pytest.mark.parametrize("response", [
+    "",
+    "JSON을 만들 수 없습니다",
+    '[{"uid": "A1", "strengths": "장점", ',            # 출력 한도로 잘린 응답
+    '[{"uid": "A1", "strengths": "장점"}] 추가 [설명]',  # 배열 뒤에 대괄호가 또 있음
+    '{"uid": "A1", "strengths": "장점", "weaknesses": "개선", "feedback": "피드백"}',
+    "]잘못된 순서[",
+])
+def test_parse_malformed_returns_empty(analyzer, response):
+    assert analyzer.parse_ai_batch_response(response) == {}
+
+
+def test_parse_skips_incomplete_items(analyzer):
+    items = [
+        batch_item("ok"),
+        batch_item("no_feedback", feedback=""),
+        {k: v for k, v in batch_item("missing_weaknesses").items() if k != "weaknesses"},
+        batch_item(""),
+        batch_item(None),
+        "문자열 항목",
+        [1, 2],
+    ]
+    assert list(analyzer.parse_ai_batch_response(json.dumps(items, ensure_ascii=False))) == ["ok"]
+
+
+def test_parse_truncates_long_sections(analyzer):
+    parsed = analyzer.parse_ai_batch_response(json.dumps([batch_item("A1", feedback="가" * 1500)], ensure_ascii=False))
+    assert parsed["A1"][2] == "가" * 1000 + "..."
+
+
+# ---- generate_ai_feedback_batch 단일 호출 보완 ----
+
+def run_batch(analyzer, monkeypatch, employees, batch_reply):
+    """배치 호출은 batch_reply(텍스트 또는 예외)를 돌려주고, 단일 호출은 호출된 UID만 기록"""
+    batch_calls = []
+    single_calls = []
+
+    async def complete_chat(api_key, model, messages, max_tokens, temperature=0.7, cacheable=None, on_delta=None):
+        batch_calls.append(messages[-1]["content"])
+        if isinstance(batch_reply, Exception):
+            raise batch_reply
+        return batch_reply, 300, False
+
+    async def generate_ai_feedback(uid, opinion, api_key=None, model="gpt-3.5-turbo", max_tokens=1200, on_delta=None):
+        single_calls.append(uid)
+        return {"ai_strengths": "단일", "ai_weaknesses": "단일", "ai_feedback": f"단일 {uid}", "error": None}
+
+    monkeypatch.setattr(analyzer, "openai_available", True)
+    monkeypatch.setattr(analyzer, "complete_chat", complete_chat)
+    monkeypatch.setattr(analyzer, "generate_ai_feedback", generate_ai_feedback)
+    feedbacks = asyncio.run(analyzer.generate_ai_feedback_batch(employees, "sk-test", "gpt-3.5-turbo", 800))
+    return feedbacks, batch_calls, single_calls
+
+
+EMPLOYEES = [("A1", "성실하고 책임감 있음."), ("A2", "데이터 공유가 부족함."), ("A3", "목표달성 우수.")]
+
+
+def test_batch_reply_fills_every_employee(analyzer, monkeypatch):
+    reply = json.dumps([batch_item("A3"), batch_item("A1"), batch_item("A2")], ensure_ascii=False)
+    feedbacks, batch_calls, single_calls = run_batch(analyzer, monkeypatch, EMPLOYEES, reply)
+    assert len(batch_calls) == 1 and single_calls == []
+    assert [feedback["ai_feedback"] for feedback in feedbacks] == ["데이터 관리 체계화 권장"] * 3
+    assert all(feedback["batch_size"] == 3 and feedback["tokens_used"] == 100 for feedback in feedbacks)
+
+
+def test_missing_employee_falls_back_to_single_call(analyzer, monkeypatch):
+    reply = json.dumps([batch_item("A1"), batch_item("A3", weaknesses="")], ensure_ascii=False)
+    feedbacks, _, single_calls = run_batch(analyzer, monkeypatch, EMPLOYEES, reply)
+    assert single_calls == ["A2", "A3"]
+    assert [feedback["ai_feedback"] for feedback in feedbacks] == ["데이터 관리 체계화 권장", "단일 A2", "단일 A3"]
+
+
+@pytest.mark.parametrize("batch_reply", ['[{"uid": "A1", "strengths": ', "죄송합니다", RuntimeError("batch failed")])
+def test_malformed_or_failed_batch_falls_back_for_all(analyzer, monkeypatch, batch_reply):
+    feedbacks, batch_calls, single_calls = run_batch(analyzer, monkeypatch, EMPLOYEES, batch_reply)
+    assert len(batch_calls) == 1
+    assert single_calls == ["A1", "A2", "A3"]
+    assert [feedback["ai_feedback"] for feedback in feedbacks] == ["단일 A1", "단일 A2", "단일 A3"]
+
+
+def test_duplicate_uids_in_batch_use_single_calls(analyzer, monkeypatch):
+    employees = [("A1", "첫 번째 행"), ("A1", "두 번째 행"), ("A2", "다른 직원")]
+    reply = json.dumps([batch_item("A1"), batch_item("A2")], ensure_ascii=False)
+    feedbacks, _, single_calls = run_batch(analyzer, monkeypatch, employees, reply)
+    assert single_calls == ["A1", "A1"]
+    assert feedbacks[2]["ai_feedback"] == "데이터 관리 체계화 권장"
+
+
+def test_single_employee_skips_batch_prompt(analyzer, monkeypatch):
+    _, batch_calls, single_calls = run_batch(analyzer, monkeypatch, EMPLOYEES[:1], "[]")
+    assert batch_calls == [] and single_calls == ["A1"]
+
+
+# ---- compact_opinion ----
+
+def test_compact_opinion_removes_repeated_sentences():
+    text = "평가 의견: 책임감 있게 수행함. 책임감 있게  수행함 \n소통이 원활함! 책임감 있게 수행함."
+    assert airiss.compact_opinion(text, 1000) == "평가 의견: 책임감 있게 수행함. 소통이 원활함!"
+
+
+def test_compact_opinion_respects_budget():
+    sentences = [f"{i}번째 문장은 업무 성과와 협업 태도에 대한 서로 다른 관찰 내용입니다." for i in range(200)]
+    for budget in (50, 120, 300, 1000):
+        compacted = airiss.compact_opinion(" ".join(sentences), budget)
+        assert airiss.estimate_tokens(compacted) <= budget
+        assert compacted.startswith("0번째 문장")
+    # 예산보다 긴 문장은 남은 예산만큼 잘라 말줄임표로 표시
+    truncated = airiss.compact_opinion("가" * 300 + ".", 50)
+    assert truncated.endswith("…") and airiss.estimate_tokens(truncated) <= 50
+
+
+def test_compact_opinion_drops_tiny_remainder_instead_of_truncating():
+    # 첫 문장 이후 남은 예산이 20토큰 미만이면 다음 문장은 잘라 넣지 않음
+    first = "가" * 40 + "."
+    second = "나" * 40 + "."
+    assert airiss.compact_opinion(first + " " + second, 55) == first
+
+
+def test_compact_opinion_keeps_hybrid_summary_regardless_of_budget():
+    summary = f"{airiss.OPINION_SUMMARY_MARKER}\n - 종합점수: 81.2점\n\n - 정량 데이터 품질: 높음"
+    compacted = airiss.compact_opinion("평가 의견: " + "매우 성실함. " * 3 + "가" * 5000 + "\n\n" + summary, 60)
+    head, _, tail = compacted.partition("\n\n")
+    assert head.startswith("평가 의견: 매우 성실함.")
+    assert tail == f"{airiss.OPINION_SUMMARY_MARKER}\n- 종합점수: 81.2점\n- 정량 데이터 품질: 높음"
+
+
+def test_compact_opinion_handles_empty_and_non_string():
+    assert airiss.compact_opinion("", 100) == ""
+    assert airiss.compact_opinion(float("nan"), 100) == "nan"
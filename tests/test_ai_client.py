@@ -0,0 +1,174 @@
+# ai_client 재시도 / 서킷 브레이커 테스트
+# 파일명: tests/test_ai_client.py
+
+import asyncio
+
+import httpx
+import openai
+import pytest
+
+from ai_client import CircuitOpenError, ResilientCaller, classify_ai_error
+
+
+def api_error(cls, status, headers=None, body=None):
+    request = httpx.Request("POST", "http://stub/v1/chat/completions")
+    return cls("error", response=httpx.Response(status, headers=headers or {}, request=request), body=body)
+
+
+def rate_limited():
+    return api_error(openai.RateLimitError, 429, headers={"retry-after": "0.01"})
+
+
+def caller(**kwargs):
+    options = dict(max_attempts=6, base_delay=0.001, max_delay=0.01, reset_timeout=0.2)
+    options.update(kwargs)
+    return ResilientCaller(**options)
+
+
+def test_classify_ai_error():
+    assert classify_ai_error(rate_limited()) == "retryable"
+    assert classify_ai_error(api_error(openai.InternalServerError, 500)) == "retryable"
+    assert classify_ai_error(asyncio.TimeoutError()) == "retryable"
+    assert classify_ai_error(api_error(openai.AuthenticationError, 401)) == "fatal"
+    assert classify_ai_error(api_error(openai.PermissionDeniedError, 403)) == "fatal"
+    assert classify_ai_error(api_error(openai.RateLimitError, 429, body={"code": "insufficient_quota"})) == "fatal"
+    assert classify_ai_error(api_error(openai.BadRequestError, 400)) == "failed"
+    assert classify_ai_error(ValueError("bug")) == "failed"
+
+
+def test_concurrent_429_burst_does_not_open_breaker():
+    """동시 호출 다수가 429를 연달아 받아도 서킷은 닫힌 채 각자 백오프 후 모두 성공"""
+    resilient = caller()
+    sent = {"count": 0}
+
+    def employee_call(failures_before_success):
+        remaining = {"failures": failures_before_success}
+
+        async def call():
+            sent["count"] += 1
+            await asyncio.sleep(0)
+            if remaining["failures"]:
+                remaining["failures"] -= 1
+                raise rate_limited()
+            return "ok"
+        return call
+
+    async def run():
+        return await asyncio.gather(*[
+            resilient.call_async("sk-burst", employee_call(i % 4)) for i in range(40)
+        ])
+
+    results = asyncio.run(run())
+    assert results == ["ok"] * 40
+    assert sent["count"] == sum(i % 4 for i in range(40)) + 40
+    assert resilient.breaker("sk-burst").state == "closed"
+
+
+def test_429_exhausting_attempts_fails_only_that_call():
+    resilient = caller(max_attempts=3)
+
+    async def always_limited():
+        raise rate_limited()
+
+    async def ok():
+        return "ok"
+
+    async def run():
+        with pytest.raises(openai.RateLimitError):
+            await resilient.call_async("sk-limit", always_limited)
+        return await resilient.call_async("sk-limit", ok)
+
+    assert asyncio.run(run()) == "ok"
+
+
+def test_fatal_key_error_opens_breaker_and_recovers_after_probe():
+    resilient = caller()
+    sent = {"count": 0}
+
+    async def bad_key():
+        sent["count"] += 1
+        raise api_error(openai.AuthenticationError, 401)
+
+    async def ok():
+        sent["count"] += 1
+        return "ok"
+
+    async def run():
+        with pytest.raises(openai.AuthenticationError):
+            await resilient.call_async("sk-bad", bad_key)
+        assert sent["count"] == 1  # 키 오류는 재시도하지 않음
+        # 열린 동안에는 보내지 않고 바로 실패
+        with pytest.raises(CircuitOpenError):
+            await resilient.call_async("sk-bad", ok)
+        assert sent["count"] == 1
+        # 다른 키는 영향 없음
+        assert await resilient.call_async("sk-other", ok) == "ok"
+        await asyncio.sleep(0.25)
+        assert resilient.breaker("sk-bad").state == "half_open"
+        assert await resilient.call_async("sk-bad", ok) == "ok"
+        assert resilient.breaker("sk-bad").state == "closed"
+
+    asyncio.run(run())
+
+
+def test_bad_request_does_not_open_breaker():
+    resilient = caller()
+
+    async def bad_request():
+        raise api_error(openai.BadRequestError, 400)
+
+    async def ok():
+        return "ok"
+
+    async def run():
+        with pytest.raises(openai.BadRequestError):
+            await resilient.call_async("sk-400", bad_request)
+        return await resilient.call_async("sk-400", ok)
+
+    assert asyncio.run(run()) == "ok"
+    assert resilient.breaker("sk-400").state == "closed"
+
+
+def test_cancelled_half_open_trial_releases_slot():
+    resilient = caller()
+
+    async def bad_key():
+        raise api_error(openai.AuthenticationError, 401)
+
+    async def ok():
+        return "ok"
+
+    async def run():
+        with pytest.raises(openai.AuthenticationError):
+            await resilient.call_async("sk-cancel", bad_key)
+        await asyncio.sleep(0.25)
+        trial = asyncio.create_task(resilient.call_async("sk-cancel", lambda: asyncio.sleep(10)))
+        await asyncio.sleep(0.01)
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+        return await resilient.call_async("sk-cancel", ok)
+
+    assert asyncio.run(run()) == "ok"
+
+
+def test_call_sync_fatal_and_retry():
+    resilient = caller()
+    attempts = {"count": 0}
+
+    def flaky():
+        attempts["count"] += 1
+        if attempts["count"] < 3:
+            raise rate_limited()
+        return "ok"
+
+    assert resilient.call_sync("sk-sync", flaky) == "ok"
+    assert attempts["count"] == 3
+
+    def bad_key():
+        raise api_error(openai.AuthenticationError, 401)
+
+    with pytest.raises(openai.AuthenticationError):
+        resilient.call_sync("sk-sync-bad", bad_key)
+    with pytest.raises(CircuitOpenError):
+        resilient.call_sync("sk-sync-bad", lambda: "ok")
@@ -0,0 +1,69 @@
+# 실시간 AI 피드백 상태 테스트 - (작업 ID, UID)별 보관, 중복 UID 행 구분, 작업 종료 후 정리
+# 파일명: tests/test_ai_live.py
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import airiss_v3_dashboard as airiss
+
+
+def test_duplicate_uids_keep_separate_entries():
+    live = airiss.AILiveFeedback()
+    live.start_job("job-a")
+    live.start_job("job-b")
+    first = live.add("job-a", "1001", {"row": 0})
+    second = live.add("job-a", 1001, {"row": 1})
+    other_job = live.add("job-b", "1001", {"row": 0})
+
+    first.update({"status": "streaming", "text": "[장점] 성실"})
+    second.update({"status": "done"})
+    assert [entry["status"] for entry in live.get("job-a", "1001")] == ["streaming", "done"]
+    assert [entry["record"]["row"] for entry in live.get("job-a", "1001")] == [0, 1]
+    assert live.get("job-b", "1001") == [other_job] and other_job["status"] == "pending"
+    assert live.get("job-a", "9999") == []
+
+    live.finish_job("job-a")
+    assert not live.is_live("job-a") and live.get("job-a", "1001") is None
+    assert live.is_live("job-b")
+
+
+@pytest.fixture
+def streaming_job(monkeypatch):
+    job_id = "job-live"
+    records = [
+        {"UID": "1001", "AI_장점": "첫 행 장점", "AI_개선점": "첫 행 개선점", "AI_종합피드백": "첫 행 피드백"},
+        {"UID": "1001", "AI_장점": "둘째 행 장점", "AI_개선점": "둘째 행 개선점", "AI_종합피드백": "둘째 행 피드백"},
+    ]
+    airiss.store.jobs[job_id] = {"status": "processing", "results": records, "ai_stream": True,
+                                 "enable_ai_feedback": True, "openai_api_key": "sk-test"}
+    airiss.ai_live_feedback.start_job(job_id)
+    yield job_id, records
+    airiss.ai_live_feedback.finish_job(job_id)
+    airiss.store.jobs.pop(job_id, None)
+
+
+def test_ai_stream_endpoint_serves_each_duplicate_row(streaming_job):
+    job_id, records = streaming_job
+    first = airiss.ai_live_feedback.add(job_id, "1001", records[0])
+    airiss.ai_live_feedback.add(job_id, "1001", records[1])["status"] = "done"
+    first.update({"status": "streaming", "text": "[장점] 진행 중"})
+
+    streaming = asyncio.run(airiss.get_ai_stream(job_id, "1001"))
+    assert (streaming["status"], streaming["ai_strengths"], streaming["occurrences"]) == ("streaming", "진행 중", 2)
+    done = asyncio.run(airiss.get_ai_stream(job_id, "1001", occurrence=1))
+    assert (done["status"], done["ai_feedback"]) == ("done", "둘째 행 피드백")
+    with pytest.raises(HTTPException):
+        asyncio.run(airiss.get_ai_stream(job_id, "1001", occurrence=2))
+
+
+def test_ai_stream_endpoint_reads_results_after_job_finishes(streaming_job):
+    job_id, _ = streaming_job
+    airiss.store.jobs[job_id]["status"] = "completed"
+    airiss.ai_live_feedback.finish_job(job_id)
+
+    final = asyncio.run(airiss.get_ai_stream(job_id, "1001", occurrence=1))
+    assert (final["status"], final["ai_strengths"], final["occurrences"]) == ("done", "둘째 행 장점", 2)
+    with pytest.raises(HTTPException):
+        asyncio.run(airiss.get_ai_stream(job_id, "2002"))
@@ -0,0 +1,103 @@
+# 분당 요청/토큰 예산(토큰 버킷) 테스트 - 여러 이벤트 루프에서 공유, 실패한 시도의 예약분 정산
+# 파일명: tests/test_rate_limiter.py
+
+import asyncio
+import threading
+
+import httpx
+import openai
+import pytest
+
+import airiss_v3_dashboard as airiss
+
+
+def contended_acquires(limiter, count=4, tokens=10):
+    """같은 루프에서 동시에 예약해 대기열 잠금을 실제로 경합시킴"""
+    async def run():
+        return await asyncio.gather(*[limiter.acquire(tokens) for _ in range(count)])
+    return asyncio.run(run())
+
+
+def test_shared_limiter_across_sequential_event_loops():
+    # RPM 1200 = 0.05초마다 1건 - 버킷이 비어 두 번째 루프에서도 대기가 생김
+    limiter = airiss.TokenBucketLimiter(rpm=1200, tpm=0)
+    limiter.requests = 0
+    assert contended_acquires(limiter) == [10] * 4
+    assert contended_acquires(limiter) == [10] * 4
+    assert limiter.waited > 0
+
+
+def test_shared_limiter_across_threads():
+    limiter = airiss.TokenBucketLimiter(rpm=6000, tpm=60000)
+    errors = []
+
+    def worker():
+        try:
+            contended_acquires(limiter, count=20, tokens=100)
+        except Exception as e:  # pragma: no cover - 실패 시 원인 보고용
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    # 80건 x 100토큰 예약 - 버킷은 절대 한도를 넘겨 음수가 되지 않음
+    assert limiter.tokens >= -1e-6
+
+
+class FakeCompletions:
+    def __init__(self, error=None, chunks=()):
+        self.error = error
+        self.chunks = chunks
+
+    async def create(self, stream=False, **kwargs):
+        if not stream:
+            raise self.error
+        return self.stream()
+
+    async def stream(self):
+        for content in self.chunks:
+            yield type("Chunk", (), {"choices": [type("Choice", (), {"delta": type("Delta", (), {"content": content})})], "usage": None})
+        raise self.error
+
+
+class FakeClient:
+    def __init__(self, completions):
+        self.chat = type("Chat", (), {"completions": completions})
+        self.base_url = "http://stub/v1/"
+
+
+def bad_request():
+    request = httpx.Request("POST", "http://stub/v1/chat/completions")
+    return openai.BadRequestError("error", response=httpx.Response(400, request=request), body=None)
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    limiter = airiss.TokenBucketLimiter(rpm=0, tpm=6000)
+    monkeypatch.setattr(airiss.ai_rate_limiters, "get", lambda api_key, model: limiter)
+    return limiter
+
+
+def test_failed_attempt_refunds_reservation(monkeypatch, limiter):
+    monkeypatch.setattr(airiss.openai_clients, "get_async", lambda api_key: FakeClient(FakeCompletions(bad_request())))
+    analyzer = airiss.AIRISSAnalyzer()
+    messages = [{"role": "user", "content": "환불 테스트"}]
+    with pytest.raises(openai.BadRequestError):
+        asyncio.run(analyzer.complete_chat("sk-refund", "gpt-3.5-turbo", messages, 800))
+    assert limiter.tokens == pytest.approx(6000, abs=10)
+
+
+def test_interrupted_stream_charges_only_received_tokens(monkeypatch, limiter):
+    completions = FakeCompletions(bad_request(), chunks=["가" * 30, "나" * 20])
+    monkeypatch.setattr(airiss.openai_clients, "get_async", lambda api_key: FakeClient(completions))
+    analyzer = airiss.AIRISSAnalyzer()
+    messages = [{"role": "user", "content": "스트리밍 테스트"}]
+    received = []
+    with pytest.raises(openai.BadRequestError):
+        asyncio.run(analyzer.complete_chat("sk-stream", "gpt-3.5-turbo", messages, 800, on_delta=received.append))
+    assert received[-1] == "가" * 30 + "나" * 20
+    charged = airiss.estimate_tokens(messages[0]["content"]) + airiss.estimate_tokens(received[-1])
+    assert limiter.tokens == pytest.approx(6000 - charged, abs=10)
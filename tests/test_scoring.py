@@ -0,0 +1,122 @@
+# 채점 최적화 회귀 테스트 - 단일 패스 키워드 엔진 / 등급 기준표 / 일괄 하이브리드 분석이 기존 방식과 같은 결과를 내는지 확인
+# 파일명: tests/test_scoring.py
+
+import math
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import airiss_v3_dashboard as airiss
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 정량 컬럼 값 - 정상 값, 단위가 붙은 값, 범위 밖 값, 해석 불가 값, 빈 값 섞음
+GRADES = ["S", "A+", "A", "B", "C", "보통", "Z?", "3", np.nan]
+KPI_SCORES = ["85", 7, 0.7, "90점", np.nan, "점수없음", 4.5, 100]
+ACHIEVEMENT_RATES = [0.8, 110, "95%", 50, np.nan, "abc"]
+TRAINING_COUNTS = ["3회", 12, 0, "5건", "x", np.nan, 1]
+
+
+@pytest.fixture(scope="module")
+def framework():
+    return airiss.FrameworkVersion(airiss.AIRISS_FRAMEWORK, version=0, source="test")
+
+
+@pytest.fixture(scope="module")
+def fixture_frame():
+    """실제 평가 의견 + 정량 컬럼 fixture (빈 의견, 중복 의견 행 포함)"""
+    opinions = pd.read_csv(os.path.join(REPO_ROOT, "test_100_fixed.csv"))
+    df = opinions.head(40).copy()
+    df.loc[5, "의견"] = np.nan
+    df.loc[6, "의견"] = "none"
+    df.loc[7, "의견"] = df.loc[8, "의견"]
+    df.loc[9, "의견"] = "성과가 우수하고 목표달성. 다만 지연! 보완\n필요"
+    positions = range(len(df))
+    df["성과등급"] = [GRADES[i % len(GRADES)] for i in positions]
+    df["KPI점수"] = [KPI_SCORES[i % len(KPI_SCORES)] for i in positions]
+    df["목표달성률"] = [ACHIEVEMENT_RATES[i % len(ACHIEVEMENT_RATES)] for i in positions]
+    df["교육횟수"] = [TRAINING_COUNTS[i % len(TRAINING_COUNTS)] for i in positions]
+    return df
+
+
+def loop_matches(text_lower, framework_dict):
+    """기존 방식 - 영역/키워드마다 `word in text_lower` 부분 매칭"""
+    return {
+        dimension: {
+            polarity: [word for word in info["keywords"][polarity] if word in text_lower]
+            for polarity in ("positive", "negative")
+        }
+        for dimension, info in framework_dict.items()
+    }
+
+
+def if_chain_grade(score):
+    """기존 방식 - 점수 하한을 위에서부터 차례로 비교하는 if/elif 체인"""
+    for cutoff, grade, description, percentile in airiss.OK_GRADE_THRESHOLDS:
+        if cutoff is None or score >= cutoff:
+            return grade, description, percentile
+
+
+def test_automaton_matches_per_keyword_loop(framework, fixture_frame):
+    analyzer = airiss.AIRISSAnalyzer()
+    texts = [str(opinion).lower() for opinion in fixture_frame["의견"]]
+    # 접두사 키워드("성과"/"성과가"), 문장 경계, 대소문자 경계 사례 추가
+    texts += ["성과가 있었다", "성과", "목표달성과 초과달성", "우수!우수?품질", "", "kpi 달성"]
+    for text_lower in texts:
+        expected = loop_matches(text_lower, airiss.AIRISS_FRAMEWORK)
+        assert framework.engine.match(framework.engine.scan(text_lower)) == expected
+        # 문장 단위 캐시를 거친 결과도 같아야 함 (두 번째 조회는 캐시 적중)
+        assert framework.engine.match(analyzer.find_keywords(text_lower, framework)) == expected
+        assert framework.engine.match(analyzer.find_keywords(text_lower, framework)) == expected
+
+
+def test_grade_table_matches_if_chain():
+    scores = [-5, 0, 10, 59.9, 59.99999, 60, 60.0001, 69.9, 70, 74.95, 75, 79.9, 80, 84.9, 85,
+              89.99, 90, 94.9, 95, 99.9, 100, 120, float("nan"), float("inf"), float("-inf")]
+    for score in scores:
+        expected = if_chain_grade(score)
+        info = airiss.OK_GRADE_TABLE.lookup(score)
+        assert (info["grade"], info["grade_description"], info["percentile"]) == expected, score
+
+    assigned = airiss.OK_GRADE_TABLE.assign(np.array(scores), airiss.HYBRID_GRADE_SUFFIX)
+    for position, score in enumerate(scores):
+        grade, description, percentile = if_chain_grade(score)
+        assert assigned["grade"][position] == grade
+        assert assigned["grade_description"][position] == description + airiss.HYBRID_GRADE_SUFFIX
+        assert assigned["percentile"][position] == percentile
+
+
+def test_batch_analysis_matches_per_row(framework, fixture_frame):
+    analyzer = airiss.AIRISSHybridAnalyzer()
+    uid_cols, opinion_cols = ["UID"], ["의견"]
+    quantitative_cols = ["성과등급", "KPI점수", "목표달성률", "교육횟수"]
+    plan = analyzer.quantitative_analyzer.column_plan(fixture_frame.columns)
+
+    batch = analyzer.comprehensive_analysis_batch(fixture_frame, uid_cols, opinion_cols, quantitative_cols, framework, plan)
+    per_row = [
+        airiss.analyze_row(idx, row, uid_cols, opinion_cols, quantitative_cols, "hybrid", framework, analyzer, plan)
+        for idx, row in fixture_frame.iterrows()
+    ]
+
+    assert list(batch.index) == [position for position, scored in enumerate(per_row) if scored[0] == "ok"]
+    for position, record in zip(batch.index, batch.to_dict("records")):
+        status, uid, opinion, expected, _ = per_row[position]
+        assert status == "ok"
+        assert list(record) == list(expected)
+        for column, value in expected.items():
+            actual = record[column]
+            if isinstance(value, float) and math.isnan(value):
+                assert math.isnan(actual), column
+            else:
+                assert actual == value, (uid, column, actual, value)
+
+
+def test_score_rows_uses_batch_and_keeps_row_order(framework, fixture_frame):
+    analyzer = airiss.AIRISSHybridAnalyzer()
+    args = (fixture_frame, ["UID"], ["의견"], ["성과등급", "KPI점수", "목표달성률", "교육횟수"])
+    batched = airiss.score_rows(*args, "hybrid", framework, analyzer)
+    per_row = [airiss.analyze_row(idx, row, *args[1:], "hybrid", framework, analyzer) for idx, row in fixture_frame.iterrows()]
+    assert [scored[:3] for scored in batched] == [scored[:3] for scored in per_row]
+    assert [scored[4] for scored in batched] == [scored[4] for scored in per_row]